@@ -0,0 +1,38 @@
+"""Conditional GET helpers (weak ETags / If-None-Match)."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+
+
+def weak_etag(*parts: Any) -> str:
+    """Build a weak ETag from values that change whenever the representation does."""
+
+    digest = hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Return True when the client's If-None-Match matches ``etag`` (weak comparison)."""
+
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    expected = _opaque(etag)
+    return any(_opaque(candidate) == expected for candidate in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """Return an empty 304 response carrying the current ETag."""
+
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from collections.abc import AsyncGenerator
 
+from typing import Any
+
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from .core.config import settings
@@ -24,3 +27,20 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
 
 	async with async_session_factory() as session:
 		yield session
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+	"""Return the session factory for work outliving the request scope (e.g. streamed responses)."""
+
+	return async_session_factory
+
+
+def dialect_insert(session: AsyncSession, table: Any) -> Any:
+	"""Return an INSERT for ``table`` supporting ``on_conflict_do_*`` on the session's dialect."""
+
+	name = session.bind.dialect.name
+	if name == "postgresql":
+		return postgresql.insert(table)
+	if name == "sqlite":
+		return sqlite.insert(table)
+	raise NotImplementedError(f"ON CONFLICT inserts are not supported on {name}")
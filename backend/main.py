@@ -11,10 +11,23 @@ from __future__ import annotations
 
 import os
 import json
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .routes import admin_users, admin_stats, admin_logs, admin_notifications, admin_roles, admin_support, admin_database, auth, books, documents, user_self, categories, comments
+from .database import engine
+from .services import invalidation
+from .routes import admin_users, admin_stats, admin_logs, admin_notifications, admin_roles, admin_support, admin_database, auth, books, documents, user_self, categories, comments, tags, authors, home
+
+
+@asynccontextmanager
+async def _lifespan(application: FastAPI):
+    # Cross-worker cache invalidation (LISTEN/NOTIFY on Postgres, local otherwise)
+    await invalidation.start(engine)
+    try:
+        yield
+    finally:
+        await invalidation.stop()
 
 
 def create_app() -> FastAPI:
@@ -24,7 +37,7 @@ def create_app() -> FastAPI:
     Returns:
         Configured FastAPI application instance
     """
-    application = FastAPI(title="Bibliotheque API", version="0.1.0")
+    application = FastAPI(title="Bibliotheque API", version="0.1.0", lifespan=_lifespan)
 
     # CORS configuration
     # 1) Try reading Render env CORS_ALLOW_ORIGINS as JSON (e.g., ["http://...","..."])
@@ -78,6 +91,8 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Pagination cursors and ETags travel in response headers; browsers hide them unless exposed
+        expose_headers=["X-Next-Cursor", "X-Total-Count", "X-Total-Count-Exact", "ETag"],
     )
 
     # Expose allowed origins for diagnostics routes
@@ -94,6 +109,9 @@ def create_app() -> FastAPI:
     application.include_router(admin_support.router)
     application.include_router(admin_database.router)
     application.include_router(categories.router)
+    application.include_router(tags.router)
+    application.include_router(authors.router)
+    application.include_router(home.router)
     application.include_router(comments.router)
     application.include_router(user_self.router)
 
@@ -0,0 +1,67 @@
+"""add authors projection with book counts
+
+Revision ID: a5b6c7d8e9f0
+Revises: f4a5b6c7d8e9
+Create Date: 2026-10-16 17:00:00
+
+"""
+from __future__ import annotations
+
+import unicodedata
+import uuid
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a5b6c7d8e9f0"
+down_revision: Union[str, Sequence[str], None] = "f4a5b6c7d8e9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _sort_key(name: str) -> str:
+    # Same rule as services.authors.author_sort_key, frozen for this migration
+    decomposed = unicodedata.normalize("NFKD", name.strip().lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def upgrade() -> None:
+    """Upgrade schema: create authors, backfill it from books and index it for lookups."""
+    authors = op.create_table(
+        "authors",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("normalized", sa.String(length=255), nullable=False),
+        sa.Column("sort_key", sa.String(length=255), nullable=False),
+        sa.Column("book_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_authors")),
+        sa.UniqueConstraint("normalized", name=op.f("uq_authors_normalized")),
+    )
+    op.create_index("ix_authors_sort_key_id", "authors", ["sort_key", "id"], unique=False)
+
+    bind = op.get_bind()
+    rows: dict[str, dict] = {}
+    for name, count in bind.execute(sa.text("SELECT author, count(*) FROM books GROUP BY author ORDER BY author")):
+        row = rows.setdefault(
+            name.lower(),
+            {"id": uuid.uuid4(), "name": name, "normalized": name.lower(), "sort_key": _sort_key(name), "book_count": 0},
+        )
+        row["book_count"] += count
+    if rows:
+        op.bulk_insert(authors, list(rows.values()))
+
+    if bind.dialect.name == "postgresql":
+        # Substring and prefix matches on GET /authors (LIKE '%q%' / 'q%')
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute("CREATE INDEX ix_authors_sort_key_trgm ON authors USING GIN (sort_key gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop authors."""
+    op.execute("DROP INDEX IF EXISTS ix_authors_sort_key_trgm")
+    op.drop_index("ix_authors_sort_key_id", table_name="authors")
+    op.drop_table("authors")
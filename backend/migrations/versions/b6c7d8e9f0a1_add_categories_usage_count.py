@@ -0,0 +1,39 @@
+"""add denormalized usage_count to categories
+
+Revision ID: b6c7d8e9f0a1
+Revises: a5b6c7d8e9f0
+Create Date: 2026-10-16 19:00:00
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b6c7d8e9f0a1"
+down_revision: Union[str, Sequence[str], None] = "a5b6c7d8e9f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: add categories.usage_count and backfill it from books."""
+    op.add_column(
+        "categories",
+        sa.Column("usage_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+    )
+    op.execute(
+        """
+        UPDATE categories
+        SET usage_count = (SELECT count(*) FROM books WHERE books.category = categories.name)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop categories.usage_count."""
+    op.drop_column("categories", "usage_count")
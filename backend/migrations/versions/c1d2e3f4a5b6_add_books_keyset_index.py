@@ -0,0 +1,29 @@
+"""add composite index for keyset pagination on books
+
+Revision ID: c1d2e3f4a5b6
+Revises: ba7520fe521b
+Create Date: 2026-10-16 09:00:00
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c1d2e3f4a5b6"
+down_revision: Union[str, Sequence[str], None] = "ba7520fe521b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: index (created_at, id) so every page is an index range scan."""
+    op.create_index("ix_books_created_at_id", "books", ["created_at", "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop keyset pagination index."""
+    op.drop_index("ix_books_created_at_id", table_name="books")
@@ -0,0 +1,64 @@
+"""add per-language tsvector search to documents
+
+Revision ID: c7d8e9f0a1b2
+Revises: b6c7d8e9f0a1
+Create Date: 2026-10-16 20:00:00
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d8e9f0a1b2"
+down_revision: Union[str, Sequence[str], None] = "b6c7d8e9f0a1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: add documents.search_config and, on PostgreSQL, a GIN-indexed tsvector."""
+    op.add_column(
+        "documents",
+        sa.Column("search_config", sa.String(length=16), server_default=sa.text("'simple'"), nullable=False),
+    )
+    op.execute(
+        """
+        UPDATE documents
+        SET search_config = CASE
+            (SELECT CAST(books.language AS VARCHAR) FROM books WHERE books.id = documents.book_id)
+            WHEN 'FR' THEN 'french'
+            WHEN 'EN' THEN 'english'
+            ELSE 'simple'
+        END
+        """
+    )
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    # Generated columns need an immutable expression: to_tsvector() with a
+    # regconfig literal is, a text-to-regconfig cast is not, hence the CASE.
+    op.execute(
+        """
+        ALTER TABLE documents ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            CASE search_config
+                WHEN 'french' THEN to_tsvector('french'::regconfig, content_text)
+                WHEN 'english' THEN to_tsvector('english'::regconfig, content_text)
+                ELSE to_tsvector('simple'::regconfig, content_text)
+            END
+        ) STORED
+        """
+    )
+    op.execute("CREATE INDEX ix_documents_search_vector ON documents USING GIN (search_vector)")
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop the tsvector column and documents.search_config."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_documents_search_vector")
+        op.execute("ALTER TABLE documents DROP COLUMN IF EXISTS search_vector")
+    op.drop_column("documents", "search_config")
@@ -0,0 +1,40 @@
+"""add indexes backing book sorts and multi-value filters
+
+Revision ID: d2e3f4a5b6c7
+Revises: c1d2e3f4a5b6
+Create Date: 2026-10-16 11:00:00
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d2e3f4a5b6c7"
+down_revision: Union[str, Sequence[str], None] = "c1d2e3f4a5b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: widen filter indexes to keyset keys and index title/lower(author)."""
+    op.drop_index("ix_books_category", table_name="books")
+    op.create_index("ix_books_category", "books", ["category", "created_at", "id"], unique=False)
+    op.drop_index("ix_books_author", table_name="books")
+    op.create_index("ix_books_author", "books", ["author", "id"], unique=False)
+    op.create_index("ix_books_title_id", "books", ["title", "id"], unique=False)
+    op.create_index("ix_books_author_lower", "books", [sa.text("lower(author)")], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema: restore single-column filter indexes."""
+    op.drop_index("ix_books_author_lower", table_name="books")
+    op.drop_index("ix_books_title_id", table_name="books")
+    op.drop_index("ix_books_author", table_name="books")
+    op.create_index("ix_books_author", "books", ["author"], unique=False)
+    op.drop_index("ix_books_category", table_name="books")
+    op.create_index("ix_books_category", "books", ["category"], unique=False)
@@ -0,0 +1,61 @@
+"""add document_pages with per-page text search
+
+Revision ID: d8e9f0a1b2c3
+Revises: c7d8e9f0a1b2
+Create Date: 2026-10-16 21:00:00
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d8e9f0a1b2c3"
+down_revision: Union[str, Sequence[str], None] = "c7d8e9f0a1b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: create document_pages and, on PostgreSQL, its GIN-indexed tsvector.
+
+    Page boundaries of existing documents were not kept, so they have no pages
+    until their PDF is uploaded again.
+    """
+    op.create_table(
+        "document_pages",
+        sa.Column("document_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("page_number", sa.Integer(), nullable=False),
+        sa.Column("content_text", sa.Text(), nullable=False),
+        sa.Column("search_config", sa.String(length=16), server_default=sa.text("'simple'"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["document_id"], ["documents.id"], name=op.f("fk_document_pages_document_id_documents"), ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("document_id", "page_number", name=op.f("pk_document_pages")),
+    )
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(
+        """
+        ALTER TABLE document_pages ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            CASE search_config
+                WHEN 'french' THEN to_tsvector('french'::regconfig, content_text)
+                WHEN 'english' THEN to_tsvector('english'::regconfig, content_text)
+                ELSE to_tsvector('simple'::regconfig, content_text)
+            END
+        ) STORED
+        """
+    )
+    op.execute("CREATE INDEX ix_document_pages_search_vector ON document_pages USING GIN (search_vector)")
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop document_pages."""
+    op.execute("DROP INDEX IF EXISTS ix_document_pages_search_vector")
+    op.drop_table("document_pages")
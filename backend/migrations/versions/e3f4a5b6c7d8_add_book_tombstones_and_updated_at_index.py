@@ -0,0 +1,41 @@
+"""add book deletion log and updated_at index for delta sync
+
+Revision ID: e3f4a5b6c7d8
+Revises: d2e3f4a5b6c7
+Create Date: 2026-10-16 13:00:00
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e3f4a5b6c7d8"
+down_revision: Union[str, Sequence[str], None] = "d2e3f4a5b6c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: create book_tombstones and index books by (updated_at, id)."""
+    op.create_table(
+        "book_tombstones",
+        sa.Column("seq", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("book_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("seq", name=op.f("pk_book_tombstones")),
+    )
+    op.create_index("ix_book_tombstones_deleted_at", "book_tombstones", ["deleted_at"], unique=False)
+    op.create_index("ix_books_updated_at_id", "books", ["updated_at", "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop delta sync structures."""
+    op.drop_index("ix_books_updated_at_id", table_name="books")
+    op.drop_index("ix_book_tombstones_deleted_at", table_name="book_tombstones")
+    op.drop_table("book_tombstones")
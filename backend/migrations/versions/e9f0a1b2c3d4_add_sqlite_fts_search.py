@@ -0,0 +1,78 @@
+"""add SQLite FTS5 indexes for documents and document pages, keyed by search_rowid
+
+Revision ID: e9f0a1b2c3d4
+Revises: d8e9f0a1b2c3
+Create Date: 2026-10-16 22:00:00
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e9f0a1b2c3d4"
+down_revision: Union[str, Sequence[str], None] = "d8e9f0a1b2c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Copies of models.document / models.document_page SQLITE_FTS_DDL at this revision
+_DDL = (
+    "CREATE VIRTUAL TABLE documents_fts USING fts5("
+    "content_text, tokenize='porter unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER documents_fts_insert AFTER INSERT ON documents BEGIN "
+    "UPDATE documents SET search_rowid = (SELECT coalesce(max(search_rowid), 0) + 1 FROM documents) "
+    "WHERE id = new.id; "
+    "INSERT INTO documents_fts (rowid, content_text) "
+    "SELECT search_rowid, content_text FROM documents WHERE id = new.id; END",
+    "CREATE TRIGGER documents_fts_delete AFTER DELETE ON documents BEGIN "
+    "DELETE FROM documents_fts WHERE rowid = old.search_rowid; END",
+    "CREATE TRIGGER documents_fts_update AFTER UPDATE OF content_text ON documents BEGIN "
+    "UPDATE documents_fts SET content_text = new.content_text WHERE rowid = old.search_rowid; END",
+    "CREATE VIRTUAL TABLE document_pages_fts USING fts5("
+    "content_text, tokenize='porter unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER document_pages_fts_insert AFTER INSERT ON document_pages BEGIN "
+    "UPDATE document_pages SET search_rowid = (SELECT coalesce(max(search_rowid), 0) + 1 FROM document_pages) "
+    "WHERE document_id = new.document_id AND page_number = new.page_number; "
+    "INSERT INTO document_pages_fts (rowid, content_text) "
+    "SELECT search_rowid, content_text FROM document_pages "
+    "WHERE document_id = new.document_id AND page_number = new.page_number; END",
+    "CREATE TRIGGER document_pages_fts_delete AFTER DELETE ON document_pages BEGIN "
+    "DELETE FROM document_pages_fts WHERE rowid = old.search_rowid; END",
+    "CREATE TRIGGER document_pages_fts_update AFTER UPDATE OF content_text ON document_pages BEGIN "
+    "UPDATE document_pages_fts SET content_text = new.content_text WHERE rowid = old.search_rowid; END",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema: add search_rowid keys and, on SQLite, the FTS5 tables and triggers, then index existing rows."""
+    for name in ("documents", "document_pages"):
+        op.add_column(name, sa.Column("search_rowid", sa.BigInteger(), nullable=True))
+        op.create_index(f"ix_{name}_search_rowid", name, ["search_rowid"], unique=True)
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for name in ("documents", "document_pages"):
+        # Current rowids are unique; copying them makes the keys stable from now on
+        op.execute(f"UPDATE {name} SET search_rowid = rowid")
+    for statement in _DDL:
+        op.execute(statement)
+    op.execute("INSERT INTO documents_fts (rowid, content_text) SELECT search_rowid, content_text FROM documents")
+    op.execute(
+        "INSERT INTO document_pages_fts (rowid, content_text) SELECT search_rowid, content_text FROM document_pages"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop the SQLite FTS5 triggers and tables, then the search_rowid keys."""
+    sqlite = op.get_bind().dialect.name == "sqlite"
+    for name in ("documents", "document_pages"):
+        if sqlite:
+            for event in ("insert", "delete", "update"):
+                op.execute(f"DROP TRIGGER IF EXISTS {name}_fts_{event}")
+            op.execute(f"DROP TABLE IF EXISTS {name}_fts")
+        op.drop_index(f"ix_{name}_search_rowid", table_name=name)
+        with op.batch_alter_table(name, schema=None) as batch_op:
+            batch_op.drop_column("search_rowid")
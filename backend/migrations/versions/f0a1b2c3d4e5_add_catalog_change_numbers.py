@@ -0,0 +1,52 @@
+"""number book writes in commit order for delta sync
+
+Revision ID: f0a1b2c3d4e5
+Revises: e9f0a1b2c3d4
+Create Date: 2026-10-17 09:00:00
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f0a1b2c3d4e5"
+down_revision: Union[str, Sequence[str], None] = "e9f0a1b2c3d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: add the catalog_changes counter and books.change_seq, numbered by (updated_at, id)."""
+    op.create_table(
+        "catalog_changes",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("value", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_catalog_changes")),
+    )
+    op.add_column("books", sa.Column("change_seq", sa.BigInteger(), server_default=sa.text("0"), nullable=False))
+    op.execute(
+        """
+        UPDATE books
+        SET change_seq = numbered.n
+        FROM (SELECT id, row_number() OVER (ORDER BY updated_at, id) AS n FROM books) AS numbered
+        WHERE books.id = numbered.id
+        """
+    )
+    op.execute("INSERT INTO catalog_changes (id, value) SELECT 1, count(*) FROM books")
+    with op.batch_alter_table("books", schema=None) as batch_op:
+        batch_op.alter_column("change_seq", server_default=None)
+    op.drop_index("ix_books_updated_at_id", table_name="books")
+    op.create_index("ix_books_change_seq_id", "books", ["change_seq", "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema: walk delta sync by updated_at again."""
+    op.drop_index("ix_books_change_seq_id", table_name="books")
+    op.create_index("ix_books_updated_at_id", "books", ["updated_at", "id"], unique=False)
+    op.drop_column("books", "change_seq")
+    op.drop_table("catalog_changes")
@@ -0,0 +1,34 @@
+"""add categories.updated_at for category listing ETags
+
+Revision ID: f1a2b3c4d5e6
+Revises: f0a1b2c3d4e5
+Create Date: 2026-10-17 10:00:00
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f1a2b3c4d5e6"
+down_revision: Union[str, Sequence[str], None] = "f0a1b2c3d4e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: add categories.updated_at, starting from created_at."""
+    op.add_column(
+        "categories",
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    )
+    op.execute("UPDATE categories SET updated_at = created_at")
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop categories.updated_at."""
+    op.drop_column("categories", "updated_at")
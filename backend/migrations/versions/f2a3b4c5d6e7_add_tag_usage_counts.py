@@ -0,0 +1,36 @@
+"""add tags table with precomputed usage counts
+
+Revision ID: f2a3b4c5d6e7
+Revises: f1a2b3c4d5e6
+Create Date: 2026-10-17 12:00:00
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a3b4c5d6e7"
+down_revision: Union[str, Sequence[str], None] = "f1a2b3c4d5e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: create tags and backfill its usage counts from book_tags."""
+    op.create_table(
+        "tags",
+        sa.Column("name", sa.String(length=128), nullable=False),
+        sa.Column("usage_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("name", name=op.f("pk_tags")),
+    )
+    op.execute("INSERT INTO tags (name, usage_count) SELECT tag, count(*) FROM book_tags GROUP BY tag")
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop tags."""
+    op.drop_table("tags")
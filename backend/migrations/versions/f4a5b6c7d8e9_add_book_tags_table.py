@@ -0,0 +1,61 @@
+"""add normalized book_tags table backfilled from books.tags
+
+Revision ID: f4a5b6c7d8e9
+Revises: e3f4a5b6c7d8
+Create Date: 2026-10-16 15:00:00
+
+"""
+from __future__ import annotations
+
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f4a5b6c7d8e9"
+down_revision: Union[str, Sequence[str], None] = "e3f4a5b6c7d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: create book_tags and fill it from the JSON tags column."""
+    op.create_table(
+        "book_tags",
+        sa.Column("book_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("tag", sa.String(length=128), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["book_id"], ["books.id"], name=op.f("fk_book_tags_book_id_books"), ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("book_id", "tag", name=op.f("pk_book_tags")),
+    )
+    op.create_index("ix_book_tags_tag_book_id", "book_tags", ["tag", "book_id"], unique=False)
+
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute(
+            """
+            INSERT INTO book_tags (book_id, tag)
+            SELECT DISTINCT b.id, btrim(t.tag)
+            FROM books AS b, json_array_elements_text(b.tags::json) AS t(tag)
+            WHERE btrim(t.tag) <> ''
+            """
+        )
+        return
+    rows = []
+    for book_id, tags in bind.execute(sa.text("SELECT id, tags FROM books")).all():
+        values = json.loads(tags) if isinstance(tags, str) else (tags or [])
+        for tag in dict.fromkeys(t.strip() for t in values if t and t.strip()):
+            rows.append({"book_id": book_id, "tag": tag})
+    if rows:
+        bind.execute(sa.text("INSERT INTO book_tags (book_id, tag) VALUES (:book_id, :tag)"), rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop book_tags."""
+    op.drop_index("ix_book_tags_tag_book_id", table_name="book_tags")
+    op.drop_table("book_tags")
@@ -2,9 +2,15 @@
 
 from .base import Base
 from .user import User, UserRole
+from .author import Author
 from .book import Book, Language
+from .book_tag import BookTag
+from .book_tombstone import BookTombstone
+from .tag import Tag
+from .catalog_change import CatalogChange
 from .document import Document
+from .document_page import DocumentPage
 from .category import Category
 from .comment import Comment
 
-__all__ = ["Base", "User", "UserRole", "Book", "Language", "Document", "Category", "Comment"]
\ No newline at end of file
+__all__ = ["Base", "User", "UserRole", "Author", "Book", "Language", "BookTag", "BookTombstone", "Tag", "CatalogChange", "Document", "DocumentPage", "Category", "Comment"]
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""Author projection maintained from ``Book.author`` for browsing."""
+
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import Index, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class Author(Base):
+    """
+    One distinct author (case-insensitive) with its number of books.
+    
+    Rows are created, counted and removed by the book services as books are
+    written; they are never edited directly.
+    
+    Attributes:
+        id: Stable identifier, usable as the ``author_id`` filter on books
+        name: Display name (as first written on a book)
+        normalized: Lowercased name, equal to ``lower(books.author)``
+        sort_key: Lowercased name without accents, used for ordering and prefix lookup
+        book_count: Number of books by this author
+    """
+    __tablename__ = "authors"
+    __table_args__ = (
+        # Keyset pagination and prefix lookup in browsing order
+        Index("ix_authors_sort_key_id", "sort_key", "id"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    normalized: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    sort_key: Mapped[str] = mapped_column(String(255), nullable=False)
+    book_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
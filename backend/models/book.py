@@ -4,12 +4,12 @@ from __future__ import annotations
 
 import enum
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, TYPE_CHECKING
 
-from sqlalchemy import JSON, DateTime, Enum, String, func, ForeignKey, Index
+from sqlalchemy import JSON, BigInteger, DateTime, Enum, String, func, ForeignKey, Index, select, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 
 from .base import Base
 
@@ -20,10 +20,13 @@ class Language(str, enum.Enum):
     EN = "EN"
 
 if TYPE_CHECKING:  # pragma: no cover - imported for typing only
-    from .document import Document
     from .category import Category
 
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class Book(Base):
     """
     Book model representing library items.
@@ -41,14 +44,25 @@ class Book(Base):
         language: Book language
         created_at: Creation timestamp
         updated_at: Last update timestamp
-        document: Related document (PDF)
-        category_rel: Related category object
+        change_seq: CatalogChange number of the transaction that last wrote the book
+        documents: Related documents (PDF), loaded only on explicit request
+        category_ref: Related category object, loaded only on explicit request
+        has_documents: Whether at least one document exists (EXISTS subquery)
     """
     __tablename__ = "books"
     __table_args__ = (
-        Index("ix_books_category", "category"),
-        Index("ix_books_author", "author"),
+        # Category filter combined with the default (newest first) order
+        Index("ix_books_category", "category", "created_at", "id"),
+        # Keyset pagination keys for the author and title sorts
+        Index("ix_books_author", "author", "id"),
+        Index("ix_books_title_id", "title", "id"),
+        # Case-insensitive author filter
+        Index("ix_books_author_lower", text("lower(author)")),
         Index("ix_books_language", "language"),
+        # Keyset pagination key for the created_at sorts and date-range filters
+        Index("ix_books_created_at_id", "created_at", "id"),
+        # Delta sync (GET /books/changes) walks books in commit order
+        Index("ix_books_change_seq_id", "change_seq", "id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -77,17 +91,32 @@ class Book(Base):
         ),
         nullable=False,
     )
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+    # Python-side defaults keep microsecond precision on every dialect (SQLite's
+    # CURRENT_TIMESTAMP is second-precision), which keyset cursors rely on.
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now(), onupdate=_utcnow
+    )
+    # Set on every write (see services.changes); unlike updated_at it follows commit order
+    change_seq: Mapped[int] = mapped_column(BigInteger, nullable=False)
 
+    # Never loaded implicitly: catalog reads only need ``has_documents`` and
+    # documents carry the (large) extracted text. Use selectinload() when needed.
     documents: Mapped[List["Document"]] = relationship(
         "Document",
         back_populates="book",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise",
     )
-    category_ref: Mapped["Category"] = relationship("Category", lazy="joined")
+    category_ref: Mapped["Category"] = relationship("Category", lazy="raise")
+
+
+from .document import Document  # noqa: E402  (needs Book to be declared first; also types Book.documents)
 
-    @property
-    def has_documents(self) -> bool:
-        return bool(self.documents)
+Book.has_documents = column_property(
+    # correlate_except: stays valid when a Document is loaded with its joined Book
+    select(Document.id).where(Document.book_id == Book.id).correlate_except(Document).exists()
+)
@@ -0,0 +1,31 @@
+"""Normalized (book, tag) pairs mirroring ``Book.tags`` for indexed filtering."""
+
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class BookTag(Base):
+    """
+    One tag of one book; kept in sync with ``Book.tags`` by the book services.
+    
+    Attributes:
+        book_id: Tagged book
+        tag: Tag value, as stored in ``Book.tags``
+    """
+    __tablename__ = "book_tags"
+    __table_args__ = (
+        # Tag filter and tag cloud counts are served from this index alone
+        Index("ix_book_tags_tag_book_id", "tag", "book_id"),
+    )
+
+    book_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("books.id", ondelete="CASCADE"), primary_key=True
+    )
+    tag: Mapped[str] = mapped_column(String(128), primary_key=True)
@@ -0,0 +1,32 @@
+"""Deletion log used by catalog delta sync."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+from .book import _utcnow
+
+
+class BookTombstone(Base):
+    """
+    Record of a deleted book, kept so sync clients can drop their local copy.
+    
+    Attributes:
+        seq: Monotonic sequence number; sync tokens remember the last one seen
+        book_id: ID of the deleted book (no foreign key: the row is gone)
+        deleted_at: Timestamp of the deletion
+    """
+    __tablename__ = "book_tombstones"
+    __table_args__ = (Index("ix_book_tombstones_deleted_at", "deleted_at"),)
+
+    seq: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    book_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now()
+    )
@@ -0,0 +1,26 @@
+"""Counter numbering catalog writes in commit order, for delta sync."""
+
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class CatalogChange(Base):
+    """
+    Single-row counter drawn once by every transaction writing books or tombstones.
+    
+    Drawing increments the row, which stays locked until the transaction ends:
+    writers are serialized from their first draw to their commit, so change
+    numbers (and tombstone sequence numbers) become visible in increasing order.
+    
+    Attributes:
+        id: Always 1
+        value: Last change number handed out
+    """
+    __tablename__ = "catalog_changes"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    value: Mapped[int] = mapped_column(BigInteger, nullable=False)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
+from .book import _utcnow
 
 
 class Category(Base):
@@ -12,3 +13,10 @@ class Category(Base):
 
     name: Mapped[str] = mapped_column(String(128), primary_key=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    # Bumped by every write to the row (including a rename, which copies
+    # created_at), so listing ETags change even for categories without books
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now(), onupdate=_utcnow
+    )
+    # Number of books in this category, maintained by the book services
+    usage_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
@@ -3,24 +3,37 @@
 Notes:
 - We use a GIN index with trigram ops on ``content_text`` to support ILIKE
     searches efficiently without exceeding Postgres btree row size limits.
+- On PostgreSQL, ``documents.search_vector`` is a stored ``tsvector`` generated
+    from ``content_text`` with the ``search_config`` text search configuration
+    and GIN-indexed. It is created alongside the table by ``POSTGRES_SEARCH_DDL``
+    but not mapped (SQLite has no tsvector); see
+    ``services.documents.PostgresSearchBackend``.
+- On SQLite, ``documents_fts`` is an FTS5 table holding a copy of
+    ``content_text`` kept in sync by triggers, its rowid being the document's
+    ``search_rowid``; see ``services.documents.Fts5SearchBackend``.
 """
 
 from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func
+from sqlalchemy import DDL, BigInteger, DateTime, ForeignKey, Index, String, Text, event, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
+from .book import Language
 
 if TYPE_CHECKING:  # pragma: no cover - type checking only
     from .book import Book
 
 
+# Text search configuration used to index a document, by language of its book
+SEARCH_CONFIGS = {Language.FR: "french", Language.EN: "english"}
+
+
 class Document(Base):
     """Represents an uploaded PDF associated with a book."""
 
@@ -33,6 +46,7 @@ class Document(Base):
             postgresql_using="gin",
             postgresql_ops={"content_text": "gin_trgm_ops"},
         ),
+        Index("ix_documents_search_rowid", "search_rowid", unique=True),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -45,7 +59,14 @@ class Document(Base):
         index=True,
     )
     filename: Mapped[str] = mapped_column(String(512), nullable=False)
-    content_text: Mapped[str] = mapped_column(Text, nullable=False)
+    # Deferred: the extracted text can weigh hundreds of KB and is only needed
+    # by search predicates, never when a document row itself is loaded.
+    content_text: Mapped[str] = mapped_column(Text, nullable=False, deferred=True)
+    # One of SEARCH_CONFIGS, kept in line with Book.language by the book services
+    search_config: Mapped[str] = mapped_column(String(16), nullable=False, server_default="simple")
+    # SQLite only: integer key of the row in documents_fts, set by the insert
+    # trigger (the implicit rowid of a UUID-keyed table may change on VACUUM)
+    search_rowid: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     uploaded_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -56,3 +77,38 @@ class Document(Base):
         "Book", back_populates="documents", lazy="joined"
     )
 
+
+# PostgreSQL stored tsvector, also created by migration c7d8e9f0a1b2. Generated
+# columns need an immutable expression: to_tsvector() with a regconfig literal
+# is, a text-to-regconfig cast is not, hence the CASE.
+POSTGRES_SEARCH_DDL = (
+    "ALTER TABLE documents ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+    "CASE search_config "
+    "WHEN 'french' THEN to_tsvector('french'::regconfig, content_text) "
+    "WHEN 'english' THEN to_tsvector('english'::regconfig, content_text) "
+    "ELSE to_tsvector('simple'::regconfig, content_text) END) STORED",
+    "CREATE INDEX ix_documents_search_vector ON documents USING GIN (search_vector)",
+)
+
+# SQLite full-text index, also created by migration e9f0a1b2c3d4. The trigger
+# numbers each document from the unique search_rowid index and uses that
+# number as FTS5 rowid, so deletes and updates find their FTS row by rowid.
+SQLITE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE documents_fts USING fts5("
+    "content_text, tokenize='porter unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER documents_fts_insert AFTER INSERT ON documents BEGIN "
+    "UPDATE documents SET search_rowid = (SELECT coalesce(max(search_rowid), 0) + 1 FROM documents) "
+    "WHERE id = new.id; "
+    "INSERT INTO documents_fts (rowid, content_text) "
+    "SELECT search_rowid, content_text FROM documents WHERE id = new.id; END",
+    "CREATE TRIGGER documents_fts_delete AFTER DELETE ON documents BEGIN "
+    "DELETE FROM documents_fts WHERE rowid = old.search_rowid; END",
+    "CREATE TRIGGER documents_fts_update AFTER UPDATE OF content_text ON documents BEGIN "
+    "UPDATE documents_fts SET content_text = new.content_text WHERE rowid = old.search_rowid; END",
+)
+
+for _statement in POSTGRES_SEARCH_DDL:
+    event.listen(Document.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in SQLITE_FTS_DDL:
+    event.listen(Document.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(Document.__table__, "after_drop", DDL("DROP TABLE IF EXISTS documents_fts").execute_if(dialect="sqlite"))
@@ -0,0 +1,77 @@
+"""Per-page extracted text of a document, for locating search hits in the reader.
+
+On PostgreSQL, ``document_pages.search_vector`` is a stored ``tsvector``
+generated with ``search_config`` and GIN-indexed, created alongside the table
+but not mapped, like ``documents.search_vector``. On SQLite, ``document_pages_fts`` is the
+FTS5 counterpart, kept in sync by triggers and keyed by ``search_rowid`` like
+``documents_fts``.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Optional
+
+from sqlalchemy import DDL, BigInteger, ForeignKey, Index, Integer, String, Text, event
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class DocumentPage(Base):
+    """
+    Text of one page of a document, numbered from 1 as in the PDF.
+    
+    Attributes:
+        document_id: Document the page belongs to
+        page_number: 1-based page number
+        content_text: Text extracted from that page
+        search_config: Copy of ``Document.search_config``, kept in sync by the book services
+        search_rowid: SQLite only, rowid of the page in ``document_pages_fts``
+    """
+    __tablename__ = "document_pages"
+    __table_args__ = (Index("ix_document_pages_search_rowid", "search_rowid", unique=True),)
+
+    document_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("documents.id", ondelete="CASCADE"), primary_key=True
+    )
+    page_number: Mapped[int] = mapped_column(Integer, primary_key=True)
+    content_text: Mapped[str] = mapped_column(Text, nullable=False)
+    search_config: Mapped[str] = mapped_column(String(16), nullable=False, server_default="simple")
+    search_rowid: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+
+
+# PostgreSQL stored tsvector, also created by migration d8e9f0a1b2c3
+POSTGRES_SEARCH_DDL = (
+    "ALTER TABLE document_pages ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+    "CASE search_config "
+    "WHEN 'french' THEN to_tsvector('french'::regconfig, content_text) "
+    "WHEN 'english' THEN to_tsvector('english'::regconfig, content_text) "
+    "ELSE to_tsvector('simple'::regconfig, content_text) END) STORED",
+    "CREATE INDEX ix_document_pages_search_vector ON document_pages USING GIN (search_vector)",
+)
+
+# SQLite full-text index, also created by migration e9f0a1b2c3d4
+SQLITE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE document_pages_fts USING fts5("
+    "content_text, tokenize='porter unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER document_pages_fts_insert AFTER INSERT ON document_pages BEGIN "
+    "UPDATE document_pages SET search_rowid = (SELECT coalesce(max(search_rowid), 0) + 1 FROM document_pages) "
+    "WHERE document_id = new.document_id AND page_number = new.page_number; "
+    "INSERT INTO document_pages_fts (rowid, content_text) "
+    "SELECT search_rowid, content_text FROM document_pages "
+    "WHERE document_id = new.document_id AND page_number = new.page_number; END",
+    "CREATE TRIGGER document_pages_fts_delete AFTER DELETE ON document_pages BEGIN "
+    "DELETE FROM document_pages_fts WHERE rowid = old.search_rowid; END",
+    "CREATE TRIGGER document_pages_fts_update AFTER UPDATE OF content_text ON document_pages BEGIN "
+    "UPDATE document_pages_fts SET content_text = new.content_text WHERE rowid = old.search_rowid; END",
+)
+
+for _statement in POSTGRES_SEARCH_DDL:
+    event.listen(DocumentPage.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in SQLITE_FTS_DDL:
+    event.listen(DocumentPage.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    DocumentPage.__table__, "after_drop", DDL("DROP TABLE IF EXISTS document_pages_fts").execute_if(dialect="sqlite")
+)
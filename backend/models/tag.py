@@ -0,0 +1,25 @@
+"""Tag usage counts maintained from ``book_tags`` for the tag cloud."""
+
+from __future__ import annotations
+
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class Tag(Base):
+    """
+    One distinct tag with the number of books carrying it.
+    
+    Rows are created, counted and removed by the book services as book tags
+    are written; they are never edited directly.
+    
+    Attributes:
+        name: Tag value, as stored in ``Book.tags``
+        usage_count: Number of books with this tag
+    """
+    __tablename__ = "tags"
+
+    name: Mapped[str] = mapped_column(String(128), primary_key=True)
+    usage_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
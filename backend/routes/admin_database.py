@@ -4,15 +4,22 @@ Deletes all books, documents, categories, and comments.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import delete
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database import get_session
 from ..dependencies import require_admin_user
+from ..models.author import Author
 from ..models.book import Book
+from ..models.book_tag import BookTag
+from ..models.book_tombstone import BookTombstone
+from ..models.tag import Tag
 from ..models.document import Document
+from ..models.document_page import DocumentPage
 from ..models.category import Category
 from ..models.comment import Comment
+from ..services import books as books_service
+from ..services.changes import next_change_seq
 
 router = APIRouter(prefix="/admin/database", tags=["admin", "database"])
 
@@ -32,15 +39,23 @@ async def reset_database(
         Dictionary with deletion counts for each entity type
     """
     
+    # Take the change number before any other row lock (see services.changes)
+    await next_change_seq(session)
+    
     # Delete comments first (foreign key to books)
     result = await session.execute(delete(Comment))
     comments_deleted = result.rowcount
     
-    # Delete documents (foreign key to books)
+    # Delete documents (foreign key to books) and their pages
+    await session.execute(delete(DocumentPage))
     result = await session.execute(delete(Document))
     documents_deleted = result.rowcount
     
-    # Delete books
+    # Record deletions for delta sync clients, then delete books and their tag index
+    await session.execute(delete(BookTag))
+    await session.execute(delete(Tag))
+    await session.execute(delete(Author))
+    await session.execute(insert(BookTombstone).from_select(["book_id"], select(Book.id)))
     result = await session.execute(delete(Book))
     books_deleted = result.rowcount
     
@@ -49,6 +64,7 @@ async def reset_database(
     categories_deleted = result.rowcount
     
     await session.commit()
+    await books_service.invalidate_catalog_cache()
     
     return {
         "message": "Database reset successful",
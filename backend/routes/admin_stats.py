@@ -15,7 +15,8 @@ from ..models.book import Book
 from ..models.user import User
 from ..models.document import Document
 from ..models.category import Category
-from ..schemas.admin_stats import TopBooksResponse, ActiveUsersResponse, RecentReportsResponse, CountsResponse
+from ..schemas.admin_stats import TopBooksResponse, ActiveUsersResponse, RecentReportsResponse, CountsResponse, CacheStatsResponse
+from ..services import books as books_service
 
 router = APIRouter(prefix="/admin/stats", tags=["admin-stats"])
 
@@ -122,4 +123,13 @@ async def get_counts(
         users=users_count,
         books=books_count,
         categories=categories_count,
-    )
\ No newline at end of file
+    )
+
+
+@router.get("/cache", response_model=CacheStatsResponse)
+async def get_cache_stats(
+    _: User = Depends(get_current_admin_user),
+) -> CacheStatsResponse:
+    """Return hit/miss counters of the catalog cache for the worker serving the request."""
+
+    return CacheStatsResponse(**books_service.catalog_cache.stats())
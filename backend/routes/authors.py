@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import get_session
+from ..schemas import author as author_schema
+from ..services import authors as authors_service
+
+router = APIRouter(prefix="/authors", tags=["authors"])
+
+_DEFAULT_PAGE_SIZE = int(os.getenv("AUTHORS_PAGE_SIZE", "50"))
+_MAX_PAGE_SIZE = int(os.getenv("AUTHORS_MAX_PAGE_SIZE", "500"))
+
+
+@router.get("/", response_model=list[author_schema.AuthorRead])
+async def list_authors(
+    prefix: Optional[str] = Query(None, max_length=255, description="Name prefix, ignoring case and accents"),
+    q: Optional[str] = Query(None, max_length=255, description="Part of the name, ignoring case and accents"),
+    limit: int = Query(_DEFAULT_PAGE_SIZE, ge=1),
+    cursor: Optional[str] = None,
+    session: AsyncSession = Depends(get_session),
+):
+    """Browse authors alphabetically with their book counts; X-Next-Cursor points to the next page."""
+    try:
+        authors, next_cursor = await authors_service.list_authors(
+            session, prefix=prefix, query=q, limit=min(limit, _MAX_PAGE_SIZE), cursor=cursor
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+    payload = [
+        author_schema.AuthorRead(id=a.id, name=a.name, book_count=a.book_count).model_dump(mode="json")
+        for a in authors
+    ]
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return JSONResponse(content=payload, headers=headers)
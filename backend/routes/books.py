@@ -2,76 +2,369 @@ from __future__ import annotations
 
 import os
 import uuid
-from typing import AsyncIterator, Iterator, List, Optional
+from datetime import datetime
+from typing import AsyncIterator, Dict, Iterator, List, Literal, Optional, Sequence, Union
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Request, Response, UploadFile, status
-from fastapi.responses import StreamingResponse
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ..dependencies import (
     get_current_user,
     get_optional_current_user,
     require_admin_user,
 )
-from ..database import get_session
-from ..schemas.book import BookCreate, BookRead, BookUpdate
-from ..schemas.document import DocumentStreamToken
+from ..database import get_session, get_session_factory
+from ..schemas.book import BookBatchRequest, BookBulkResult, BookBulkSelection, BookBulkUpdate, BookChanges, BookCreate, BookImportReport, BookFacets, BookRead, BookSummary, BookUpdate, parse_book_fields
+from ..schemas.document import BookPageHit, DocumentStreamToken
 from ..services import books as books_service
 from ..services import documents as documents_service
 from ..services import categories as categories_service
+from ..services import catalog_export, catalog_import
+from ..services.changes import next_change_seq
 from ..models.user import UserRole
 from ..models.book import Book, Language
 from ..core.config import settings
+from ..core.http_cache import is_not_modified, not_modified, weak_etag
 from ..core.security import TokenDecodeError
 
 router = APIRouter(prefix="/books", tags=["books"])
 
 _UPLOAD_CHUNK_SIZE = 1024 * 1024
 _MAX_UPLOAD_SIZE = int(os.getenv("PDF_UPLOAD_MAX_BYTES", str(60 * 1024 * 1024)))
+_DEFAULT_PAGE_SIZE = int(os.getenv("BOOKS_PAGE_SIZE", "50"))
+_MAX_PAGE_SIZE = int(os.getenv("BOOKS_MAX_PAGE_SIZE", "200"))
+_MAX_PAGE_HITS = int(os.getenv("BOOK_SEARCH_MAX_PAGES", "200"))
 
+_FIELDS_DESCRIPTION = "Comma-separated BookRead fields to return (sparse fieldset)"
+_VIEW_DESCRIPTION = "'summary' returns only id, title, author, thumbnail_path and language"
 
-@router.get("/", response_model=List[BookRead])
+
+def _resolve_fields(fields: Optional[str], view: str) -> Optional[Sequence[str]]:
+    """Parse sparse fieldset parameters, mapping unknown fields to a 400."""
+    try:
+        return parse_book_fields(fields, view)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+def book_filters(
+    category: Optional[List[str]] = Query(None, description="Category name; repeat to match any of several"),
+    author: Optional[List[str]] = Query(None, description="Author name (case-insensitive); repeatable"),
+    language: Optional[List[Language]] = Query(None, description="Language code; repeatable"),
+    tag: Optional[List[str]] = Query(None, description="Tag; repeat to match books having any of several"),
+    author_id: Optional[List[uuid.UUID]] = Query(None, description="Author id from GET /authors; repeatable"),
+    created_after: Optional[datetime] = Query(None, description="Only books created at or after this instant"),
+    created_before: Optional[datetime] = Query(None, description="Only books created strictly before this instant"),
+) -> books_service.BookFilters:
+    """Collect the shared catalog filter parameters."""
+    return books_service.BookFilters.build(
+        category=category,
+        author=author,
+        language=[lang.value for lang in language] if language else None,
+        tag=tag,
+        author_id=author_id,
+        created_after=created_after,
+        created_before=created_before,
+    )
+
+
+@router.get("/", response_model=List[Union[BookRead, BookSummary]], response_model_exclude_unset=True)
 async def list_books(
-    category: Optional[str] = None,
-    author: Optional[str] = None,
-    language: Optional[str] = None,
+    request: Request,
+    filters: books_service.BookFilters = Depends(book_filters),
+    sort: Literal["-created_at", "created_at", "title", "author"] = Query(
+        books_service.DEFAULT_SORT, description="Sort order; ties are broken by id"
+    ),
+    limit: int = Query(_DEFAULT_PAGE_SIZE, ge=1),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = Query(None, description=_FIELDS_DESCRIPTION),
+    view: Literal["full", "summary"] = Query("full", description=_VIEW_DESCRIPTION),
+    session: AsyncSession = Depends(get_session),
+) -> List[Union[BookRead, BookSummary]]:
+    """
+    Retrieve a page of books with optional filtering and sorting (newest first by default).
+    
+    Args:
+        request: Incoming request, checked for If-None-Match
+        filters: Category/author/language (multi-valued) and created_at range filters
+        sort: title, author, created_at or -created_at
+        limit: Page size, capped server-side at BOOKS_MAX_PAGE_SIZE
+        cursor: Opaque cursor from the X-Next-Cursor header of the previous page
+        fields: Optional comma-separated field selection, projected in SQL
+        view: 'full' (default) or 'summary'
+        session: Database session dependency
+        
+    Returns:
+        List of books matching the criteria; the X-Next-Cursor header is set
+        when more results are available. Answers 304 without querying books
+        when If-None-Match matches the current catalog version. Pages are
+        served from the in-process catalog cache when possible.
+        
+    Raises:
+        HTTPException: 400 if the cursor or a requested field is invalid
+    """
+    selected = _resolve_fields(fields, view)
+    version = await books_service.catalog_version(session)
+    etag = weak_etag(version)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    headers = {"ETag": etag}
+    try:
+        payload, next_cursor = await books_service.list_book_payloads(
+            session,
+            filters,
+            limit=min(limit, _MAX_PAGE_SIZE),
+            cursor=cursor,
+            sort=sort,
+            fields=selected,
+            version=version,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return JSONResponse(content=payload, headers=headers)
+
+
+@router.get("/facets", response_model=BookFacets)
+async def book_facets(
+    filters: books_service.BookFilters = Depends(book_filters),
+    top_authors: int = Query(10, ge=1, le=100),
+    session: AsyncSession = Depends(get_session),
+) -> BookFacets:
+    """
+    Count books per category, language and top authors for the given filters.
+    
+    Args:
+        filters: Same filters as the book listing
+        top_authors: Number of authors to return, most prolific first
+        session: Database session dependency
+        
+    Returns:
+        Facet counts computed in a single grouped query (cached per filter set
+        and catalog version)
+    """
+    version = await books_service.catalog_version(session)
+    facets = await books_service.facet_counts(session, filters, top_authors=top_authors, version=version)
+    return BookFacets(**facets)
+
+
+@router.get("/changes", response_model=BookChanges)
+async def book_changes(
+    since: Optional[str] = Query(None, description="sync_token from the previous call, or an ISO 8601 timestamp"),
+    limit: int = Query(_DEFAULT_PAGE_SIZE, ge=1),
+    session: AsyncSession = Depends(get_session),
+) -> BookChanges:
+    """
+    Return books created or updated and ids of books deleted since a checkpoint.
+    
+    Args:
+        since: Sync token or timestamp; omitted for an initial full snapshot
+        limit: Maximum books and deleted ids per page, capped at BOOKS_MAX_PAGE_SIZE
+        session: Database session dependency
+        
+    Returns:
+        Changed books, deleted ids and the sync token to pass next time;
+        call again with that token while has_more is true
+        
+    Raises:
+        HTTPException: 400 if since is neither a sync token nor a timestamp
+    """
+    try:
+        changes = await books_service.list_changes(session, since=since, limit=min(limit, _MAX_PAGE_SIZE))
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return JSONResponse(content=changes)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_books(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Export format"),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+    admin: object = Depends(require_admin_user),
+) -> StreamingResponse:
+    """
+    Stream the whole catalog as NDJSON or CSV (admin only).
+    
+    Rows are read through a server-side cursor and written in batches, so
+    memory use does not grow with the catalog size.
+    
+    Args:
+        format: 'ndjson' (one JSON object per line) or 'csv' (with header row)
+        session_factory: Session factory; the export opens its own session
+        admin: Current admin user
+        
+    Returns:
+        Streaming attachment response
+    """
+    return StreamingResponse(
+        catalog_export.iter_catalog_export(session_factory, format),
+        media_type=catalog_export.EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="books.{format}"'},
+    )
+
+
+@router.post("/import", response_model=BookImportReport)
+async def import_books(
+    request: Request,
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Format of the request body"),
     session: AsyncSession = Depends(get_session),
-) -> List[BookRead]:
+    admin: object = Depends(require_admin_user),
+) -> BookImportReport:
     """
-    Retrieve a list of books with optional filtering.
+    Bulk-import books from a streamed NDJSON or CSV body (admin only).
+    
+    Rows are validated and written in batches (missing categories are
+    created); rows with an existing ``id`` update that book.
     
     Args:
-        category: Filter books by category name
-        author: Filter books by author name
-        language: Filter books by language code
+        request: Incoming request whose body is read as a stream
+        format: 'ndjson' (one BookImportRow object per line) or 'csv' (header row,
+            pipe-separated tags)
         session: Database session dependency
+        admin: Current admin user
         
     Returns:
-        List of books matching the criteria
+        Import report with per-line errors for rejected rows
     """
-    books = await books_service.list_books(session, category=category, author=author, language=language)
-    return [BookRead.from_model(b) for b in books]
+    records = catalog_import.iter_import_records(request.stream(), format)
+    return await catalog_import.import_books(session, records)
+
+
+def _bulk_filters(selection: BookBulkSelection) -> books_service.BookFilters:
+    return books_service.BookFilters.build(
+        category=selection.category,
+        author=selection.author,
+        language=[lang.value for lang in selection.language] if selection.language else None,
+        tag=selection.tag,
+        author_id=selection.author_id,
+        created_after=selection.created_after,
+        created_before=selection.created_before,
+    )
 
 
-@router.get("/{book_id}", response_model=BookRead)
-async def read_book(book_id: uuid.UUID, session: AsyncSession = Depends(get_session)) -> BookRead:
+@router.patch("/bulk", response_model=BookBulkResult)
+async def bulk_update_books(
+    payload: BookBulkUpdate,
+    session: AsyncSession = Depends(get_session),
+    admin: object = Depends(require_admin_user),
+) -> BookBulkResult:
+    """
+    Apply one change to every book matching ids and/or filters (admin only).
+    
+    Args:
+        payload: Selection (ids and/or listing filters) plus the fields to set
+        session: Database session dependency
+        admin: Current admin user
+        
+    Returns:
+        Number of books updated
+        
+    Raises:
+        HTTPException: 400 if the selection is empty or has too many ids
+    """
+    try:
+        matched = await books_service.bulk_update_books(
+            session, _bulk_filters(payload), payload.changes, ids=payload.ids
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return BookBulkResult(matched=matched)
+
+
+@router.post("/bulk-delete", response_model=BookBulkResult)
+async def bulk_delete_books(
+    payload: BookBulkSelection,
+    session: AsyncSession = Depends(get_session),
+    admin: object = Depends(require_admin_user),
+) -> BookBulkResult:
+    """
+    Delete every book matching ids and/or filters in one transaction (admin only).
+    
+    Args:
+        payload: Selection (ids and/or listing filters)
+        session: Database session dependency
+        admin: Current admin user
+        
+    Returns:
+        Number of books deleted
+        
+    Raises:
+        HTTPException: 400 if the selection is empty or has too many ids
+    """
+    try:
+        matched = await books_service.bulk_delete_books(session, _bulk_filters(payload), ids=payload.ids)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return BookBulkResult(matched=matched)
+
+
+@router.post("/batch", response_model=Dict[str, Optional[Union[BookRead, BookSummary]]])
+async def read_books_batch(
+    payload: BookBatchRequest,
+    fields: Optional[str] = Query(None, description=_FIELDS_DESCRIPTION),
+    view: Literal["full", "summary"] = Query("full", description=_VIEW_DESCRIPTION),
+    session: AsyncSession = Depends(get_session),
+) -> Dict[str, Optional[Union[BookRead, BookSummary]]]:
+    """
+    Retrieve several books by id in one round trip.
+    
+    Args:
+        payload: Ids to resolve (at most BOOKS_BATCH_MAX_IDS)
+        fields: Optional comma-separated field selection, projected in SQL
+        view: 'full' (default) or 'summary'
+        session: Database session dependency
+        
+    Returns:
+        Object keyed by requested id; unknown ids map to null
+        
+    Raises:
+        HTTPException: 400 if too many ids or an invalid field is requested
+    """
+    selected = _resolve_fields(fields, view)
+    try:
+        books = await books_service.get_books_by_ids(session, payload.ids, fields=selected)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return JSONResponse(content=books)
+
+
+@router.get("/{book_id}", response_model=Union[BookRead, BookSummary], response_model_exclude_unset=True)
+async def read_book(
+    request: Request,
+    book_id: uuid.UUID,
+    fields: Optional[str] = Query(None, description=_FIELDS_DESCRIPTION),
+    view: Literal["full", "summary"] = Query("full", description=_VIEW_DESCRIPTION),
+    session: AsyncSession = Depends(get_session),
+) -> Union[BookRead, BookSummary]:
     """
     Retrieve a specific book by its ID.
     
     Args:
+        request: Incoming request, checked for If-None-Match
         book_id: UUID of the book to retrieve
+        fields: Optional comma-separated field selection, projected in SQL
+        view: 'full' (default) or 'summary'
         session: Database session dependency
         
     Returns:
-        Book details
+        Book details, or 304 when If-None-Match matches the book's version
         
     Raises:
-        HTTPException: 404 if book not found
+        HTTPException: 400 if a requested field is invalid, 404 if book not found
     """
-    book = await books_service.get_book(session, book_id)
-    if book is None:
+    selected = _resolve_fields(fields, view)
+    version = await books_service.book_version(session, book_id)
+    if version is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found")
+    etag = weak_etag(version)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    payload = await books_service.get_book_payload(session, book_id, fields=selected, version=version)
+    if payload is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found")
-    return BookRead.from_model(book)
+    return JSONResponse(content=payload, headers={"ETag": etag})
 
 
 @router.post("/create_with_file", response_model=BookRead, status_code=status.HTTP_201_CREATED)
@@ -135,7 +428,8 @@ async def create_book_with_file(
         buffer.seek(0)
         with destination.open("wb") as fh:
             fh.write(buffer.read())
-        content_text = documents_service.extract_pdf_text(destination)
+        pages = documents_service.extract_pdf_pages(destination)
+        content_text = documents_service.join_pages(pages)
     except Exception as exc:
         destination.unlink(missing_ok=True)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Failed to parse PDF content") from exc
@@ -165,31 +459,28 @@ async def create_book_with_file(
     except ValueError:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid language")
 
+    # Category upsert, book and document inserts commit together: a failure
+    # leaves nothing behind, and server defaults come back through RETURNING.
     try:
-        # Simpler, robust path: perform each DB step with its own commit so
-        # we avoid nested transaction issues caused by other dependencies
-        # starting transactions on the same AsyncSession.
-        await categories_service.create_category(session, category, commit=True)
-
-        # Persist the book record and commit so subsequent document creation
-        # can reference a persisted Book row.
+        await next_change_seq(session)
+        await categories_service.create_category(session, category, commit=False)
         session.add(book)
-        await session.commit()
-        await session.refresh(book)
-
-        # Create document record (commits internally).
         await documents_service.create_document(
             session,
             book=book,
             filename=stored_name,
             content_text=content_text,
-            commit=True,
+            pages=pages,
+            commit=False,
         )
+        await books_service.track_book_counts(session, added=[(book.author, book.category)])
+        await session.commit()
     except Exception:
+        await session.rollback()
         raise
 
-    await session.refresh(book)
-    return BookRead.from_model(book)
+    await books_service.invalidate_catalog_cache()
+    return BookRead.from_model(book, has_document=True)
 
 
 @router.put("/{book_id}", response_model=BookRead)
@@ -202,11 +493,12 @@ async def update_book(
     book = await books_service.get_book(session, book_id)
     if book is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found")
-    async with session.begin():
-        if payload.category:
-            await categories_service.create_category(session, payload.category, commit=False)
-        updated = await books_service.update_book(session, book, payload, commit=False)
-    await session.refresh(updated)
+    # get_book already began the transaction: create the category in it and
+    # let update_book commit both together.
+    if payload.category:
+        await next_change_seq(session)
+        await categories_service.create_category(session, payload.category, commit=False)
+    updated = await books_service.update_book(session, book, payload)
     return BookRead.from_model(updated)
 
 
@@ -240,6 +532,38 @@ async def issue_stream_token(
     )
 
 
+@router.get("/{book_id}/search", response_model=List[BookPageHit])
+async def search_book_pages(
+    book_id: uuid.UUID,
+    q: str = Query(..., min_length=1, max_length=255),
+    limit: int = Query(50, ge=1),
+    snippets: int = Query(1, ge=0, le=5, description="Highlighted extracts per page (0 to disable)"),
+    session: AsyncSession = Depends(get_session),
+) -> List[BookPageHit]:
+    """
+    Search inside a book and return the pages of its document where ``q`` occurs.
+    
+    Args:
+        book_id: UUID of the book to search
+        q: Search terms (web search syntax on PostgreSQL)
+        limit: Maximum number of pages, capped server-side at BOOK_SEARCH_MAX_PAGES
+        snippets: Highlighted extracts returned per page
+        session: Database session dependency
+        
+    Returns:
+        Matching pages in reading order; empty if the book has no indexed pages
+        
+    Raises:
+        HTTPException: 404 if book not found
+    """
+    if await books_service.book_version(session, book_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found")
+    hits = await documents_service.search_book_pages(
+        session, book_id, q, limit=min(limit, _MAX_PAGE_HITS), fragments=snippets
+    )
+    return [BookPageHit(page_number=page_number, snippets=extracts) for page_number, extracts in hits]
+
+
 @router.get("/{book_id}/stream")
 async def stream_book_document(
     book_id: uuid.UUID,
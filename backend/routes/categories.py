@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.http_cache import is_not_modified, not_modified, weak_etag
 from ..database import get_session
 from ..dependencies import get_optional_current_user
 from ..models.user import UserRole
@@ -18,7 +19,11 @@ def _require_admin_or_moderator(user) -> None:
 
 
 @router.get("/", response_model=list[category_schema.CategoryRead])
-async def list_categories(session: AsyncSession = Depends(get_session)):
+async def list_categories(request: Request, response: Response, session: AsyncSession = Depends(get_session)):
+    etag = weak_etag(await categories_service.categories_version(session))
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
     items = await categories_service.list_categories(session)
     return [category_schema.CategoryRead(name=name, usage_count=count) for name, count in items]
 
@@ -30,9 +35,44 @@ async def create_category(
     current_user = Depends(get_optional_current_user),
 ):
     _require_admin_or_moderator(current_user)
-    cat = await categories_service.create_category(session, payload.name)
+    await categories_service.create_category(session, payload.name)
     # usage_count is 0 on creation
-    return category_schema.CategoryRead(name=cat.name, usage_count=0)
+    return category_schema.CategoryRead(name=payload.name, usage_count=0)
+
+
+@router.post("/merge", response_model=category_schema.CategoryMoveResult)
+async def merge_categories(
+    payload: category_schema.CategoryMerge,
+    session: AsyncSession = Depends(get_session),
+    current_user = Depends(get_optional_current_user),
+):
+    _require_admin_or_moderator(current_user)
+    result = await categories_service.merge_categories(session, payload.sources, payload.target)
+    if result is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No source category found")
+    moved, removed = result
+    return category_schema.CategoryMoveResult(name=payload.target, books_updated=moved, categories_removed=removed)
+
+
+@router.put("/{name}", response_model=category_schema.CategoryMoveResult)
+async def rename_category(
+    name: str,
+    payload: category_schema.CategoryRename,
+    session: AsyncSession = Depends(get_session),
+    current_user = Depends(get_optional_current_user),
+):
+    _require_admin_or_moderator(current_user)
+    try:
+        moved = await categories_service.rename_category(session, name, payload.name)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    if moved is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
+    return category_schema.CategoryMoveResult(
+        name=payload.name,
+        books_updated=moved,
+        categories_removed=int(payload.name != name),
+    )
 
 
 @router.delete("/{name}", status_code=status.HTTP_204_NO_CONTENT)
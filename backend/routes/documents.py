@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import os
 import uuid
-from typing import List, Optional
+from typing import List, Literal, Optional, Union
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Request, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Request, Response, UploadFile, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -14,8 +14,8 @@ from sqlalchemy.orm import selectinload
 from ..database import get_session
 from ..dependencies import get_current_admin_user
 from ..models.user import User
-from ..schemas.book import BookRead
-from ..schemas.document import DocumentRead
+from ..schemas.book import parse_book_fields, serialize_books
+from ..schemas.document import BookSearchHit, BookSummarySearchHit, DocumentRead
 from ..models.document import Document
 from ..models.book import Book
 from ..services import books as books_service
@@ -26,6 +26,8 @@ router = APIRouter(prefix="/documents", tags=["documents"])
 
 _UPLOAD_CHUNK_SIZE = 1024 * 1024
 _MAX_UPLOAD_SIZE = int(os.getenv("PDF_UPLOAD_MAX_BYTES", str(60 * 1024 * 1024)))
+_SEARCH_PAGE_SIZE = int(os.getenv("SEARCH_PAGE_SIZE", "20"))
+_SEARCH_MAX_PAGE_SIZE = int(os.getenv("SEARCH_MAX_PAGE_SIZE", "100"))
 
 
 def _public_base_url(request: Request) -> str:
@@ -106,7 +108,8 @@ async def upload_document(
         with destination.open("wb") as buffer:
             buffer.write(file_content)
         
-        content_text = documents_service.extract_pdf_text(destination)
+        pages = documents_service.extract_pdf_pages(destination)
+        content_text = documents_service.join_pages(pages)
     except Exception as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, 
@@ -125,6 +128,7 @@ async def upload_document(
                 book=book,
                 filename=stored_name,
                 content_text=content_text,
+                pages=pages,
                 commit=False,
             )
             
@@ -141,19 +145,64 @@ async def upload_document(
     except Exception:
         raise
 
+    await books_service.invalidate_catalog_cache()
     await session.refresh(document)
     return DocumentRead.from_model(document)
 
 
-@router.get("/search", response_model=List[BookRead])
+@router.get(
+    "/search",
+    response_model=List[Union[BookSearchHit, BookSummarySearchHit]],
+    response_model_exclude_unset=True,
+)
 async def search_documents(
+    response: Response,
     query: str = Query(..., min_length=1, max_length=255),
+    limit: int = Query(_SEARCH_PAGE_SIZE, ge=1),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated BookRead fields to return"),
+    view: Literal["full", "summary"] = "full",
+    snippets: int = Query(
+        documents_service.SNIPPET_FRAGMENTS, ge=0, le=10, description="Highlighted extracts per book (0 to disable)"
+    ),
     session: AsyncSession = Depends(get_session),
-) -> List[BookRead]:
-    """Return books whose indexed documents contain the provided term."""
+) -> List[Union[BookSearchHit, BookSummarySearchHit]]:
+    """Return one page of books whose indexed documents contain the provided term, best match first.
+
+    Pages hold at most ``limit`` books (capped at SEARCH_MAX_PAGE_SIZE), ordered
+    by rank then id; X-Next-Cursor points to the next page. The first page also
+    carries X-Total-Count, exact up to SEARCH_EXACT_COUNT_LIMIT and estimated
+    beyond it, with X-Total-Count-Exact telling which. ``fields``/``view=summary``
+    project only the requested book columns. Each book carries up to
+    ``snippets`` highlighted extracts and the numbers of its matching pages,
+    both looked up only for the page returned.
+    """
 
-    books = await documents_service.search_books_by_query(session, query)
-    return [BookRead.from_model(book) for book in books]
+    try:
+        selected = parse_book_fields(fields, view)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    try:
+        books, next_cursor = await documents_service.search_books_page(
+            session, query, limit=min(limit, _SEARCH_MAX_PAGE_SIZE), cursor=cursor, fields=selected
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    if cursor is None:
+        total, exact = await documents_service.count_search_hits(session, query)
+        response.headers["X-Total-Count"] = str(total)
+        response.headers["X-Total-Count-Exact"] = "true" if exact else "false"
+    extracts = await documents_service.document_snippets(
+        session, query, [book.id for book in books], fragments=snippets
+    )
+    pages = await documents_service.matching_pages(session, query, [book.id for book in books])
+    hit_model = BookSummarySearchHit if selected else BookSearchHit
+    return [
+        hit_model(**item.model_dump(exclude_unset=True), snippets=extracts[book.id], pages=pages[book.id])
+        for book, item in zip(books, serialize_books(books, selected))
+    ]
 
 
 @router.post("/regenerate_thumbnails")
@@ -213,5 +262,6 @@ async def regenerate_thumbnails(
 
     if updated:
         await session.commit()
+        await books_service.invalidate_catalog_cache()
 
     return {"processed": processed, "updated": updated, "skipped": skipped}
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.http_cache import is_not_modified, not_modified, weak_etag
+from ..database import get_session
+from ..schemas.home import HomeSnapshot
+from ..services import home as home_service
+
+router = APIRouter(prefix="/home", tags=["home"])
+
+
+@router.get("", response_model=HomeSnapshot)
+async def read_home(request: Request, session: AsyncSession = Depends(get_session)):
+    """Return every home page shelf in one response, from the precomputed snapshot."""
+    snapshot = await home_service.get_home_snapshot(session)
+    etag = weak_etag("home", snapshot["generated_at"])
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    return JSONResponse(content=snapshot, headers={"ETag": etag})
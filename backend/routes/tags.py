@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import get_session
+from ..schemas import tag as tag_schema
+from ..services import tags as tags_service
+
+router = APIRouter(prefix="/tags", tags=["tags"])
+
+
+@router.get("/", response_model=list[tag_schema.TagRead])
+async def list_tags(
+    prefix: Optional[str] = Query(None, max_length=128),
+    limit: int = Query(100, ge=1, le=1000),
+    session: AsyncSession = Depends(get_session),
+):
+    items = await tags_service.list_tags(session, prefix=prefix, limit=limit)
+    return [tag_schema.TagRead(name=name, usage_count=count) for name, count in items]
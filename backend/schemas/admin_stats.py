@@ -35,4 +35,12 @@ class CountsResponse(BaseModel):
     """Aggregated counts for the admin dashboard."""
     users: int
     books: int
-    categories: int
\ No newline at end of file
+    categories: int
+
+class CacheStatsResponse(BaseModel):
+    """Hit/miss counters of the in-process catalog cache (current worker only)."""
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+    ttl_seconds: float
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import uuid
+
+from pydantic import BaseModel
+
+
+class AuthorRead(BaseModel):
+    id: uuid.UUID
+    name: str
+    book_count: int
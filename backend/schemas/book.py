@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated, Any, List, Mapping, Optional, Sequence, Tuple
 
 from pydantic import BaseModel, Field, AnyUrl
 try:  # Pydantic v2 support
@@ -14,6 +14,9 @@ except Exception:  # pragma: no cover
 
 from ..models.book import Language
 
+# Bounded like book_tags.tag, so an oversized tag is a 422 rather than a database error
+Tag = Annotated[str, Field(max_length=128)]
+
 
 class BookBase(BaseModel):
     title: str = Field(..., max_length=500)
@@ -23,7 +26,7 @@ class BookBase(BaseModel):
     # Auto-generated preview of the PDF if available
     thumbnail_path: Optional[AnyUrl] = None
     category: str = Field(..., max_length=128)
-    tags: List[str] = Field(default_factory=list)
+    tags: List[Tag] = Field(default_factory=list)
     language: Language
 
 
@@ -31,6 +34,26 @@ class BookCreate(BookBase):
     pass
 
 
+class BookImportRow(BookBase):
+    """One row of a bulk import; rows carrying an existing ``id`` update that book."""
+
+    id: Optional[uuid.UUID] = None
+    pdf_url: str
+
+
+class BookImportError(BaseModel):
+    line: int
+    error: str
+
+
+class BookImportReport(BaseModel):
+    """Outcome of ``POST /books/import``: counts plus one entry per rejected row."""
+
+    imported: int
+    failed: int
+    errors: List[BookImportError]
+
+
 class BookUpdate(BaseModel):
     title: Optional[str] = None
     author: Optional[str] = None
@@ -38,7 +61,7 @@ class BookUpdate(BaseModel):
     cover_image_url: Optional[AnyUrl] = None
     thumbnail_path: Optional[AnyUrl] = None
     category: Optional[str] = None
-    tags: Optional[List[str]] = None
+    tags: Optional[List[Tag]] = None
     language: Optional[Language] = None
 
 
@@ -55,7 +78,9 @@ class BookRead(BookBase):
             orm_mode = True
 
     @classmethod
-    def from_model(cls, book: object) -> "BookRead":
+    def from_model(cls, book: object, *, has_document: Optional[bool] = None) -> "BookRead":
+        if has_document is None:
+            has_document = bool(getattr(book, "has_documents", False))
         data = {
             "id": getattr(book, "id"),
             "title": getattr(book, "title"),
@@ -68,11 +93,122 @@ class BookRead(BookBase):
             "language": getattr(book, "language"),
             "created_at": getattr(book, "created_at"),
             "updated_at": getattr(book, "updated_at"),
-            "has_document": bool(getattr(book, "has_documents", False) or getattr(book, "documents", [])),
-            "stream_endpoint": (
-                f"/books/{getattr(book, 'id')}/stream" if bool(getattr(book, "documents", [])) else None
-            ),
+            "has_document": has_document,
+            "stream_endpoint": f"/books/{getattr(book, 'id')}/stream" if has_document else None,
         }
         if hasattr(cls, "model_validate"):
             return cls.model_validate(data)  # type: ignore[attr-defined]
         return cls(**data)
+
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+
+class BookFacets(BaseModel):
+    """Book counts per facet value for a filter set (authors limited to the top N)."""
+
+    category: List[FacetCount]
+    language: List[FacetCount]
+    author: List[FacetCount]
+
+
+class BookBulkSelection(BaseModel):
+    """Books targeted by a bulk operation: explicit ids and/or catalog filters (ANDed)."""
+
+    ids: Optional[List[uuid.UUID]] = None
+    category: Optional[List[str]] = None
+    author: Optional[List[str]] = None
+    language: Optional[List[Language]] = None
+    tag: Optional[List[str]] = None
+    author_id: Optional[List[uuid.UUID]] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+
+
+class BookBulkUpdate(BookBulkSelection):
+    changes: BookUpdate
+
+
+class BookBulkResult(BaseModel):
+    matched: int
+
+
+class BookChanges(BaseModel):
+    """One page of catalog changes for delta sync clients."""
+
+    books: List[BookRead]
+    deleted: List[uuid.UUID]
+    sync_token: str
+    has_more: bool
+
+
+class BookBatchRequest(BaseModel):
+    """Ids to resolve in one ``POST /books/batch`` call."""
+
+    ids: List[uuid.UUID]
+
+
+# Fields a client may request through ``fields=``; ``view=summary`` is a preset.
+BOOK_FIELDS: Tuple[str, ...] = tuple(BookRead.model_fields) if _PYDANTIC_V2 else tuple(BookRead.__fields__)
+BOOK_SUMMARY_FIELDS: Tuple[str, ...] = ("id", "title", "author", "thumbnail_path", "language")
+
+
+def parse_book_fields(fields: Optional[str], view: str = "full") -> Optional[Tuple[str, ...]]:
+    """Resolve ``fields``/``view`` query parameters into a field selection.
+
+    Returns None when the full representation is requested.
+
+    Raises:
+        ValueError: if an unknown field is requested
+    """
+    if fields:
+        selected = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+        unknown = [f for f in selected if f not in BOOK_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        return selected or None
+    if view == "summary":
+        return BOOK_SUMMARY_FIELDS
+    return None
+
+
+class BookSummary(BaseModel):
+    """Sparse book representation; only the selected fields are serialized."""
+
+    id: Optional[uuid.UUID] = None
+    title: Optional[str] = None
+    author: Optional[str] = None
+    description: Optional[str] = None
+    cover_image_url: Optional[AnyUrl] = None
+    thumbnail_path: Optional[AnyUrl] = None
+    category: Optional[str] = None
+    tags: Optional[List[str]] = None
+    language: Optional[Language] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    has_document: Optional[bool] = None
+    stream_endpoint: Optional[str] = None
+
+    @classmethod
+    def from_row(cls, row: Any, fields: Sequence[str]) -> "BookSummary":
+        """Build from a projected row (see services.books.book_columns)."""
+        mapping: Mapping[str, Any] = row._mapping
+        data = {name: mapping[name] for name in fields if name in mapping}
+        if "has_document" in data:
+            data["has_document"] = bool(data["has_document"])
+        if "tags" in data:
+            data["tags"] = list(data["tags"] or [])
+        if "stream_endpoint" in fields:
+            data["stream_endpoint"] = f"/books/{mapping['id']}/stream" if mapping["has_document"] else None
+        if hasattr(cls, "model_validate"):
+            return cls.model_validate(data)  # type: ignore[attr-defined]
+        return cls(**data)
+
+
+def serialize_books(items: Sequence[Any], selected: Optional[Sequence[str]]) -> List[BaseModel]:
+    """Serialize ORM books, or projected rows when a field selection is active."""
+    if selected:
+        return [BookSummary.from_row(row, selected) for row in items]
+    return [BookRead.from_model(book) for book in items]
@@ -10,3 +10,18 @@ class CategoryCreate(BaseModel):
 class CategoryRead(BaseModel):
     name: str
     usage_count: int
+
+
+class CategoryRename(BaseModel):
+    name: str = Field(min_length=1, max_length=128)
+
+
+class CategoryMerge(BaseModel):
+    sources: list[str] = Field(min_length=1)
+    target: str = Field(min_length=1, max_length=128)
+
+
+class CategoryMoveResult(BaseModel):
+    name: str
+    books_updated: int
+    categories_removed: int
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from .book import BookRead, BookSummary
+
 try:  # Pydantic v2
     from pydantic import ConfigDict  # type: ignore
     _PYDANTIC_V2 = True
@@ -44,6 +47,27 @@ class DocumentSearchResult(BaseModel):
     snippet: str = Field(..., description="Extract of the matching content")
 
 
+class BookSearchHit(BookRead):
+    """Book matched by document search, with extracts explaining the match."""
+
+    snippets: List[str] = Field(default_factory=list, description="HTML-escaped extracts, matches wrapped in <mark>")
+    pages: List[int] = Field(default_factory=list, description="Matching page numbers of the primary document")
+
+
+class BookSummarySearchHit(BookSummary):
+    """Sparse variant of ``BookSearchHit`` for ``fields``/``view=summary`` searches."""
+
+    snippets: Optional[List[str]] = None
+    pages: Optional[List[int]] = None
+
+
+class BookPageHit(BaseModel):
+    """Page of a book's document matching an in-book search."""
+
+    page_number: int = Field(..., ge=1, description="1-based page number in the PDF")
+    snippets: List[str] = Field(default_factory=list, description="HTML-escaped extracts, matches wrapped in <mark>")
+
+
 class DocumentStreamToken(BaseModel):
     """Token payload returned when requesting access to a protected document stream."""
 
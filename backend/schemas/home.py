@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel
+
+from .book import BookSummary
+
+
+class CategoryShelf(BaseModel):
+    category: str
+    book_count: int
+    books: List[BookSummary]
+
+
+class HomeStats(BaseModel):
+    books: int
+    categories: int
+    authors: int
+
+
+class HomeSnapshot(BaseModel):
+    """Everything the home page shows, computed in one pass and served from memory."""
+
+    generated_at: datetime
+    recent: List[BookSummary]
+    popular: List[BookSummary]
+    categories: List[CategoryShelf]
+    stats: HomeStats
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class TagRead(BaseModel):
+    name: str
+    usage_count: int
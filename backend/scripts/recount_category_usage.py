@@ -0,0 +1,26 @@
+"""Maintenance script rebuilding categories.usage_count from the books table.
+
+Usage:
+  - Ensure the backend environment is configured (DATABASE_URL, etc.)
+  - Run with: uv run python -m backend.scripts.recount_category_usage  (or python -m ... inside the backend venv)
+
+The counters are maintained by every book write; run this after editing books
+outside the API (manual SQL, restored dumps) to bring them back in line.
+"""
+from __future__ import annotations
+
+import asyncio
+
+from ..database import async_session_factory
+from ..services.categories import list_categories, recount_category_usage
+
+
+async def main() -> None:
+    async with async_session_factory() as session:
+        await recount_category_usage(session)
+        items = await list_categories(session)
+    print(f"Recounted usage of {len(items)} categories.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,115 @@
+"""Author projection maintenance and browsing queries."""
+
+from __future__ import annotations
+
+import unicodedata
+import uuid
+from collections import Counter
+from typing import Iterable, Mapping, Optional, Tuple
+
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import dialect_insert
+from ..models.author import Author
+from .pagination import decode_cursor, encode_cursor
+
+
+def normalize_author(name: str) -> str:
+    """Return the case-insensitive identity of an author name (matches ``lower(books.author)``)."""
+    return name.lower()
+
+
+def author_sort_key(name: str) -> str:
+    """Return the accent- and case-insensitive key authors are ordered and prefix-matched by."""
+    decomposed = unicodedata.normalize("NFKD", name.strip().lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def author_deltas(added: Iterable[str] = (), removed: Iterable[str] = ()) -> Counter:
+    """Build the per-name count changes for books gaining ``added`` and losing ``removed`` authors."""
+    deltas: Counter = Counter(added)
+    deltas.subtract(removed)
+    return deltas
+
+
+async def adjust_author_counts(session: AsyncSession, deltas: Mapping[str, int]) -> None:
+    """
+    Apply book count changes to the author projection (without committing).
+    
+    Missing authors are created and counts are incremented in one
+    INSERT ... ON CONFLICT statement; authors left without books are removed.
+    
+    Args:
+        session: Database session
+        deltas: Count change per author name (as written on books)
+    """
+    merged: dict[str, dict] = {}
+    for name, delta in deltas.items():
+        key = normalize_author(name)
+        row = merged.setdefault(
+            key,
+            {"id": uuid.uuid4(), "name": name, "normalized": key, "sort_key": author_sort_key(name), "book_count": 0},
+        )
+        row["book_count"] += delta
+    rows = [row for row in merged.values() if row["book_count"]]
+    if not rows:
+        return
+    stmt = dialect_insert(session, Author)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["normalized"],
+        set_={"book_count": Author.book_count + stmt.excluded.book_count},
+    )
+    await session.execute(stmt, rows)
+    if any(row["book_count"] < 0 for row in rows):
+        await session.execute(
+            delete(Author).where(
+                Author.normalized.in_([row["normalized"] for row in rows if row["book_count"] < 0]),
+                Author.book_count <= 0,
+            )
+        )
+
+
+async def list_authors(
+    session: AsyncSession,
+    *,
+    prefix: Optional[str] = None,
+    query: Optional[str] = None,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Tuple[list[Author], Optional[str]]:
+    """
+    Return one page of authors in sort-key order.
+    
+    Args:
+        session: Database session
+        prefix: Optional name prefix (accent- and case-insensitive)
+        query: Optional substring of the name (served by a trigram index on PostgreSQL)
+        limit: Page size
+        cursor: Opaque cursor returned with the previous page
+        
+    Returns:
+        Tuple of (authors, next_cursor); next_cursor is None on the last page
+        
+    Raises:
+        ValueError: if the cursor is malformed
+    """
+    stmt = select(Author)
+    if prefix:
+        stmt = stmt.where(Author.sort_key.startswith(author_sort_key(prefix), autoescape=True))
+    if query:
+        stmt = stmt.where(Author.sort_key.contains(author_sort_key(query), autoescape=True))
+    if cursor:
+        sort_key, author_id = decode_cursor(cursor, size=2)
+        try:
+            after = (str(sort_key), uuid.UUID(author_id))
+        except (TypeError, ValueError) as exc:
+            raise ValueError("Invalid cursor") from exc
+        stmt = stmt.where(tuple_(Author.sort_key, Author.id) > tuple_(*after))
+    stmt = stmt.order_by(Author.sort_key, Author.id).limit(limit + 1)
+    authors = list((await session.execute(stmt)).scalars().all())
+    next_cursor = None
+    if len(authors) > limit:
+        authors = authors[:limit]
+        next_cursor = encode_cursor([authors[-1].sort_key, authors[-1].id])
+    return authors, next_cursor
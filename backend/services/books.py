@@ -2,15 +2,85 @@
 
 from __future__ import annotations
 
+import os
 import uuid
-from typing import List, Optional
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
-from sqlalchemy import select
+from sqlalchemy import String, case, cast, delete, func, insert, literal, or_, select, tuple_, union_all, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
+from ..models.author import Author
 from ..models.book import Book
-from ..schemas.book import BookCreate, BookUpdate
+from ..models.book_tag import BookTag
+from ..models.book_tombstone import BookTombstone
+from ..models.document import SEARCH_CONFIGS, Document
+from ..models.document_page import DocumentPage
+from ..schemas.book import BookCreate, BookUpdate, serialize_books
+from . import invalidation
+from .authors import adjust_author_counts, author_deltas
+from .cache import TTLCache
+from .categories import adjust_category_usage, create_category
+from .changes import next_change_seq
+from .pagination import decode_cursor, encode_cursor
+from .tags import adjust_tag_counts, delete_book_tags, replace_book_tags
+
+# Serialized BookRead/BookSummary payloads keyed by query; cleared on every catalog write
+catalog_cache = TTLCache(
+    maxsize=int(os.getenv("CATALOG_CACHE_MAX_ENTRIES", "512")),
+    ttl=float(os.getenv("CATALOG_CACHE_TTL_SECONDS", "300")),
+)
+
+
+invalidation.subscribe(invalidation.CATALOG, catalog_cache.clear)
+
+
+async def invalidate_catalog_cache() -> None:
+    """Drop cached catalog payloads in every worker. Call after any committed book/document write."""
+    await invalidation.publish(invalidation.CATALOG)
+
+
+# Column backing each selectable BookRead field
+_FIELD_COLUMNS = {
+    "id": Book.id,
+    "title": Book.title,
+    "author": Book.author,
+    "description": Book.description,
+    "cover_image_url": Book.cover_image_url,
+    "thumbnail_path": Book.thumbnail_path,
+    "category": Book.category,
+    "tags": Book.tags,
+    "language": Book.language,
+    "created_at": Book.created_at,
+    "updated_at": Book.updated_at,
+    "has_document": Book.has_documents,
+}
+# Fields computed from other columns rather than read directly
+_DERIVED_FIELDS = {"stream_endpoint": ("id", "has_document")}
+
+
+def book_columns(fields: Sequence[str], *, extra: Sequence[str] = ()) -> list:
+    """
+    Return labeled columns projecting only what ``fields`` needs.
+    
+    The keyset key (created_at, id) is always included so projected rows can
+    still produce pagination cursors; ``extra`` adds further columns (e.g. the
+    active sort key).
+    
+    Args:
+        fields: BookRead field names (see schemas.book.BOOK_FIELDS)
+        extra: Additional field names needed internally
+        
+    Returns:
+        List of labeled column expressions for select()
+    """
+    names = {"id", "created_at", *extra}
+    for field in fields:
+        names.update(_DERIVED_FIELDS.get(field, (field,)))
+    return [column.label(name) for name, column in _FIELD_COLUMNS.items() if name in names]
 
 
 def _schema_to_data(schema_obj, *, exclude_unset: bool = False) -> dict:
@@ -31,74 +101,790 @@ def _schema_to_data(schema_obj, *, exclude_unset: bool = False) -> dict:
     return schema_obj.dict(exclude_unset=exclude_unset)
 
 
+def _as_tuple(value: Union[str, Sequence[str], None]) -> Tuple[str, ...]:
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        return (value,) if value else ()
+    return tuple(v for v in value if v)
+
+
+@dataclass(frozen=True)
+class BookFilters:
+    """
+    Catalog filters shared by listings, facet counts and cache keys.
+    
+    Multi-valued filters match any of their values; author matching is
+    case-insensitive (served by the lower(author) index) and tags are matched
+    through the book_tags index.
+    """
+
+    category: Tuple[str, ...] = ()
+    author: Tuple[str, ...] = ()
+    language: Tuple[str, ...] = ()
+    tag: Tuple[str, ...] = ()
+    author_id: Tuple[uuid.UUID, ...] = ()
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        category: Union[str, Sequence[str], None] = None,
+        author: Union[str, Sequence[str], None] = None,
+        language: Union[str, Sequence[str], None] = None,
+        tag: Union[str, Sequence[str], None] = None,
+        author_id: Optional[Sequence[uuid.UUID]] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> "BookFilters":
+        """Normalize single values, lists and None into a hashable filter set."""
+        return cls(
+            category=_as_tuple(category),
+            author=tuple(a.lower() for a in _as_tuple(author)),
+            language=_as_tuple(language),
+            tag=_as_tuple(tag),
+            author_id=tuple(author_id or ()),
+            created_after=created_after,
+            created_before=created_before,
+        )
+
+    def criteria(self) -> list:
+        """Return the WHERE clauses of this filter set."""
+        clauses = []
+        if self.category:
+            clauses.append(Book.category.in_(self.category))
+        if self.author:
+            clauses.append(func.lower(Book.author).in_(self.author))
+        if self.language:
+            clauses.append(Book.language.in_(self.language))
+        if self.author_id:
+            # Matched through lower(author), like the author filter
+            normalized = select(Author.normalized).where(Author.id.in_(self.author_id))
+            clauses.append(func.lower(Book.author).in_(normalized))
+        if self.tag:
+            clauses.append(Book.id.in_(select(BookTag.book_id).where(BookTag.tag.in_(self.tag))))
+        if self.created_after is not None:
+            clauses.append(Book.created_at >= self.created_after)
+        if self.created_before is not None:
+            clauses.append(Book.created_at < self.created_before)
+        return clauses
+
+    def apply(self, q):
+        """Add the WHERE clauses of this filter set to ``q``."""
+        return q.where(*self.criteria())
+
+
+# Sort name -> (field, descending); ties are always broken by id in the same direction
+SORTS = {
+    "-created_at": ("created_at", True),
+    "created_at": ("created_at", False),
+    "title": ("title", False),
+    "author": ("author", False),
+}
+DEFAULT_SORT = "-created_at"
+
+
 async def list_books(
     session: AsyncSession,
+    filters: Optional[BookFilters] = None,
     *,
-    category: Optional[str] = None,
-    author: Optional[str] = None,
-    language: Optional[str] = None,
-) -> List[Book]:
+    category: Union[str, Sequence[str], None] = None,
+    author: Union[str, Sequence[str], None] = None,
+    language: Union[str, Sequence[str], None] = None,
+    sort: str = DEFAULT_SORT,
+    limit: Optional[int] = None,
+    after: Optional[Tuple[Any, uuid.UUID]] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> List[Any]:
     """
-    Retrieve books with optional filtering.
+    Retrieve books with optional filtering and sorting (newest first by default).
     
     Args:
         session: Database session
-        category: Optional category filter
-        author: Optional author filter  
-        language: Optional language filter
+        filters: Filter set; when omitted it is built from category/author/language
+        category: Optional category filter (one value or several)
+        author: Optional author filter, case-insensitive (one value or several)
+        language: Optional language filter (one value or several)
+        sort: One of SORTS
+        limit: Optional maximum number of rows
+        after: Optional (sort value, id) key; only rows sorting after it are returned
+        fields: Optional field selection; rows are projected with book_columns()
         
     Returns:
-        List of books matching criteria
+        List of books (or projected rows when ``fields`` is given) matching criteria
     """
-    q = select(Book)
-    if category:
-        q = q.where(Book.category == category)
-    if author:
-        q = q.where(Book.author == author)
-    if language:
-        q = q.where(Book.language == language)
+    if filters is None:
+        filters = BookFilters.build(category=category, author=author, language=language)
+    sort_field, descending = SORTS[sort]
+    sort_column = _FIELD_COLUMNS[sort_field]
+    q = select(*book_columns(fields, extra=(sort_field,))) if fields else select(Book)
+    q = filters.apply(q)
+    if after is not None:
+        # Row-value comparison lets the planner seek the (sort key, id) index directly
+        key = tuple_(sort_column, Book.id)
+        q = q.where(key < tuple_(*after) if descending else key > tuple_(*after))
+    if descending:
+        q = q.order_by(sort_column.desc(), Book.id.desc())
+    else:
+        q = q.order_by(sort_column.asc(), Book.id.asc())
+    if limit is not None:
+        q = q.limit(limit)
     result = await session.execute(q)
-    return result.scalars().all()
+    return result.all() if fields else result.scalars().all()
+
+
+def _decode_book_cursor(cursor: str, sort: str) -> Tuple[Any, uuid.UUID]:
+    cursor_sort, value, book_id = decode_cursor(cursor, size=3)
+    if cursor_sort != sort:
+        raise ValueError("Cursor does not match the requested sort")
+    try:
+        if SORTS[sort][0] == "created_at":
+            value = datetime.fromisoformat(value)
+        elif not isinstance(value, str):
+            raise TypeError("Invalid cursor value")
+        return value, uuid.UUID(book_id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
 
 
-async def get_book(session: AsyncSession, book_id: uuid.UUID) -> Optional[Book]:
+async def list_books_page(
+    session: AsyncSession,
+    filters: Optional[BookFilters] = None,
+    *,
+    limit: int,
+    cursor: Optional[str] = None,
+    sort: str = DEFAULT_SORT,
+    fields: Optional[Sequence[str]] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Retrieve one page of books using keyset pagination.
+    
+    Args:
+        session: Database session
+        filters: Optional filter set
+        limit: Page size
+        cursor: Opaque cursor returned with the previous page (same sort)
+        sort: One of SORTS
+        fields: Optional field selection passed through to list_books
+        
+    Returns:
+        Tuple of (books, next_cursor); next_cursor is None on the last page
+        
+    Raises:
+        ValueError: if the cursor is malformed or was issued for another sort
+    """
+    after = _decode_book_cursor(cursor, sort) if cursor else None
+    books = await list_books(
+        session,
+        filters or BookFilters(),
+        sort=sort,
+        limit=limit + 1,
+        after=after,
+        fields=fields,
+    )
+    next_cursor = None
+    if len(books) > limit:
+        books = books[:limit]
+        last = books[-1]
+        next_cursor = encode_cursor([sort, getattr(last, SORTS[sort][0]), last.id])
+    return books, next_cursor
+
+
+async def get_book(
+    session: AsyncSession,
+    book_id: uuid.UUID,
+    *,
+    fields: Optional[Sequence[str]] = None,
+) -> Optional[Any]:
     """
     Retrieve a book by ID.
     
     Args:
         session: Database session
         book_id: Book UUID
+        fields: Optional field selection; returns a projected row instead of a Book
         
     Returns:
-        Book instance or None if not found
+        Book instance (or projected row) or None if not found
     """
+    if fields:
+        result = await session.execute(select(*book_columns(fields)).where(Book.id == book_id))
+        return result.one_or_none()
     result = await session.execute(select(Book).where(Book.id == book_id))
     return result.scalar_one_or_none()
 
 
+BATCH_MAX_IDS = int(os.getenv("BOOKS_BATCH_MAX_IDS", "500"))
+
+
+async def get_books_by_ids(
+    session: AsyncSession,
+    book_ids: Sequence[uuid.UUID],
+    *,
+    fields: Optional[Sequence[str]] = None,
+) -> dict:
+    """
+    Resolve many books with a single ``IN`` query.
+    
+    Args:
+        session: Database session
+        book_ids: Requested ids (duplicates are collapsed)
+        fields: Optional field selection; rows are projected with book_columns()
+        
+    Returns:
+        Mapping of every requested id, in request order, to its serialized
+        book or None when no such book exists
+        
+    Raises:
+        ValueError: if more than BATCH_MAX_IDS distinct ids are requested
+    """
+    wanted = list(dict.fromkeys(book_ids))
+    if len(wanted) > BATCH_MAX_IDS:
+        raise ValueError(f"At most {BATCH_MAX_IDS} ids can be requested at once")
+    found: dict = {}
+    if wanted:
+        q = select(*book_columns(fields)) if fields else select(Book)
+        result = await session.execute(q.where(Book.id.in_(wanted)))
+        items = result.all() if fields else result.scalars().all()
+        found = {item.id: payload for item, payload in zip(items, _dump_books(items, fields))}
+    return {str(book_id): found.get(book_id) for book_id in wanted}
+
+
+def _dump_books(items: Sequence[Any], fields: Optional[Sequence[str]]) -> List[dict]:
+    return [_schema_to_data(model, exclude_unset=True) for model in serialize_books(items, fields)]
+
+
+async def list_book_payloads(
+    session: AsyncSession,
+    filters: Optional[BookFilters] = None,
+    *,
+    limit: int,
+    cursor: Optional[str] = None,
+    sort: str = DEFAULT_SORT,
+    fields: Optional[Sequence[str]] = None,
+    version: tuple = (),
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    Cached variant of list_books_page returning JSON-ready payloads.
+    
+    Args:
+        session: Database session
+        filters: Optional filter set
+        limit: Page size
+        cursor: Opaque cursor returned with the previous page
+        sort: One of SORTS
+        fields: Optional field selection
+        version: catalog_version() fingerprint; part of the key so a cached
+            page never outlives a write made by another process
+        
+    Returns:
+        Tuple of (serialized books, next_cursor)
+        
+    Raises:
+        ValueError: if the cursor is malformed
+    """
+    filters = filters or BookFilters()
+    key = ("list", version, filters, sort, limit, cursor, tuple(fields) if fields else None)
+    cached = catalog_cache.get(key)
+    if cached is not None:
+        return cached
+    books, next_cursor = await list_books_page(
+        session,
+        filters,
+        limit=limit,
+        cursor=cursor,
+        sort=sort,
+        fields=fields,
+    )
+    page = (_dump_books(books, fields), next_cursor)
+    catalog_cache.set(key, page)
+    return page
+
+
+async def get_book_payload(
+    session: AsyncSession,
+    book_id: uuid.UUID,
+    *,
+    fields: Optional[Sequence[str]] = None,
+    version: tuple = (),
+) -> Optional[dict]:
+    """
+    Cached variant of get_book returning a JSON-ready payload.
+    
+    Args:
+        session: Database session
+        book_id: Book UUID
+        fields: Optional field selection
+        version: book_version() fingerprint, part of the cache key
+        
+    Returns:
+        Serialized book or None if not found (misses are not cached)
+    """
+    key = ("detail", version, book_id, tuple(fields) if fields else None)
+    cached = catalog_cache.get(key)
+    if cached is not None:
+        return cached
+    book = await get_book(session, book_id, fields=fields)
+    if book is None:
+        return None
+    payload = _dump_books([book], fields)[0]
+    catalog_cache.set(key, payload)
+    return payload
+
+
+FACETS = ("category", "language", "author")
+
+
+def facets_statement(dialect_name: str, filters: Optional[BookFilters] = None, *, top_authors: int = 10):
+    """
+    Build the single statement returning facet count rows.
+    
+    PostgreSQL scans books once with GROUPING SETS and trims authors to the
+    top N with a window function; other dialects use an equivalent UNION ALL.
+    
+    Args:
+        dialect_name: SQLAlchemy dialect name of the bound engine
+        filters: Optional filter set
+        top_authors: Number of authors to keep, by descending count
+        
+    Returns:
+        Selectable yielding (category, language, author, count) rows on
+        PostgreSQL and (facet, value, count) rows elsewhere
+    """
+    filters = filters or BookFilters()
+    if dialect_name == "postgresql":
+        grouped = filters.apply(
+            select(
+                Book.category,
+                cast(Book.language, String).label("language"),
+                Book.author,
+                func.count().label("count"),
+            )
+        ).group_by(
+            func.grouping_sets(tuple_(Book.category), tuple_(Book.language), tuple_(Book.author))
+        ).subquery()
+        ranked = select(
+            grouped,
+            func.row_number().over(
+                partition_by=grouped.c.author.is_(None),
+                order_by=(grouped.c["count"].desc(), grouped.c.author),
+            ).label("rank"),
+        ).subquery()
+        # The facet of each row is the one non-null grouping column (all are NOT NULL)
+        return select(
+            ranked.c.category, ranked.c.language, ranked.c.author, ranked.c["count"]
+        ).where(or_(ranked.c.author.is_(None), ranked.c.rank <= top_authors))
+
+    def _member(name: str, column, limit: Optional[int] = None):
+        q = filters.apply(
+            select(literal(name).label("facet"), cast(column, String).label("value"), func.count().label("count"))
+        ).group_by(column)
+        if limit is not None:
+            q = q.order_by(func.count().desc(), column).limit(limit)
+        return select(q.subquery())
+
+    return union_all(
+        _member("category", Book.category),
+        _member("language", Book.language),
+        _member("author", Book.author, top_authors),
+    )
+
+
+async def facet_counts(
+    session: AsyncSession,
+    filters: Optional[BookFilters] = None,
+    *,
+    top_authors: int = 10,
+    version: tuple = (),
+) -> dict:
+    """
+    Count books per category, language and top-N authors for a filter set.
+    
+    Results are cached in the catalog cache per filter combination.
+    
+    Args:
+        session: Database session
+        filters: Optional filter set
+        top_authors: Number of authors to return
+        version: catalog_version() fingerprint; part of the key so cached
+            counts never outlive a write made by another process
+        
+    Returns:
+        Mapping of facet name to a list of {"value", "count"} dicts, most frequent first
+    """
+    filters = filters or BookFilters()
+    key = ("facets", version, filters, top_authors)
+    cached = catalog_cache.get(key)
+    if cached is not None:
+        return cached
+    dialect_name = session.bind.dialect.name
+    stmt = facets_statement(dialect_name, filters, top_authors=top_authors)
+    facets: dict = {name: [] for name in FACETS}
+    for row in (await session.execute(stmt)).mappings():
+        if dialect_name == "postgresql":
+            name = next(n for n in FACETS if row[n] is not None)
+            value = row[name]
+        else:
+            name, value = row["facet"], row["value"]
+        facets[name].append({"value": value, "count": int(row["count"])})
+    for items in facets.values():
+        items.sort(key=lambda item: (-item["count"], item["value"]))
+    catalog_cache.set(key, facets)
+    return facets
+
+
+async def catalog_version(session: AsyncSession) -> tuple:
+    """
+    Return a cheap fingerprint of the whole catalog for ETag computation.
+    
+    Any book insert, update or delete and any document upload changes at
+    least one component. All four aggregates run in a single round trip.
+    
+    Args:
+        session: Database session
+        
+    Returns:
+        Tuple of (book count, latest book update, document count, latest upload)
+    """
+    stmt = select(
+        select(func.count()).select_from(Book).scalar_subquery(),
+        select(func.max(Book.updated_at)).scalar_subquery(),
+        select(func.count()).select_from(Document).scalar_subquery(),
+        select(func.max(Document.uploaded_at)).scalar_subquery(),
+    )
+    return tuple((await session.execute(stmt)).one())
+
+
+async def book_version(session: AsyncSession, book_id: uuid.UUID) -> Optional[tuple]:
+    """
+    Return a fingerprint of a single book for ETag computation.
+    
+    Args:
+        session: Database session
+        book_id: Book UUID
+        
+    Returns:
+        Tuple of (updated_at, has_documents) or None if the book does not exist
+    """
+    result = await session.execute(select(Book.updated_at, Book.has_documents).where(Book.id == book_id))
+    row = result.one_or_none()
+    return tuple(row) if row is not None else None
+
+
+def _encode_sync_token(after: Optional[Tuple[int, uuid.UUID]], seq: int) -> str:
+    change_seq, book_id = after if after is not None else (None, None)
+    return encode_cursor(["sync", change_seq, book_id, seq])
+
+
+async def _position_at(session: AsyncSession, timestamp: datetime) -> Tuple[Tuple[int, uuid.UUID], int]:
+    """Approximate a sync checkpoint at ``timestamp``; it may repeat changes but never skips one."""
+    first_change = select(func.min(Book.change_seq)).where(Book.updated_at >= timestamp).scalar_subquery()
+    last_change = select(func.coalesce(func.max(Book.change_seq), 0) + 1).scalar_subquery()
+    # Tombstone sequence numbers grow with deleted_at: resume after the last one before the timestamp
+    last_deleted = (
+        select(func.coalesce(func.max(BookTombstone.seq), 0))
+        .where(BookTombstone.deleted_at < timestamp)
+        .scalar_subquery()
+    )
+    change_seq, seq = (await session.execute(select(func.coalesce(first_change, last_change), last_deleted))).one()
+    # The nil UUID sorts before every id: the whole first change is returned
+    return (change_seq, uuid.UUID(int=0)), seq
+
+
+async def _parse_since(session: AsyncSession, since: str) -> Tuple[Optional[Tuple[int, uuid.UUID]], int]:
+    """Resolve a sync checkpoint into (book keyset position, last tombstone seq)."""
+    try:
+        kind, change_seq, book_id, seq = decode_cursor(since, size=4)
+        if kind != "sync" or not isinstance(seq, int):
+            raise ValueError("Invalid sync token")
+        if change_seq is None:
+            return None, seq
+        return (int(change_seq), uuid.UUID(book_id)), seq
+    except (TypeError, ValueError):
+        pass
+    try:
+        timestamp = datetime.fromisoformat(since)
+    except ValueError as exc:
+        raise ValueError("since must be a sync token or an ISO 8601 timestamp") from exc
+    return await _position_at(session, timestamp)
+
+
+async def list_changes(
+    session: AsyncSession,
+    *,
+    since: Optional[str] = None,
+    limit: int,
+) -> dict:
+    """
+    Return books created or updated, and ids of books deleted, after a checkpoint.
+    
+    Books are walked in (change_seq, id) order and deletions in tombstone
+    sequence order, both of which follow commit order (see services.changes),
+    so a client can page through changes by passing the returned
+    ``sync_token`` back as ``since`` until ``has_more`` is false.
+    Without ``since`` every book is returned (a full snapshot) and no
+    tombstones, since the client has nothing to delete yet.
+    
+    Args:
+        session: Database session
+        since: Sync token from a previous call or an ISO 8601 timestamp
+        limit: Maximum number of books and of deleted ids per call
+        
+    Returns:
+        Dict with ``books`` (serialized BookRead), ``deleted`` (book ids),
+        ``sync_token`` and ``has_more``
+        
+    Raises:
+        ValueError: if ``since`` is neither a sync token nor a timestamp
+    """
+    after: Optional[Tuple[int, uuid.UUID]] = None
+    deleted: List[Any] = []
+    if since:
+        after, seq = await _parse_since(session, since)
+        q = select(BookTombstone.seq, BookTombstone.book_id).where(BookTombstone.seq > seq)
+        deleted = (await session.execute(q.order_by(BookTombstone.seq).limit(limit + 1))).all()
+    else:
+        # Snapshot: later deletions are reported from the current end of the log
+        seq = (await session.execute(select(func.coalesce(func.max(BookTombstone.seq), 0)))).scalar_one()
+
+    q = select(Book)
+    if after is not None:
+        q = q.where(tuple_(Book.change_seq, Book.id) > tuple_(*after))
+    books = (await session.execute(q.order_by(Book.change_seq, Book.id).limit(limit + 1))).scalars().all()
+
+    has_more = len(books) > limit or len(deleted) > limit
+    books, deleted = books[:limit], deleted[:limit]
+    if books:
+        after = (books[-1].change_seq, books[-1].id)
+    if deleted:
+        seq = deleted[-1].seq
+    return {
+        "books": _dump_books(books, None),
+        "deleted": [str(row.book_id) for row in deleted],
+        "sync_token": _encode_sync_token(after, seq),
+        "has_more": has_more,
+    }
+
+
+async def track_book_counts(
+    session: AsyncSession,
+    *,
+    added: Iterable[Tuple[str, str]] = (),
+    removed: Iterable[Tuple[str, str]] = (),
+    tags: Mapping[str, int] = {},
+) -> None:
+    """
+    Keep the author, category and tag book counts in step with a write (without committing).
+    
+    Args:
+        session: Database session
+        added: (author, category) of each book created or moved in
+        removed: (author, category) of each book deleted or moved out
+        tags: Usage count change per tag, as returned by the tag index updates
+    """
+    added, removed = list(added), list(removed)
+    await adjust_author_counts(
+        session, author_deltas(added=[a for a, _ in added], removed=[a for a, _ in removed])
+    )
+    categories: Counter = Counter(c for _, c in added)
+    categories.subtract(c for _, c in removed)
+    await adjust_category_usage(session, categories)
+    await adjust_tag_counts(session, tags)
+
+
+async def sync_search_configs(session: AsyncSession, book_ids: Sequence[uuid.UUID]) -> None:
+    """Re-derive ``search_config`` of the given books' documents and pages from their language (without committing)."""
+    if not book_ids:
+        return
+    language = select(Book.language).where(Book.id == Document.book_id).scalar_subquery()
+    config = case(
+        *((language == lang, literal(name)) for lang, name in SEARCH_CONFIGS.items()),
+        else_=literal("simple"),
+    )
+    stmt = (
+        update(Document)
+        .where(Document.book_id.in_(list(book_ids)))
+        .values(search_config=config)
+        .execution_options(synchronize_session=False)
+    )
+    await session.execute(stmt)
+    document_config = select(Document.search_config).where(Document.id == DocumentPage.document_id).scalar_subquery()
+    stmt = (
+        update(DocumentPage)
+        .where(DocumentPage.document_id.in_(select(Document.id).where(Document.book_id.in_(list(book_ids)))))
+        .values(search_config=document_config)
+        .execution_options(synchronize_session=False)
+    )
+    await session.execute(stmt)
+
+
+async def _count_books_by_author_and_category(session: AsyncSession, criteria: list) -> Counter:
+    stmt = select(Book.author, Book.category, func.count()).where(*criteria).group_by(Book.author, Book.category)
+    return Counter({(author, category): int(count) for author, category, count in (await session.execute(stmt)).all()})
+
+
 async def create_book(session: AsyncSession, data: BookCreate, *, commit: bool = True) -> Book:
+    await next_change_seq(session)
     book = Book(**_schema_to_data(data))
     session.add(book)
+    await session.flush()
+    tags = await replace_book_tags(session, {book.id: book.tags or []})
+    await track_book_counts(session, added=[(book.author, book.category)], tags=tags)
     if commit:
         await session.commit()
         await session.refresh(book)
-    else:
-        await session.flush()
+        await invalidate_catalog_cache()
     return book
 
 
 async def update_book(session: AsyncSession, book: Book, data: BookUpdate, *, commit: bool = True) -> Book:
-    for field, value in _schema_to_data(data, exclude_unset=True).items():
+    values = _schema_to_data(data, exclude_unset=True)
+    if values:
+        await next_change_seq(session)
+    previous = (book.author, book.category)
+    for field, value in values.items():
         setattr(book, field, value)
     session.add(book)
+    tags = await replace_book_tags(session, {book.id: values["tags"] or []}) if "tags" in values else Counter()
+    if (book.author, book.category) != previous:
+        await track_book_counts(session, added=[(book.author, book.category)], removed=[previous], tags=tags)
+    else:
+        await track_book_counts(session, tags=tags)
+    if "language" in values:
+        await session.flush()
+        await sync_search_configs(session, [book.id])
     if commit:
         await session.commit()
         await session.refresh(book)
+        await invalidate_catalog_cache()
     else:
         await session.flush()
     return book
 
 
 async def delete_book(session: AsyncSession, book: Book) -> None:
+    await next_change_seq(session)
+    # Book.documents is never loaded implicitly, so remove documents with one
+    # statement instead of relying on ORM cascade (or SQLite FK enforcement).
+    documents = select(Document.id).where(Document.book_id == book.id)
+    await session.execute(delete(DocumentPage).where(DocumentPage.document_id.in_(documents)))
+    await session.execute(delete(Document).where(Document.book_id == book.id))
+    tags = await delete_book_tags(session, [book.id])
+    await track_book_counts(session, removed=[(book.author, book.category)], tags=tags)
+    session.add(BookTombstone(book_id=book.id))
     await session.delete(book)
     await session.commit()
+    await invalidate_catalog_cache()
+
+
+def _bulk_criteria(filters: BookFilters, ids: Optional[Sequence[uuid.UUID]]) -> list:
+    if ids is None and filters == BookFilters():
+        raise ValueError("A bulk operation needs ids or at least one filter")
+    if ids is not None and len(ids) > BATCH_MAX_IDS:
+        raise ValueError(f"At most {BATCH_MAX_IDS} ids can be targeted at once")
+    criteria = filters.criteria()
+    if ids is not None:
+        criteria.append(Book.id.in_(list(ids)))
+    return criteria
+
+
+async def bulk_update_books(
+    session: AsyncSession,
+    filters: BookFilters,
+    data: BookUpdate,
+    *,
+    ids: Optional[Sequence[uuid.UUID]] = None,
+) -> int:
+    """
+    Apply the same change to every selected book with one UPDATE statement.
+    
+    A new category is created once, in the same transaction.
+    
+    Args:
+        session: Database session
+        filters: Filter set selecting books
+        data: Fields to set on every selected book
+        ids: Optional explicit ids, combined with ``filters``
+        
+    Returns:
+        Number of books updated
+        
+    Raises:
+        ValueError: if neither ids nor filters are given, or too many ids
+    """
+    criteria = _bulk_criteria(filters, ids)
+    values = _schema_to_data(data, exclude_unset=True)
+    if not values or ids == []:
+        return 0
+    values["change_seq"] = await next_change_seq(session)
+    if values.get("category"):
+        await create_category(session, values["category"], commit=False)
+    values["updated_at"] = datetime.now(timezone.utc)
+    book_ids = None
+    if "tags" in values or "language" in values:
+        # Resolve the selection first: a tag (or language) filter must not see the rewritten rows
+        book_ids = (await session.execute(select(Book.id).where(*criteria))).scalars().all()
+        criteria = [Book.id.in_(book_ids)]
+    previous: list = []
+    if "author" in values or "category" in values:
+        previous = list((await _count_books_by_author_and_category(session, criteria)).elements())
+    stmt = update(Book).where(*criteria).values(**values).execution_options(synchronize_session=False)
+    matched = (await session.execute(stmt)).rowcount
+    tags: Counter = Counter()
+    if book_ids and "tags" in values:
+        tags = await replace_book_tags(session, {book_id: values["tags"] or [] for book_id in book_ids})
+    moved = [(values.get("author", author), values.get("category", category)) for author, category in previous]
+    await track_book_counts(session, added=moved, removed=previous, tags=tags)
+    if book_ids and "language" in values:
+        await sync_search_configs(session, book_ids)
+    await session.commit()
+    if matched:
+        await invalidate_catalog_cache()
+    return matched
+
+
+async def bulk_delete_books(
+    session: AsyncSession,
+    filters: BookFilters,
+    *,
+    ids: Optional[Sequence[uuid.UUID]] = None,
+) -> int:
+    """
+    Delete every selected book (and its documents) in one transaction.
+    
+    Deleted ids are written to the tombstone log with a single INSERT ... SELECT.
+    
+    Args:
+        session: Database session
+        filters: Filter set selecting books
+        ids: Optional explicit ids, combined with ``filters``
+        
+    Returns:
+        Number of books deleted
+        
+    Raises:
+        ValueError: if neither ids nor filters are given, or too many ids
+    """
+    criteria = _bulk_criteria(filters, ids)
+    if ids == []:
+        return 0
+    await next_change_seq(session)
+    if filters.tag:
+        # Resolve the selection first: a tag filter must not see the deleted tag rows
+        criteria = [Book.id.in_((await session.execute(select(Book.id).where(*criteria))).scalars().all())]
+    selected = select(Book.id).where(*criteria)
+    removed = await _count_books_by_author_and_category(session, criteria)
+    tags = await delete_book_tags(session, selected)
+    await track_book_counts(session, removed=removed.elements(), tags=tags)
+    await session.execute(insert(BookTombstone).from_select(["book_id"], selected))
+    documents = select(Document.id).where(Document.book_id.in_(selected))
+    await session.execute(delete(DocumentPage).where(DocumentPage.document_id.in_(documents)))
+    await session.execute(delete(Document).where(Document.book_id.in_(selected)))
+    stmt = delete(Book).where(*criteria).execution_options(synchronize_session=False)
+    deleted = (await session.execute(stmt)).rowcount
+    await session.commit()
+    if deleted:
+        await invalidate_catalog_cache()
+    return deleted
@@ -0,0 +1,105 @@
+"""Streaming export of the whole catalog (NDJSON or CSV)."""
+
+from __future__ import annotations
+
+import csv
+import enum
+import io
+import json
+import os
+from typing import Any, AsyncIterator, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..models.book import Book
+from .books import book_columns
+
+EXPORT_FORMATS = ("ndjson", "csv")
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+EXPORT_FIELDS = (
+    "id",
+    "title",
+    "author",
+    "description",
+    "cover_image_url",
+    "thumbnail_path",
+    "category",
+    "tags",
+    "language",
+    "created_at",
+    "updated_at",
+    "has_document",
+)
+# Rows fetched per round trip from the server-side cursor, and emitted per chunk
+_BATCH_SIZE = int(os.getenv("BOOKS_EXPORT_BATCH_SIZE", "1000"))
+
+
+def _plain(field: str, value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if field == "tags":
+        return list(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _ndjson_chunk(rows: Sequence[Any]) -> str:
+    lines = (
+        json.dumps({field: _plain(field, getattr(row, field)) for field in EXPORT_FIELDS}, ensure_ascii=False)
+        for row in rows
+    )
+    return "".join(line + "\n" for line in lines)
+
+
+def _csv_chunk(rows: Sequence[Any], *, header: bool = False) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        values = [_plain(field, getattr(row, field)) for field in EXPORT_FIELDS]
+        # Tags are flattened to a single pipe-separated cell
+        values[EXPORT_FIELDS.index("tags")] = "|".join(values[EXPORT_FIELDS.index("tags")] or ())
+        writer.writerow(values)
+    return buffer.getvalue()
+
+
+async def iter_catalog_export(
+    session_factory: async_sessionmaker[AsyncSession],
+    fmt: str,
+) -> AsyncIterator[str]:
+    """
+    Yield the catalog as text chunks, reading it through a server-side cursor.
+    
+    The generator opens its own session because it runs after the request
+    handler (and its request-scoped session) has returned. Only projected
+    columns are fetched, ``_BATCH_SIZE`` rows at a time, so memory stays flat
+    regardless of catalog size.
+    
+    Args:
+        session_factory: Factory used to open the export session
+        fmt: One of EXPORT_FORMATS
+        
+    Yields:
+        NDJSON lines or CSV rows (with a header first), one chunk per batch
+        
+    Raises:
+        ValueError: if ``fmt`` is not a supported format
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    if fmt == "csv":
+        yield _csv_chunk((), header=True)
+    stmt = (
+        select(*book_columns(EXPORT_FIELDS))
+        .order_by(Book.id)
+        .execution_options(yield_per=_BATCH_SIZE)
+    )
+    async with session_factory() as session:
+        result = await session.stream(stmt)
+        async for rows in result.partitions():
+            yield _ndjson_chunk(rows) if fmt == "ndjson" else _csv_chunk(rows)
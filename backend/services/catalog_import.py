@@ -0,0 +1,233 @@
+"""Bulk catalog import from streamed NDJSON or CSV."""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Iterable, List, Tuple, Union
+
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import dialect_insert
+from ..models.book import Book
+from ..schemas.book import BookImportRow
+from .books import invalidate_catalog_cache, sync_search_configs, track_book_counts
+from .categories import create_category
+from .changes import next_change_seq
+from .tags import replace_book_tags
+
+IMPORT_FORMATS = ("ndjson", "csv")
+# Rows validated and written per statement / transaction
+_BATCH_SIZE = int(os.getenv("BOOKS_IMPORT_BATCH_SIZE", "500"))
+# Columns rewritten when an imported id already exists
+_UPSERT_COLUMNS = (
+    "title",
+    "author",
+    "description",
+    "cover_image_url",
+    "thumbnail_path",
+    "pdf_url",
+    "category",
+    "tags",
+    "language",
+)
+
+
+def _decode(line: bytes) -> Union[str, ValueError]:
+    try:
+        return line.decode("utf-8").rstrip("\r")
+    except UnicodeDecodeError as exc:
+        return ValueError(f"Invalid UTF-8 at byte {exc.start}")
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, Union[str, ValueError]]]:
+    """Split a byte stream into (line number, text or decoding error) pairs without buffering it whole."""
+    pending = b""
+    number = 0
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            number += 1
+            yield number, _decode(line)
+    if pending:
+        yield number + 1, _decode(pending)
+
+
+async def _iter_csv_records(lines: AsyncIterator[Tuple[int, Union[str, ValueError]]]) -> AsyncIterator[Tuple[int, Any]]:
+    header: List[str] | None = None
+    record: List[str] = []
+    start = 0
+    async for number, line in lines:
+        if isinstance(line, ValueError):
+            # The record the line belongs to cannot be rebuilt: report it whole
+            yield (start if record else number), line
+            record = []
+            continue
+        if not record:
+            start = number
+        record.append(line)
+        # A quoted field spanning lines leaves an odd number of quotes so far
+        if "\n".join(record).count('"') % 2:
+            continue
+        text, record = "\n".join(record), []
+        if not text.strip():
+            continue
+        try:
+            values = next(csv.reader([text]))
+        except csv.Error as exc:
+            yield start, exc
+            continue
+        if header is None:
+            header = values
+            continue
+        if len(values) != len(header):
+            yield start, ValueError(f"Expected {len(header)} columns, got {len(values)}")
+            continue
+        row = {key: value for key, value in zip(header, values) if value != ""}
+        if "tags" in row:
+            row["tags"] = [tag for tag in row["tags"].split("|") if tag]
+        yield start, row
+    if record:
+        yield start, ValueError("Unterminated quoted field")
+
+
+async def iter_import_records(chunks: AsyncIterator[bytes], fmt: str) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Parse a streamed upload into (line number, row dict or parse error) pairs.
+    
+    Args:
+        chunks: Raw request body chunks
+        fmt: One of IMPORT_FORMATS; CSV needs a header row and pipe-separated tags
+        
+    Yields:
+        Line number of the record and its fields, or the exception raised
+        while decoding it
+        
+    Raises:
+        ValueError: if ``fmt`` is not a supported format
+    """
+    if fmt not in IMPORT_FORMATS:
+        raise ValueError(f"Unsupported import format: {fmt}")
+    lines = _iter_lines(chunks)
+    if fmt == "csv":
+        async for item in _iter_csv_records(lines):
+            yield item
+        return
+    async for number, line in lines:
+        if isinstance(line, ValueError):
+            yield number, line
+            continue
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("Expected a JSON object")
+        except ValueError as exc:
+            yield number, exc
+            continue
+        yield number, record
+
+
+def _validate(batch: Iterable[Tuple[int, Any]], errors: List[dict]) -> List[Tuple[int, dict]]:
+    valid: List[Tuple[int, dict]] = []
+    for number, record in batch:
+        if isinstance(record, Exception):
+            errors.append({"line": number, "error": str(record)})
+            continue
+        try:
+            row = BookImportRow.model_validate(record)
+        except ValidationError as exc:
+            details = (f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in exc.errors())
+            errors.append({"line": number, "error": "; ".join(details)})
+            continue
+        data = row.model_dump(mode="json")
+        data["id"] = row.id or uuid.uuid4()
+        valid.append((number, data))
+    return valid
+
+
+async def _write_batch(session: AsyncSession, rows: List[dict]) -> None:
+    change_seq = await next_change_seq(session)
+    await create_category(session, (row["category"] for row in rows), commit=False)
+    # Rows updating existing books move them away from their previous author/category
+    existing = select(Book.author, Book.category).where(Book.id.in_([row["id"] for row in rows]))
+    previous = [tuple(row) for row in (await session.execute(existing)).all()]
+    stmt = dialect_insert(session, Book)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["id"],
+        set_={
+            **{name: stmt.excluded[name] for name in _UPSERT_COLUMNS},
+            "updated_at": datetime.now(timezone.utc),
+            "change_seq": change_seq,
+        },
+    )
+    # executemany: asyncpg prepares the statement once and pipelines the rows
+    await session.execute(stmt, [{**row, "change_seq": change_seq} for row in rows])
+    tags = await replace_book_tags(session, {row["id"]: row["tags"] for row in rows})
+    await track_book_counts(
+        session, added=[(row["author"], row["category"]) for row in rows], removed=previous, tags=tags
+    )
+    await sync_search_configs(session, [row["id"] for row in rows])
+    await session.commit()
+
+
+async def import_books(session: AsyncSession, records: AsyncIterator[Tuple[int, Any]]) -> dict:
+    """
+    Validate and upsert streamed rows in batches.
+    
+    Each batch creates its missing categories in one statement and writes its
+    books in one INSERT ... ON CONFLICT (id) DO UPDATE, then commits; rows
+    repeating an id are applied in order, so the last one wins. A batch
+    the database rejects is rolled back and each of its rows reported. The
+    catalog cache is invalidated once at the end, even when the upload fails
+    midway after some batches were committed.
+    
+    Args:
+        session: Database session
+        records: Output of iter_import_records()
+        
+    Returns:
+        Dict with ``imported``, ``failed`` and per-row ``errors`` ({line, error})
+    """
+    imported = 0
+    errors: List[dict] = []
+    batch: List[Tuple[int, Any]] = []
+
+    async def _flush() -> None:
+        nonlocal imported
+        valid = _validate(batch, errors)
+        batch.clear()
+        if not valid:
+            return
+        # One row per id, the last one winning as across batches: PostgreSQL
+        # rejects an ON CONFLICT DO UPDATE that touches the same row twice.
+        rows = list({data["id"]: data for _, data in valid}.values())
+        try:
+            await _write_batch(session, rows)
+        except SQLAlchemyError as exc:
+            await session.rollback()
+            message = f"Database error: {exc.__class__.__name__}"
+            errors.extend({"line": number, "error": message} for number, _ in valid)
+            return
+        imported += len(valid)
+
+    try:
+        async for item in records:
+            batch.append(item)
+            if len(batch) >= _BATCH_SIZE:
+                await _flush()
+        await _flush()
+    finally:
+        # Committed batches stay committed even if the stream breaks off
+        if imported:
+            await invalidate_catalog_cache()
+    errors.sort(key=lambda error: error["line"])
+    return {"imported": imported, "failed": len(errors), "errors": errors}
@@ -1,37 +1,121 @@
 from __future__ import annotations
 
-from sqlalchemy import func, select
+import os
+from datetime import datetime, timezone
+from typing import Iterable, Mapping, Optional, Union
+
+from sqlalchemy import bindparam, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..database import dialect_insert
 from ..models import Category, Book
+from . import invalidation
+from .cache import TTLCache
+from .changes import next_change_seq
+
+
+# Category listings; cleared on every catalog write (book counts change) and category change
+categories_cache = TTLCache(maxsize=4, ttl=float(os.getenv("CATALOG_CACHE_TTL_SECONDS", "300")))
 
+invalidation.subscribe(invalidation.CATALOG, categories_cache.clear)
 
-async def list_categories(session: AsyncSession) -> list[tuple[str, int]]:
-    """Return (name, usage_count) for all categories."""
-    # Count usage from books table; category is a plain string field
-    usage_stmt = select(Book.category, func.count()).group_by(Book.category)
-    usage = {row[0]: row[1] for row in (await session.execute(usage_stmt)).all()}
 
-    stmt = select(Category)
-    result = await session.execute(stmt)
-    items: list[tuple[str, int]] = []
-    for cat in result.scalars():
-        items.append((cat.name, int(usage.get(cat.name, 0))))
+def usage_counts_statement():
+    """Return (name, usage_count) for every category, counted from books with one outer-join aggregate."""
+    return (
+        select(Category.name, func.count(Book.id).label("usage_count"))
+        .outerjoin(Book, Book.category == Category.name)
+        .group_by(Category.name)
+        .order_by(Category.name)
+    )
+
+
+async def list_categories(session: AsyncSession, *, exact: bool = False) -> list[tuple[str, int]]:
+    """
+    Return (name, usage_count) for all categories.
+    
+    By default counts come from the denormalized ``categories.usage_count``
+    column (a single-table read, cached until the next catalog write);
+    ``exact`` recounts them from books instead.
+    """
+    if exact:
+        return [(name, int(count)) for name, count in (await session.execute(usage_counts_statement())).all()]
+    cached = categories_cache.get("list")
+    if cached is not None:
+        return cached
+    stmt = select(Category.name, Category.usage_count).order_by(Category.name)
+    items = [(name, int(count)) for name, count in (await session.execute(stmt)).all()]
+    categories_cache.set("list", items)
     return items
 
 
-async def create_category(session: AsyncSession, name: str, *, commit: bool = True) -> Category:
-    cat = await session.get(Category, name)
-    if cat:
-        return cat
-    cat = Category(name=name)
-    session.add(cat)
-    if commit:
+async def adjust_category_usage(session: AsyncSession, deltas: Mapping[str, int]) -> None:
+    """Apply book count changes to ``categories.usage_count`` (without committing)."""
+    params = [{"target": name, "delta": delta} for name, delta in deltas.items() if delta]
+    if not params:
+        return
+    table = Category.__table__
+    stmt = (
+        update(table)
+        .where(table.c.name == bindparam("target"))
+        .values(usage_count=table.c.usage_count + bindparam("delta"))
+    )
+    await session.execute(stmt, params)
+
+
+async def recount_category_usage(session: AsyncSession) -> None:
+    """Rebuild every ``usage_count`` from books in one UPDATE (repair/backfill), then commit."""
+    counted = (
+        select(func.count())
+        .select_from(Book)
+        .where(Book.category == Category.name)
+        .scalar_subquery()
+    )
+    await session.execute(update(Category).values(usage_count=counted).execution_options(synchronize_session=False))
+    await session.commit()
+    await invalidation.publish(invalidation.CATALOG)
+
+
+async def categories_version(session: AsyncSession) -> tuple:
+    """Return a cheap fingerprint of categories and their usage for ETag computation."""
+    stmt = select(
+        select(func.count()).select_from(Category).scalar_subquery(),
+        select(func.max(Category.updated_at)).scalar_subquery(),
+        select(func.count()).select_from(Book).scalar_subquery(),
+        select(func.max(Book.updated_at)).scalar_subquery(),
+    )
+    return tuple((await session.execute(stmt)).one())
+
+
+async def create_category(
+    session: AsyncSession,
+    names: Union[str, Iterable[str]],
+    *,
+    commit: bool = True,
+) -> int:
+    """
+    Create the given categories unless they exist, in one INSERT ... ON CONFLICT DO NOTHING.
+    
+    Safe under concurrent writers of the same name, and costs a single round
+    trip whether one name or a batch is given.
+    
+    Args:
+        session: Database session
+        names: One category name or several
+        commit: Commit (and invalidate cached listings) when something was created
+        
+    Returns:
+        Number of categories actually created
+    """
+    values = [{"name": name} for name in sorted({names} if isinstance(names, str) else set(names))]
+    if not values:
+        return 0
+    stmt = dialect_insert(session, Category).values(values).on_conflict_do_nothing(index_elements=["name"])
+    created = (await session.execute(stmt)).rowcount
+    if commit and created:
         await session.commit()
-        await session.refresh(cat)
-    else:
-        await session.flush()
-    return cat
+        await invalidation.publish(invalidation.CATALOG)
+    return created
 
 
 async def delete_category(session: AsyncSession, name: str) -> bool:
@@ -44,4 +128,88 @@ async def delete_category(session: AsyncSession, name: str) -> bool:
         return False
     await session.delete(cat)
     await session.commit()
+    await invalidation.publish(invalidation.CATALOG)
     return True
+
+
+async def _move_books(session: AsyncSession, sources: list[str], target: str) -> int:
+    """Point every book of ``sources`` at ``target`` with one UPDATE; return the number moved."""
+    stmt = (
+        update(Book)
+        .where(Book.category.in_(sources))
+        .values(category=target, updated_at=datetime.now(timezone.utc), change_seq=await next_change_seq(session))
+        .execution_options(synchronize_session=False)
+    )
+    return (await session.execute(stmt)).rowcount
+
+
+async def rename_category(session: AsyncSession, name: str, new_name: str) -> Optional[int]:
+    """
+    Rename a category and every book referencing it, in one transaction.
+    
+    The new row is inserted before the books are repointed and the old one
+    deleted afterwards, so the books -> categories foreign key holds at every
+    statement and needs no deferral.
+    
+    Args:
+        session: Database session
+        name: Current category name
+        new_name: Name to give it
+        
+    Returns:
+        Number of books updated, or None if ``name`` does not exist
+        
+    Raises:
+        ValueError: If ``new_name`` is already a category
+    """
+    current = await session.get(Category, name)
+    if current is None:
+        return None
+    if new_name == name:
+        return 0
+    if await session.get(Category, new_name) is not None:
+        raise ValueError(f"Category '{new_name}' already exists")
+    try:
+        await next_change_seq(session)
+        session.add(Category(name=new_name, created_at=current.created_at, usage_count=current.usage_count))
+        await session.flush()
+        moved = await _move_books(session, [name], new_name)
+        await session.delete(current)
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    await invalidation.publish(invalidation.CATALOG)
+    return moved
+
+
+async def merge_categories(session: AsyncSession, sources: Iterable[str], target: str) -> Optional[tuple[int, int]]:
+    """
+    Move every book of ``sources`` into ``target`` and delete the sources, in one transaction.
+    
+    ``target`` is created when missing; it is ignored if also listed as a source.
+    
+    Args:
+        session: Database session
+        sources: Categories to fold into ``target``
+        target: Category that receives the books
+        
+    Returns:
+        (books updated, categories removed), or None if no source exists
+    """
+    names = sorted(set(sources) - {target})
+    existing = (await session.execute(select(Category.name).where(Category.name.in_(names)))).scalars().all()
+    if not existing:
+        return None
+    try:
+        await next_change_seq(session)
+        await create_category(session, target, commit=False)
+        moved = await _move_books(session, list(existing), target)
+        await adjust_category_usage(session, {target: moved})
+        removed = (await session.execute(delete(Category).where(Category.name.in_(existing)))).rowcount
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    await invalidation.publish(invalidation.CATALOG)
+    return moved, removed
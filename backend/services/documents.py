@@ -2,22 +2,34 @@
 
 from __future__ import annotations
 
+import html
+import json
 import os
 import re
 import uuid
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import BinaryIO
+from typing import Any, BinaryIO, Optional, Sequence, Tuple
 
 from PIL import Image
 from pypdf import PdfReader
-from sqlalchemy import select
+from sqlalchemy import Select, and_, cast, column, false, func, insert, literal, literal_column, or_, select, table
+from sqlalchemy.dialects.postgresql import REGCONFIG, TSVECTOR
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement, ColumnElement
 
 from ..core.config import settings
 from ..core.security import TokenDecodeError, create_access_token, safe_decode_token
 from . import cloudinary_service
+from .books import book_columns
+from .pagination import decode_cursor, encode_cursor
 from ..models import Book, Document
+from ..models.book import Language
+from ..models.document import SEARCH_CONFIGS
+from ..models.document_page import DocumentPage
 
 # Default to a writable project-relative uploads directory.
 # Can be overridden via the UPLOAD_DIR env variable.
@@ -81,15 +93,23 @@ def generate_pdf_thumbnail(pdf_path: Path, thumbnail_path: Path, *, size: int =
         return False
 
 
+def extract_pdf_pages(file_path: Path) -> list[str]:
+    """Extract the text of each page of a PDF file using PyPDF2 (index 0 is page 1)."""
+
+    reader = PdfReader(str(file_path))
+    return [(page.extract_text() or "").strip() for page in reader.pages]
+
+
+def join_pages(pages: Sequence[str]) -> str:
+    """Concatenate page texts into the document-level ``content_text``."""
+
+    return "\n".join(page for page in pages if page)
+
+
 def extract_pdf_text(file_path: Path) -> str:
     """Extract textual content from a PDF file using PyPDF2."""
 
-    reader = PdfReader(str(file_path))
-    text_chunks: list[str] = []
-    for page in reader.pages:
-        page_text = page.extract_text() or ""
-        text_chunks.append(page_text)
-    return "\n".join(chunk.strip() for chunk in text_chunks if chunk.strip())
+    return join_pages(extract_pdf_pages(file_path))
 
 
 def resolve_document_path(filename: str) -> Path:
@@ -113,16 +133,33 @@ async def create_document(
     book: Book,
     filename: str,
     content_text: str,
+    pages: Sequence[str] = (),
     commit: bool = True,
 ) -> Document:
-    """Persist a new document record linked to the provided book."""
+    """Persist a new document record linked to the provided book.
+
+    ``pages`` (from ``extract_pdf_pages``) are stored in ``document_pages``
+    with one executemany INSERT; blank pages are skipped but keep their number.
+    """
 
+    search_config = SEARCH_CONFIGS.get(Language(book.language), "simple")
     document = Document(
         book_id=book.id,
         filename=filename,
         content_text=content_text,
+        search_config=search_config,
     )
     session.add(document)
+    numbered = [(number, text) for number, text in enumerate(pages, start=1) if text]
+    if numbered:
+        await session.flush()
+        await session.execute(
+            insert(DocumentPage),
+            [
+                {"document_id": document.id, "page_number": number, "content_text": text, "search_config": search_config}
+                for number, text in numbered
+            ],
+        )
     if commit:
         await session.commit()
         await session.refresh(document)
@@ -131,25 +168,523 @@ async def create_document(
     return document
 
 
-async def search_books_by_query(session: AsyncSession, query: str) -> list[Book]:
-    """Return books whose indexed document content matches the query (cross-dialect).
+# Highlighted extracts returned per search hit (0 disables them)
+SNIPPET_FRAGMENTS = int(os.getenv("SEARCH_SNIPPET_FRAGMENTS", "3"))
+# Characters of context kept on each side of a match when cutting extracts in Python
+_SNIPPET_WINDOW = 60
+# Control characters never found in extracted text: backends mark matches and
+# split fragments with them, and they are turned into escaped HTML afterwards
+_START_SEL, _STOP_SEL, _FRAGMENT_SEP = "\x02", "\x03", "\x1f"
+# Search hits are counted exactly up to this many; beyond it the backend may estimate
+SEARCH_EXACT_COUNT_LIMIT = int(os.getenv("SEARCH_EXACT_COUNT_LIMIT", "1000"))
+# Matching page numbers returned per search hit
+HIT_PAGES = int(os.getenv("SEARCH_HIT_PAGES", "20"))
+
+
+def _render_fragment(raw: str) -> str:
+    text = html.escape(" ".join(raw.split()), quote=False)
+    return text.replace(_START_SEL, "<mark>").replace(_STOP_SEL, "</mark>")
+
+
+def _marked_fragments(marked: str, *, fragments: int, window: int = _SNIPPET_WINDOW) -> list[str]:
+    """Cut up to ``fragments`` non-overlapping extracts around the marked matches of ``marked``."""
+
+    snippets: list[str] = []
+    covered = 0
+    for match in re.finditer(f"{_START_SEL}[^{_STOP_SEL}]*{_STOP_SEL}", marked):
+        if match.start() < covered:
+            continue
+        start, stop = max(covered, match.start() - window), min(len(marked), match.end() + window)
+        # Never cut through a marked match at either end of the window
+        opened = marked.rfind(_START_SEL, 0, start)
+        if opened > marked.rfind(_STOP_SEL, 0, start):
+            start = opened
+        closed = marked.find(_STOP_SEL, stop)
+        if closed != -1 and marked.rfind(_START_SEL, 0, stop) > marked.rfind(_STOP_SEL, 0, stop):
+            stop = closed + 1
+        snippet = _render_fragment(marked[start:stop])
+        snippets.append(f"{'… ' if start else ''}{snippet}{' …' if stop < len(marked) else ''}")
+        covered = stop
+        if len(snippets) >= fragments:
+            break
+    return snippets
+
+
+def extract_snippets(text: str, query: str, *, fragments: int = SNIPPET_FRAGMENTS, window: int = _SNIPPET_WINDOW) -> list[str]:
+    """Return up to ``fragments`` non-overlapping extracts of ``text`` around case-insensitive matches of ``query``.
+
+    Matches are wrapped in ``<mark>`` and the rest of the text is HTML-escaped,
+    like the snippets of every search backend.
+    """
+
+    needle = query.strip()
+    if not needle or fragments <= 0:
+        return []
+    pattern = re.compile(re.escape(needle), re.IGNORECASE)
+    marked = pattern.sub(lambda m: f"{_START_SEL}{m.group(0)}{_STOP_SEL}", text)
+    return _marked_fragments(marked, fragments=fragments, window=window)
+
+
+class _Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` of a statement, keeping its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement) -> None:
+        self.statement = statement
 
-    Avoids PostgreSQL-specific DISTINCT ON by first selecting distinct IDs, then fetching rows.
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+class SearchBackend:
+    """Portable document search: ILIKE over the stored text, every match ranked equally.
+
+    A backend restricts statements over ``documents`` (or ``document_pages``)
+    to the rows matching a query and provides their rank and highlighted
+    extract; the search services compose the statements around it. Ranks are
+    comparable within one backend only: higher is better, ties are broken by
+    book id. Subclasses answer from a full-text index; ``get_search_backend``
+    picks one from the engine dialect.
+
+    Every backend accepts the ``websearch_to_tsquery`` syntax, ranks documents
+    with more occurrences first and returns escaped, ``<mark>``-ed snippets.
+    They may differ in: stemming (porter for every FTS5 row, the row's
+    ``search_config`` on PostgreSQL, none for ``simple``); the number of
+    snippets (one ``snippet()`` window against one ``ts_headline`` fragment per
+    group of matches, which also drops leading stop words and trailing
+    punctuation); and totals past the exact-count limit (PostgreSQL estimates,
+    FTS5 counts). ``tests/test_document_search_api.py`` runs the shared
+    behaviour on each backend and marks the engine-specific checks.
     """
 
-    id_stmt = (
-        select(Book.id)
-        .join(Document, Document.book_id == Book.id)
-        .where(Document.content_text.ilike(f"%{query}%"))
-        .distinct()
-    )
-    id_result = await session.execute(id_stmt)
-    ids = list(id_result.scalars())
+    def filter_documents(self, stmt: Select, query: str) -> Select:
+        """Restrict a statement selecting from ``documents`` to the documents matching ``query``."""
+        return stmt.where(Document.content_text.ilike(f"%{query}%"))
+
+    def rank(self, query: str) -> ColumnElement:
+        """Relevance of a document kept by ``filter_documents``."""
+        return literal(0.0)
+
+    def highlight(self, query: str, fragments: int) -> ColumnElement:
+        """Raw extract of a document kept by ``filter_documents``, for ``split_highlight``."""
+        return Document.content_text
+
+    def filter_pages(self, stmt: Select, query: str) -> Select:
+        """Restrict a statement selecting from ``document_pages`` to the pages matching ``query``."""
+        return stmt.where(DocumentPage.content_text.ilike(f"%{query}%"))
+
+    def page_highlight(self, query: str, fragments: int) -> ColumnElement:
+        """Raw extract of a page kept by ``filter_pages``, for ``split_highlight``."""
+        return DocumentPage.content_text
+
+    def split_highlight(self, raw: str, query: str, fragments: int) -> list[str]:
+        """Turn a raw extract into at most ``fragments`` HTML snippets."""
+        return extract_snippets(raw, query, fragments=fragments)
+
+    async def estimate_count(self, session: AsyncSession, stmt: Select) -> Optional[int]:
+        """Cheap estimate of the rows of ``stmt``, or None to count them exactly."""
+        return None
+
+
+class PostgresSearchBackend(SearchBackend):
+    """Ranked search over the stored, GIN-indexed ``search_vector`` tsvectors.
+
+    The query is parsed with ``websearch_to_tsquery`` in every configuration in
+    use so each alternative can be answered by the GIN index; the row's own
+    configuration then decides the match, its ``ts_rank_cd`` and its
+    ``ts_headline`` extract.
+    """
+
+    # Stored tsvectors (see POSTGRES_SEARCH_DDL in models.document and models.document_page)
+    documents_vector = literal_column("documents.search_vector", TSVECTOR)
+    pages_vector = literal_column("document_pages.search_vector", TSVECTOR)
+
+    @staticmethod
+    def _ts_query(config_column, query: str):
+        return func.websearch_to_tsquery(cast(config_column, REGCONFIG), query)
+
+    @staticmethod
+    def _headline(config_column, text, ts_query, fragments: int):
+        options = (
+            f'MaxFragments={fragments}, MaxWords=25, MinWords=8, StartSel="{_START_SEL}", '
+            f'StopSel="{_STOP_SEL}", FragmentDelimiter="{_FRAGMENT_SEP}"'
+        )
+        return func.ts_headline(cast(config_column, REGCONFIG), text, ts_query, options)
+
+    def filter_documents(self, stmt: Select, query: str) -> Select:
+        any_config = or_(
+            *(
+                self.documents_vector.op("@@")(
+                    func.websearch_to_tsquery(literal_column(f"'{config}'", REGCONFIG), query)
+                )
+                for config in (*SEARCH_CONFIGS.values(), "simple")
+            )
+        )
+        own_query = self._ts_query(Document.search_config, query)
+        return stmt.where(any_config, self.documents_vector.op("@@")(own_query))
+
+    def rank(self, query: str) -> ColumnElement:
+        return func.ts_rank_cd(self.documents_vector, self._ts_query(Document.search_config, query))
+
+    def highlight(self, query: str, fragments: int) -> ColumnElement:
+        ts_query = self._ts_query(Document.search_config, query)
+        return self._headline(Document.search_config, Document.content_text, ts_query, fragments)
+
+    def filter_pages(self, stmt: Select, query: str) -> Select:
+        return stmt.where(self.pages_vector.op("@@")(self._ts_query(DocumentPage.search_config, query)))
+
+    def page_highlight(self, query: str, fragments: int) -> ColumnElement:
+        ts_query = self._ts_query(DocumentPage.search_config, query)
+        return self._headline(DocumentPage.search_config, DocumentPage.content_text, ts_query, fragments)
+
+    def split_highlight(self, raw: str, query: str, fragments: int) -> list[str]:
+        return [_render_fragment(part) for part in raw.split(_FRAGMENT_SEP) if part.strip()][:fragments]
+
+    async def estimate_count(self, session: AsyncSession, stmt: Select) -> Optional[int]:
+        plan = (await session.execute(_Explain(stmt))).scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+
+# Terms of a web-search style query: optional "-" and a quoted phrase or a bare word
+_QUERY_TERM = re.compile(r'(-?)"([^"]*)"?|(\S+)')
+
+
+def fts5_query(query: str) -> Optional[str]:
+    """
+    Translate web-search syntax into an FTS5 MATCH expression.
+    
+    Mirrors ``websearch_to_tsquery``: words are ANDed, ``"..."`` is a phrase,
+    ``or`` separates alternatives and ``-word`` excludes. Every term is
+    reduced to its word characters and quoted, so user input can never
+    inject FTS5 syntax.
+    
+    Args:
+        query: User search terms
+        
+    Returns:
+        FTS5 expression, or None if the query has nothing to search for
+    """
+    groups: list[list[str]] = [[]]
+    excluded: list[str] = []
+    for match in _QUERY_TERM.finditer(query):
+        negated, phrase, word = match.group(1), match.group(2), match.group(3)
+        if word is not None:
+            if word.lower() == "or":
+                if groups[-1]:
+                    groups.append([])
+                continue
+            negated, phrase = ("-", word[1:]) if word.startswith("-") else ("", word)
+        tokens = re.findall(r"\w+", phrase)
+        if not tokens:
+            continue
+        term = '"' + " ".join(tokens) + '"'
+        (excluded if negated else groups[-1]).append(term)
+    alternatives = [" AND ".join(group) for group in groups if group]
+    if not alternatives:
+        return None
+    expression = " OR ".join(alternatives)
+    if excluded:
+        expression = f"({expression}) NOT " + " NOT ".join(excluded)
+    return expression
+
+
+class Fts5SearchBackend(SearchBackend):
+    """Ranked search over SQLite FTS5 tables kept in sync with documents and pages by triggers.
+
+    ``documents_fts`` and ``document_pages_fts`` are created alongside their
+    tables (see ``models.document``/``models.document_page``) and joined on
+    ``search_rowid``. Ranks are the negated hidden ``rank`` column (bm25, lower
+    is better; unlike ``bm25()`` it may be aggregated). Extracts come from
+    ``snippet()``, which returns only the best window around the matches, and
+    are cut into fragments in Python.
+    """
+
+    documents_fts = table("documents_fts", column("rowid"))
+    pages_fts = table("document_pages_fts", column("rowid"))
+
+    @staticmethod
+    def _match(fts, query: str):
+        expression = fts5_query(query)
+        if expression is None:
+            return false()
+        return literal_column(fts.name).op("MATCH")(expression)
+
+    @staticmethod
+    def _snippet(fts, fragments: int) -> ColumnElement:
+        # As many words as ts_headline's MaxWords per fragment, within the FTS5 cap of 64 tokens
+        tokens = min(64, 25 * max(fragments, 1))
+        return func.snippet(literal_column(fts.name), 0, _START_SEL, _STOP_SEL, " … ", tokens)
+
+    def filter_documents(self, stmt: Select, query: str) -> Select:
+        fts = self.documents_fts
+        return stmt.join(fts, fts.c.rowid == Document.search_rowid).where(self._match(fts, query))
+
+    def rank(self, query: str) -> ColumnElement:
+        return -literal_column(f"{self.documents_fts.name}.rank")
+
+    def highlight(self, query: str, fragments: int) -> ColumnElement:
+        return self._snippet(self.documents_fts, fragments)
+
+    def filter_pages(self, stmt: Select, query: str) -> Select:
+        fts = self.pages_fts
+        return stmt.join(fts, fts.c.rowid == DocumentPage.search_rowid).where(self._match(fts, query))
+
+    def page_highlight(self, query: str, fragments: int) -> ColumnElement:
+        return self._snippet(self.pages_fts, fragments)
+
+    def split_highlight(self, raw: str, query: str, fragments: int) -> list[str]:
+        return _marked_fragments(raw, fragments=fragments)
+
+
+_backends: dict[str, SearchBackend] = {
+    "postgresql": PostgresSearchBackend(),
+    "sqlite": Fts5SearchBackend(),
+}
+_default_backend = SearchBackend()
+
+
+def get_search_backend(dialect_name: str) -> SearchBackend:
+    """Return the search backend serving engines of ``dialect_name`` (ILIKE when none is registered)."""
+
+    return _backends.get(dialect_name, _default_backend)
+
+
+def use_search_backend(dialect_name: str, backend: SearchBackend) -> None:
+    """Replace the search backend used for ``dialect_name``."""
+
+    _backends[dialect_name] = backend
+
+
+def search_statement(dialect_name: str, query: str):
+    """
+    Build the statement matching books against the text of their documents.
+    
+    Args:
+        dialect_name: SQLAlchemy dialect name of the bound engine
+        query: User search terms
+        
+    Returns:
+        Selectable yielding (book_id, rank) rows, best match first, ties by
+        book id; a book ranks as its best matching document
+    """
+    backend = get_search_backend(dialect_name)
+    rank = func.max(backend.rank(query)).label("rank")
+    stmt = backend.filter_documents(select(Document.book_id, rank), query)
+    return stmt.group_by(Document.book_id).order_by(rank.desc(), Document.book_id)
+
+
+async def _ranked_book_ids(
+    session: AsyncSession,
+    query: str,
+    *,
+    limit: Optional[int] = None,
+    after: Optional[Tuple[float, uuid.UUID]] = None,
+) -> list[Tuple[uuid.UUID, float]]:
+    ranked = search_statement(session.bind.dialect.name, query).subquery()
+    stmt = select(ranked.c.book_id, ranked.c.rank)
+    if after is not None:
+        rank, book_id = after
+        stmt = stmt.where(or_(ranked.c.rank < rank, and_(ranked.c.rank == rank, ranked.c.book_id > book_id)))
+    stmt = stmt.order_by(ranked.c.rank.desc(), ranked.c.book_id).limit(limit)
+    return [(book_id, float(rank)) for book_id, rank in (await session.execute(stmt)).all()]
+
+
+async def _load_books(session: AsyncSession, ids: Sequence[uuid.UUID], fields: Sequence[str] | None) -> list[Any]:
+    """Fetch books (or projected rows) by id, in the order of ``ids``."""
+
     if not ids:
         return []
-    books_stmt = select(Book).where(Book.id.in_(ids))
-    books_result = await session.execute(books_stmt)
-    return list(books_result.scalars())
+    position = {book_id: index for index, book_id in enumerate(ids)}
+    if fields:
+        rows = await session.execute(select(*book_columns(fields)).where(Book.id.in_(ids)))
+        return sorted(rows.all(), key=lambda row: position[row.id])
+    books_result = await session.execute(select(Book).where(Book.id.in_(ids)))
+    return sorted(books_result.scalars(), key=lambda book: position[book.id])
+
+
+async def search_books_by_query(
+    session: AsyncSession,
+    query: str,
+    *,
+    fields: Sequence[str] | None = None,
+) -> list[Any]:
+    """Return every book whose indexed document content matches the query, best match first.
+
+    Matching ids are ranked by ``search_statement``, then the books are fetched by id.
+    With ``fields``, only the needed book columns are selected and rows are returned.
+    Prefer ``search_books_page`` for user-facing listings.
+    """
+
+    ranked = await _ranked_book_ids(session, query)
+    return await _load_books(session, [book_id for book_id, _ in ranked], fields)
+
+
+async def search_books_page(
+    session: AsyncSession,
+    query: str,
+    *,
+    limit: int,
+    cursor: Optional[str] = None,
+    fields: Sequence[str] | None = None,
+) -> Tuple[list[Any], Optional[str]]:
+    """Return one page of matching books, ordered by rank then id, and the cursor of the next page.
+
+    Only ``limit + 1`` ranked ids are read and only the page's books are loaded.
+
+    Raises:
+        ValueError: if the cursor is malformed
+    """
+
+    after = None
+    if cursor:
+        tag, rank, book_id = decode_cursor(cursor, size=3)
+        try:
+            if tag != "search" or not isinstance(rank, (int, float)):
+                raise TypeError("Invalid cursor value")
+            after = (float(rank), uuid.UUID(book_id))
+        except (TypeError, ValueError) as exc:
+            raise ValueError("Invalid cursor") from exc
+    ranked = await _ranked_book_ids(session, query, limit=limit + 1, after=after)
+    next_cursor = None
+    if len(ranked) > limit:
+        ranked = ranked[:limit]
+        next_cursor = encode_cursor(["search", ranked[-1][1], ranked[-1][0]])
+    return await _load_books(session, [book_id for book_id, _ in ranked], fields), next_cursor
+
+
+async def count_search_hits(
+    session: AsyncSession,
+    query: str,
+    *,
+    exact_limit: int = SEARCH_EXACT_COUNT_LIMIT,
+) -> Tuple[int, bool]:
+    """Return (number of matching books, whether it is exact).
+
+    At most ``exact_limit + 1`` matches are counted, so the cost is bounded
+    however common the terms are. Beyond the limit the search backend's
+    estimate is used (the planner's row estimate on PostgreSQL); backends
+    without one finish the count exactly.
+    """
+
+    backend = get_search_backend(session.bind.dialect.name)
+    matching = backend.filter_documents(select(Document.book_id), query).group_by(Document.book_id)
+    capped = select(func.count()).select_from(matching.limit(exact_limit + 1).subquery())
+    total = int((await session.execute(capped)).scalar_one())
+    if total <= exact_limit:
+        return total, True
+    estimate = await backend.estimate_count(session, matching)
+    if estimate is None:
+        return int((await session.execute(select(func.count()).select_from(matching.subquery()))).scalar_one()), True
+    return max(estimate, total), False
+
+
+async def document_snippets(
+    session: AsyncSession,
+    query: str,
+    book_ids: Sequence[uuid.UUID],
+    *,
+    fragments: int = SNIPPET_FRAGMENTS,
+) -> dict[uuid.UUID, list[str]]:
+    """Return highlighted extracts of the documents of ``book_ids`` matching ``query``.
+
+    Only the given books are read, so callers pass the page of results they return.
+    """
+
+    snippets: dict[uuid.UUID, list[str]] = {book_id: [] for book_id in book_ids}
+    if not book_ids or fragments <= 0:
+        return snippets
+    backend = get_search_backend(session.bind.dialect.name)
+    stmt = (
+        backend.filter_documents(select(Document.book_id, backend.highlight(query, fragments)), query)
+        .where(Document.book_id.in_(list(book_ids)))
+        .order_by(Document.book_id, Document.uploaded_at.desc())
+    )
+    for book_id, raw in (await session.execute(stmt)).all():
+        found = snippets[book_id]
+        if len(found) < fragments:
+            found.extend(backend.split_highlight(raw, query, fragments - len(found)))
+    return snippets
+
+
+def _primary_document_id():
+    """Correlated id of the most recent document of ``Document.book_id``, as served by the reader."""
+    latest = aliased(Document)
+    return (
+        select(latest.id)
+        .where(latest.book_id == Document.book_id)
+        .order_by(latest.uploaded_at.desc(), latest.id)
+        .limit(1)
+        .correlate(Document)
+        .scalar_subquery()
+    )
+
+
+async def matching_pages(
+    session: AsyncSession,
+    query: str,
+    book_ids: Sequence[uuid.UUID],
+    *,
+    limit: int = HIT_PAGES,
+) -> dict[uuid.UUID, list[int]]:
+    """Return, per book, the first ``limit`` pages of its primary document matching ``query``.
+
+    Only the pages of the given books are searched and no page text is returned.
+    """
+
+    pages: dict[uuid.UUID, list[int]] = {book_id: [] for book_id in book_ids}
+    if not book_ids or limit <= 0:
+        return pages
+    backend = get_search_backend(session.bind.dialect.name)
+    position = func.row_number().over(partition_by=Document.book_id, order_by=DocumentPage.page_number)
+    stmt = (
+        select(Document.book_id, DocumentPage.page_number, position.label("position"))
+        .select_from(DocumentPage)
+        .join(Document, Document.id == DocumentPage.document_id)
+        .where(Document.book_id.in_(list(book_ids)), Document.id == _primary_document_id())
+    )
+    numbered = backend.filter_pages(stmt, query).subquery()
+    stmt = (
+        select(numbered.c.book_id, numbered.c.page_number)
+        .where(numbered.c.position <= limit)
+        .order_by(numbered.c.book_id, numbered.c.page_number)
+    )
+    for book_id, page_number in (await session.execute(stmt)).all():
+        pages[book_id].append(page_number)
+    return pages
+
+
+async def search_book_pages(
+    session: AsyncSession,
+    book_id: uuid.UUID,
+    query: str,
+    *,
+    limit: int,
+    fragments: int = 1,
+) -> list[tuple[int, list[str]]]:
+    """Return (page number, highlighted extracts) of the first ``limit`` matching pages of a book.
+
+    Only the book's primary document is searched, page by page: the whole
+    text is never loaded and extracts are built for the returned pages only.
+    """
+
+    backend = get_search_backend(session.bind.dialect.name)
+    extract = backend.page_highlight(query, fragments) if fragments > 0 else literal(None)
+    stmt = (
+        select(DocumentPage.page_number, extract)
+        .select_from(DocumentPage)
+        .join(Document, Document.id == DocumentPage.document_id)
+        .where(Document.book_id == book_id, Document.id == _primary_document_id())
+    )
+    stmt = backend.filter_pages(stmt, query).order_by(DocumentPage.page_number).limit(limit)
+    return [
+        (page_number, backend.split_highlight(raw, query, fragments) if fragments > 0 else [])
+        for page_number, raw in (await session.execute(stmt)).all()
+    ]
 
 
 async def get_primary_document(session: AsyncSession, book_id: uuid.UUID) -> Document | None:
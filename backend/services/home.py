@@ -0,0 +1,126 @@
+"""Precomputed home page shelves (recent, per category, popular, stats)."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from datetime import datetime, timezone
+from typing import Any, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.author import Author
+from ..models.book import Book
+from ..models.category import Category
+from ..models.comment import Comment
+from ..schemas.book import BOOK_SUMMARY_FIELDS, serialize_books
+from . import invalidation
+from .books import book_columns
+from .cache import TTLCache
+
+HOME_FIELDS = (*BOOK_SUMMARY_FIELDS, "category")
+_SHELF_SIZE = int(os.getenv("HOME_SHELF_SIZE", "10"))
+_CATEGORY_SHELVES = int(os.getenv("HOME_CATEGORY_SHELVES", "8"))
+
+# Single-entry snapshot: dropped on every catalog write, otherwise rebuilt after the
+# TTL so activity that does not publish invalidations (comments) is picked up too.
+home_cache = TTLCache(maxsize=1, ttl=float(os.getenv("HOME_SNAPSHOT_TTL_SECONDS", "300")))
+_rebuild_lock = asyncio.Lock()
+
+invalidation.subscribe(invalidation.CATALOG, home_cache.clear)
+
+
+def _dump(rows: Sequence[Any]) -> list[dict]:
+    return [book.model_dump(mode="json", exclude_unset=True) for book in serialize_books(rows, HOME_FIELDS)]
+
+
+async def build_home_snapshot(session: AsyncSession) -> dict:
+    """
+    Compute the home page shelves with a handful of indexed queries.
+    
+    "Popular" ranks books by number of comments, the only reader activity
+    recorded server-side.
+    
+    Args:
+        session: Database session
+        
+    Returns:
+        JSON-ready dict matching schemas.home.HomeSnapshot
+    """
+    columns = book_columns(HOME_FIELDS)
+    recent = (
+        await session.execute(select(*columns).order_by(Book.created_at.desc(), Book.id.desc()).limit(_SHELF_SIZE))
+    ).all()
+
+    category_counts = (
+        await session.execute(
+            select(Book.category, func.count().label("book_count"))
+            .group_by(Book.category)
+            .order_by(func.count().desc(), Book.category)
+            .limit(_CATEGORY_SHELVES)
+        )
+    ).all()
+    ranked = select(
+        *columns,
+        func.row_number()
+        .over(partition_by=Book.category, order_by=(Book.created_at.desc(), Book.id.desc()))
+        .label("shelf_rank"),
+    ).where(Book.category.in_([row.category for row in category_counts])).subquery()
+    shelf_rows = (
+        await session.execute(
+            select(ranked).where(ranked.c.shelf_rank <= _SHELF_SIZE).order_by(ranked.c.category, ranked.c.shelf_rank)
+        )
+    ).all()
+    shelves: dict[str, list] = {row.category: [] for row in category_counts}
+    for row in shelf_rows:
+        shelves[row.category].append(row)
+
+    comment_counts = (
+        select(Comment.book_id, func.count().label("comment_count"))
+        .group_by(Comment.book_id)
+        .order_by(func.count().desc())
+        .limit(_SHELF_SIZE)
+        .subquery()
+    )
+    popular = (
+        await session.execute(
+            select(*columns)
+            .join(comment_counts, comment_counts.c.book_id == Book.id)
+            .order_by(comment_counts.c.comment_count.desc(), Book.id)
+        )
+    ).all()
+
+    stats = (
+        await session.execute(
+            select(
+                select(func.count()).select_from(Book).scalar_subquery(),
+                select(func.count()).select_from(Category).scalar_subquery(),
+                select(func.count()).select_from(Author).scalar_subquery(),
+            )
+        )
+    ).one()
+
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "recent": _dump(recent),
+        "popular": _dump(popular),
+        "categories": [
+            {"category": row.category, "book_count": int(row.book_count), "books": _dump(shelves[row.category])}
+            for row in category_counts
+        ],
+        "stats": {"books": int(stats[0]), "categories": int(stats[1]), "authors": int(stats[2])},
+    }
+
+
+async def get_home_snapshot(session: AsyncSession) -> dict:
+    """Return the cached snapshot, rebuilding it once (not per concurrent request) when stale."""
+    snapshot = home_cache.get("home")
+    if snapshot is not None:
+        return snapshot
+    async with _rebuild_lock:
+        snapshot = home_cache.get("home")
+        if snapshot is None:
+            snapshot = await build_home_snapshot(session)
+            home_cache.set("home", snapshot)
+    return snapshot
@@ -0,0 +1,182 @@
+"""Cache invalidation bus shared by every worker process.
+
+Services subscribe a handler per topic (e.g. clearing an in-process cache)
+and publish the topic after committing a write. With PostgreSQL the topic is
+broadcast through ``LISTEN/NOTIFY`` so workers on every node drop their
+copies; elsewhere (SQLite tests, single process) dispatch stays local.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections import defaultdict
+from typing import Callable
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "biblio_cache_invalidation"
+CATALOG = "catalog"
+
+_handlers: dict[str, list[Callable[[], None]]] = defaultdict(list)
+
+
+def subscribe(topic: str, handler: Callable[[], None]) -> None:
+    """Register ``handler`` to run whenever ``topic`` is invalidated in any worker."""
+
+    _handlers[topic].append(handler)
+
+
+def dispatch(topic: str) -> None:
+    """Run the local handlers of ``topic``; a failing handler does not stop the others."""
+
+    for handler in list(_handlers.get(topic, ())):
+        try:
+            handler()
+        except Exception:  # pragma: no cover - defensive
+            logger.exception("Invalidation handler for %r failed", topic)
+
+
+def _dispatch_all() -> None:
+    for topic in list(_handlers):
+        dispatch(topic)
+
+
+class LocalInvalidationBus:
+    """In-memory bus: invalidations only reach the current process."""
+
+    async def start(self) -> None:
+        return None
+
+    async def stop(self) -> None:
+        return None
+
+    async def publish(self, topic: str) -> None:
+        dispatch(topic)
+
+
+class PostgresInvalidationBus(LocalInvalidationBus):
+    """Bus broadcasting topics with ``pg_notify`` and listening on a dedicated connection."""
+
+    def __init__(self, engine: AsyncEngine, *, channel: str = CHANNEL, reconnect_delay: float = 5.0) -> None:
+        self._engine = engine
+        self._channel = channel
+        self._reconnect_delay = reconnect_delay
+        # Notifications are echoed to the sender too; the origin lets us skip our own.
+        self._origin = uuid.uuid4().hex
+        self._connection: AsyncConnection | None = None
+        self._driver_connection = None
+        self._reconnect_task: asyncio.Task | None = None
+        self._stopped = False
+
+    async def start(self) -> None:
+        self._stopped = False
+        connection = await self._engine.connect()
+        try:
+            raw = await connection.get_raw_connection()
+            driver_connection = raw.driver_connection
+            await driver_connection.add_listener(self._channel, self._on_notify)
+            driver_connection.add_termination_listener(self._on_terminate)
+        except Exception:
+            await connection.close()
+            raise
+        self._connection = connection
+        self._driver_connection = driver_connection
+
+    async def stop(self) -> None:
+        self._stopped = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        if self._driver_connection is not None:
+            try:
+                await self._driver_connection.remove_listener(self._channel, self._on_notify)
+            except Exception:  # pragma: no cover - connection already gone
+                pass
+            self._driver_connection = None
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+
+    async def publish(self, topic: str) -> None:
+        dispatch(topic)
+        try:
+            async with self._engine.connect() as connection:
+                await connection.execute(select(func.pg_notify(self._channel, f"{topic}:{self._origin}")))
+                await connection.commit()
+        except Exception:
+            # Local caches are already clear; other workers fall back to their TTL.
+            logger.exception("Failed to broadcast invalidation of %r", topic)
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        topic, _, origin = payload.rpartition(":")
+        if origin == self._origin:
+            return
+        dispatch(topic or payload)
+
+    def _on_terminate(self, connection) -> None:
+        # Notifications may have been missed while disconnected: drop everything.
+        _dispatch_all()
+        self._connection = None
+        self._driver_connection = None
+        if not self._stopped and self._reconnect_task is None:
+            self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        try:
+            while not self._stopped:
+                await asyncio.sleep(self._reconnect_delay)
+                try:
+                    await self.start()
+                except Exception:
+                    logger.warning("Invalidation listener reconnect failed; retrying", exc_info=True)
+                    continue
+                _dispatch_all()
+                return
+        finally:
+            self._reconnect_task = None
+
+
+_bus: LocalInvalidationBus = LocalInvalidationBus()
+
+
+def get_bus() -> LocalInvalidationBus:
+    return _bus
+
+
+def use_bus(bus: LocalInvalidationBus) -> None:
+    """Replace the active bus (subscriptions are kept)."""
+
+    global _bus
+    _bus = bus
+
+
+async def publish(topic: str) -> None:
+    """Invalidate ``topic`` locally and, when available, in every other worker."""
+
+    await _bus.publish(topic)
+
+
+async def start(engine: AsyncEngine) -> None:
+    """Install the bus matching the engine dialect; falls back to local dispatch on failure."""
+
+    if engine.dialect.name != "postgresql":
+        use_bus(LocalInvalidationBus())
+        return
+    bus = PostgresInvalidationBus(engine)
+    try:
+        await bus.start()
+    except Exception:
+        logger.warning("LISTEN/NOTIFY unavailable; cache invalidation stays process-local", exc_info=True)
+        use_bus(LocalInvalidationBus())
+        return
+    use_bus(bus)
+
+
+async def stop() -> None:
+    await _bus.stop()
+    use_bus(LocalInvalidationBus())
@@ -0,0 +1,124 @@
+"""Tag index maintenance and tag cloud queries."""
+
+from __future__ import annotations
+
+import os
+import uuid
+from collections import Counter
+from typing import Mapping, Optional, Sequence
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import dialect_insert
+from ..models.book_tag import BookTag
+from ..models.tag import Tag
+from . import invalidation
+from .cache import TTLCache
+
+# Tag cloud results; cleared together with the catalog cache on every book write
+tags_cache = TTLCache(maxsize=64, ttl=float(os.getenv("CATALOG_CACHE_TTL_SECONDS", "300")))
+
+invalidation.subscribe(invalidation.CATALOG, tags_cache.clear)
+
+
+def _normalize(tags: Sequence[str]) -> list[str]:
+    return list(dict.fromkeys(tag.strip() for tag in tags if tag and tag.strip()))
+
+
+async def replace_book_tags(session: AsyncSession, tags_by_book: Mapping[uuid.UUID, Sequence[str]]) -> Counter:
+    """
+    Rewrite the ``book_tags`` rows of the given books (without committing).
+    
+    Args:
+        session: Database session
+        tags_by_book: New ``Book.tags`` value per book id
+        
+    Returns:
+        Usage count change per tag, for ``track_book_counts``
+    """
+    deltas: Counter = Counter()
+    if not tags_by_book:
+        return deltas
+    stmt = delete(BookTag).where(BookTag.book_id.in_(list(tags_by_book))).returning(BookTag.tag)
+    deltas.subtract((await session.execute(stmt)).scalars().all())
+    rows = [{"book_id": book_id, "tag": tag} for book_id, tags in tags_by_book.items() for tag in _normalize(tags)]
+    if rows:
+        await session.execute(insert(BookTag), rows)
+        deltas.update(row["tag"] for row in rows)
+    return deltas
+
+
+async def delete_book_tags(session: AsyncSession, book_ids) -> Counter:
+    """
+    Remove tag rows of deleted books (without committing).
+    
+    Args:
+        session: Database session
+        book_ids: List or SELECT of book ids
+        
+    Returns:
+        Usage count change per tag, for ``track_book_counts``
+    """
+    stmt = delete(BookTag).where(BookTag.book_id.in_(book_ids)).returning(BookTag.tag)
+    deltas: Counter = Counter()
+    deltas.subtract((await session.execute(stmt)).scalars().all())
+    return deltas
+
+
+async def adjust_tag_counts(session: AsyncSession, deltas: Mapping[str, int]) -> None:
+    """
+    Apply usage count changes to ``tags`` (without committing).
+    
+    Missing tags are created and counts are incremented in one
+    INSERT ... ON CONFLICT statement; tags left unused are removed.
+    
+    Args:
+        session: Database session
+        deltas: Count change per tag
+    """
+    rows = [{"name": name, "usage_count": delta} for name, delta in sorted(deltas.items()) if delta]
+    if not rows:
+        return
+    stmt = dialect_insert(session, Tag)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["name"],
+        set_={"usage_count": Tag.usage_count + stmt.excluded.usage_count},
+    )
+    await session.execute(stmt, rows)
+    removed = [row["name"] for row in rows if row["usage_count"] < 0]
+    if removed:
+        await session.execute(delete(Tag).where(Tag.name.in_(removed), Tag.usage_count <= 0))
+
+
+async def list_tags(
+    session: AsyncSession,
+    *,
+    prefix: Optional[str] = None,
+    limit: int = 100,
+) -> list[tuple[str, int]]:
+    """
+    Return (tag, usage_count) pairs, most used first.
+    
+    Counts are read from the ``tags`` table maintained by the book services
+    and cached until the next catalog write.
+    
+    Args:
+        session: Database session
+        prefix: Optional tag prefix
+        limit: Maximum number of tags
+        
+    Returns:
+        List of (name, usage_count)
+    """
+    key = (prefix, limit)
+    cached = tags_cache.get(key)
+    if cached is not None:
+        return cached
+    stmt = select(Tag.name, Tag.usage_count)
+    if prefix:
+        stmt = stmt.where(Tag.name.startswith(prefix, autoescape=True))
+    stmt = stmt.order_by(Tag.usage_count.desc(), Tag.name).limit(limit)
+    items = [(name, int(count)) for name, count in (await session.execute(stmt)).all()]
+    tags_cache.set(key, items)
+    return items
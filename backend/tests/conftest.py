@@ -2,36 +2,31 @@ from __future__ import annotations
 
 import os
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 
+import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import StaticPool
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool, StaticPool
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# PostgreSQL-only tests (tsvector search, EXPLAIN estimates) run when this is set,
+# e.g. postgresql+asyncpg://postgres@localhost/library_test; the database is reset.
+TEST_POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
 
 
-@pytest_asyncio.fixture()
-async def app():
+def _configure_environment() -> None:
     os.environ.setdefault("JWT_SECRET_KEY", "test-secret-key")
     # Cloudinary required settings for app startup; use dummy values in tests
     os.environ.setdefault("CLOUDINARY_CLOUD_NAME", "dummy")
     os.environ.setdefault("CLOUDINARY_API_KEY", "dummy")
     os.environ.setdefault("CLOUDINARY_API_SECRET", "dummy")
 
-    # Import application modules after environment is configured
-    from backend.models.base import Base
-
-    engine = create_async_engine(
-        TEST_DATABASE_URL,
-        echo=False,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-
-    async with engine.begin() as connection:
-        await connection.run_sync(Base.metadata.create_all)
 
+@asynccontextmanager
+async def _application(engine: AsyncEngine):
     session_factory = async_sessionmaker(
         bind=engine,
         expire_on_commit=False,
@@ -41,14 +36,22 @@ async def app():
     )
 
     from backend.main import create_app
-    from backend.database import get_session
+    from backend.database import get_session, get_session_factory
+    from backend.services import books as books_service
+    from backend.services import invalidation
     application = create_app()
 
+    # Keep invalidations in-process (SQLite has no LISTEN/NOTIFY), and make sure
+    # process-wide caches do not leak between per-test databases.
+    invalidation.use_bus(invalidation.LocalInvalidationBus())
+    await books_service.invalidate_catalog_cache()
+
     async def _get_test_session() -> AsyncGenerator[AsyncSession, None]:
         async with session_factory() as session:
             yield session
 
     application.dependency_overrides[get_session] = _get_test_session
+    application.dependency_overrides[get_session_factory] = lambda: session_factory
 
     try:
         yield application
@@ -57,8 +60,59 @@ async def app():
         await engine.dispose()
 
 
+@pytest_asyncio.fixture()
+async def app():
+    _configure_environment()
+
+    # Import application modules after environment is configured
+    from backend.models.base import Base
+
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    async with _application(engine) as application:
+        yield application
+
+
+@pytest_asyncio.fixture()
+async def pg_app():
+    if not TEST_POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    _configure_environment()
+
+    from backend.models.base import Base
+
+    engine = create_async_engine(TEST_POSTGRES_URL, echo=False, poolclass=NullPool)
+
+    async with engine.begin() as connection:
+        # Start from an empty schema whatever an earlier run left behind: drop_all
+        # only knows the models imported so far and fails on foreign keys of the others.
+        await connection.execute(text("DROP SCHEMA public CASCADE"))
+        await connection.execute(text("CREATE SCHEMA public"))
+        # Needed by the trigram index on documents.content_text, as in migration a1b2c3d4e5f6
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await connection.run_sync(Base.metadata.create_all)
+
+    async with _application(engine) as application:
+        yield application
+
+
 @pytest_asyncio.fixture()
 async def client(app) -> AsyncGenerator[AsyncClient, None]:
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://testserver") as test_client:
         yield test_client
+
+
+@pytest_asyncio.fixture()
+async def pg_client(pg_app) -> AsyncGenerator[AsyncClient, None]:
+    transport = ASGITransport(app=pg_app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as test_client:
+        yield test_client
@@ -0,0 +1,44 @@
+"""Shared setup for the catalog API tests: seeded books and admin credentials."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from httpx import AsyncClient
+
+from backend.database import get_session
+from backend.models.book import Book, Language
+from backend.models.category import Category
+
+
+async def seed_books(app, count: int, *, category: str = "Fiction", same_timestamp: bool = False) -> list[Book]:
+    """Insert ``count`` books directly through the test session."""
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    books: list[Book] = []
+    async for session in app.dependency_overrides[get_session]():
+        if await session.get(Category, category) is None:
+            session.add(Category(name=category))
+        for i in range(count):
+            book = Book(
+                title=f"Book {i:03d}",
+                author=f"Author {i % 3}",
+                description="Seeded",
+                pdf_url=f"https://example.com/{i}.pdf",
+                category=category,
+                tags=["seed"],
+                language=Language.EN if i % 2 else Language.FR,
+                created_at=base if same_timestamp else base + timedelta(minutes=i),
+            )
+            session.add(book)
+            books.append(book)
+        await session.commit()
+    return books
+
+
+async def admin_headers(client: AsyncClient, username: str = "catalogadmin") -> dict:
+    await client.post(
+        "/auth/create",
+        json={"username": username, "password": "CatalogAdmin123", "full_name": "Catalog Admin", "role": "admin"},
+    )
+    login = await client.post("/auth/login", json={"username": username, "password": "CatalogAdmin123"})
+    return {"Authorization": f"Bearer {login.json()['access_token']}"}
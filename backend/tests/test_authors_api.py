@@ -0,0 +1,51 @@
+"""API tests for the authors projection."""
+
+from __future__ import annotations
+
+import pytest
+from httpx import AsyncClient
+
+from backend.tests.helpers import admin_headers
+
+
+@pytest.mark.asyncio
+async def test_author_index_counts_books_and_filters_by_author_id(app, client: AsyncClient) -> None:
+    import json
+
+    headers = await admin_headers(client, "authoradmin")
+    names = ["Emile Zola", "emile ZOLA", "Albert Camus", "Victor Hugo", "Élodie Roux"]
+    rows = [
+        {"title": f"T{i}", "author": name, "category": "Fiction", "language": "FR", "pdf_url": f"https://x/{i}"}
+        for i, name in enumerate(names)
+    ]
+    body = "\n".join(json.dumps(row) for row in rows)
+    assert (await client.post("/books/import", content=body, headers=headers)).json()["imported"] == 5
+
+    first = await client.get("/authors/", params={"limit": 3})
+    rest = await client.get("/authors/", params={"limit": 3, "cursor": first.headers["X-Next-Cursor"]})
+    listed = first.json() + rest.json()
+    assert [(a["name"], a["book_count"]) for a in listed] == [
+        ("Albert Camus", 1),
+        ("Élodie Roux", 1),
+        ("Emile Zola", 2),
+        ("Victor Hugo", 1),
+    ]
+    assert "X-Next-Cursor" not in rest.headers
+
+    assert [a["name"] for a in (await client.get("/authors/", params={"prefix": "EL"})).json()] == ["Élodie Roux"]
+    zola = (await client.get("/authors/", params={"prefix": "emi"})).json()
+    assert [a["name"] for a in zola] == ["Emile Zola"]
+    assert [a["name"] for a in (await client.get("/authors/", params={"q": "hug"})).json()] == ["Victor Hugo"]
+
+    books = (await client.get("/books/", params={"author_id": zola[0]["id"]})).json()
+    assert sorted(b["title"] for b in books) == ["T0", "T1"]
+
+    moved = await client.patch(
+        "/books/bulk", json={"author_id": [zola[0]["id"]], "changes": {"author": "Victor Hugo"}}, headers=headers
+    )
+    assert moved.json() == {"matched": 2}
+    counts = {a["name"]: a["book_count"] for a in (await client.get("/authors/")).json()}
+    assert counts == {"Albert Camus": 1, "Élodie Roux": 1, "Victor Hugo": 3}
+
+    await client.post("/books/bulk-delete", json={"author": ["victor hugo"]}, headers=headers)
+    assert [a["name"] for a in (await client.get("/authors/")).json()] == ["Albert Camus", "Élodie Roux"]
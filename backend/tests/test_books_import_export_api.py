@@ -0,0 +1,141 @@
+"""API tests for streamed catalog export and bulk import."""
+
+from __future__ import annotations
+
+import pytest
+from httpx import AsyncClient
+
+from backend.database import get_session
+from backend.tests.helpers import admin_headers, seed_books
+
+
+@pytest.mark.asyncio
+async def test_export_streams_catalog_as_ndjson_and_csv(app, client: AsyncClient, monkeypatch) -> None:
+    import csv
+    import io
+    import json
+
+    from backend.services import catalog_export
+
+    monkeypatch.setattr(catalog_export, "_BATCH_SIZE", 2)
+    books = await seed_books(app, 5)
+    headers = await admin_headers(client)
+
+    assert (await client.get("/books/export")).status_code == 401
+
+    ndjson = await client.get("/books/export", headers=headers)
+    assert ndjson.status_code == 200
+    assert ndjson.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert {r["id"] for r in records} == {str(b.id) for b in books}
+    assert records[0]["tags"] == ["seed"] and records[0]["has_document"] is False
+
+    exported = await client.get("/books/export", params={"format": "csv"}, headers=headers)
+    rows = list(csv.DictReader(io.StringIO(exported.text)))
+    assert len(rows) == 5
+    assert rows[0]["tags"] == "seed"
+    assert rows[0]["language"] in {"FR", "EN"}
+
+
+@pytest.mark.asyncio
+async def test_import_upserts_rows_and_reports_errors(app, client: AsyncClient, monkeypatch) -> None:
+    import json
+
+    from backend.services import catalog_import
+
+    monkeypatch.setattr(catalog_import, "_BATCH_SIZE", 2)
+    existing = (await seed_books(app, 1))[0]
+    headers = await admin_headers(client, "importadmin")
+    rows = [
+        {"title": "Imported A", "author": "Ann", "category": "Poetry", "language": "EN", "pdf_url": "https://x/a.pdf"},
+        {"title": "Missing pdf", "author": "Bob", "category": "Poetry", "language": "EN"},
+        {
+            "id": str(existing.id),
+            "title": "Renamed",
+            "author": "Author 0",
+            "category": "Fiction",
+            "language": "FR",
+            "pdf_url": "https://x/0.pdf",
+        },
+    ]
+    body = "\n".join(json.dumps(row) for row in rows) + "\nnot json\n"
+
+    response = await client.post("/books/import", content=body, headers=headers)
+    assert response.status_code == 200
+    report = response.json()
+    assert report["imported"] == 2
+    assert [error["line"] for error in report["errors"]] == [2, 4]
+    assert "pdf_url" in report["errors"][0]["error"]
+
+    titles = {b["title"] for b in (await client.get("/books/")).json()}
+    assert titles == {"Imported A", "Renamed"}
+    assert "Poetry" in {c["name"] for c in (await client.get("/categories/")).json()}
+
+    csv_body = 'title,author,category,language,pdf_url,tags\n"Multi\nline",Cy,Poetry,FR,https://x/c.pdf,a|b\n'
+    csv_report = (await client.post("/books/import", params={"format": "csv"}, content=csv_body, headers=headers)).json()
+    assert csv_report == {"imported": 1, "failed": 0, "errors": []}
+    imported = [b for b in (await client.get("/books/")).json() if b["author"] == "Cy"]
+    assert imported[0]["title"] == "Multi\nline" and imported[0]["tags"] == ["a", "b"]
+
+    assert (await client.post("/books/import", content=body)).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_import_reports_undecodable_lines_and_invalidates_after_partial_failure(
+    app, client: AsyncClient, monkeypatch
+) -> None:
+    import json
+
+    from backend.services import catalog_import
+
+    headers = await admin_headers(client, "importadmin")
+    row = {"title": "Kept", "author": "Ann", "category": "Poetry", "language": "EN", "pdf_url": "https://x/a.pdf"}
+    body = json.dumps(row).encode() + b'\n{"title": "caf\xe9"}\n'
+    report = (await client.post("/books/import", content=body, headers=headers)).json()
+    assert report["imported"] == 1
+    assert report["errors"] == [{"line": 2, "error": "Invalid UTF-8 at byte 14"}]
+
+    csv_body = b'title,author,category,language,pdf_url\n"Bad\n\xff",Cy,Poetry,FR,https://x/c.pdf\nOk,Cy,Poetry,FR,https://x/d.pdf\n'
+    csv_report = (await client.post("/books/import", params={"format": "csv"}, content=csv_body, headers=headers)).json()
+    assert csv_report["imported"] == 1
+    assert [error["line"] for error in csv_report["errors"]] == [2]
+
+    invalidations: list[bool] = []
+
+    async def _record() -> None:
+        invalidations.append(True)
+
+    async def _broken_stream():
+        yield 1, dict(row, title="Committed")
+        raise ConnectionResetError("client went away")
+
+    monkeypatch.setattr(catalog_import, "_BATCH_SIZE", 1)
+    monkeypatch.setattr(catalog_import, "invalidate_catalog_cache", _record)
+    async for session in app.dependency_overrides[get_session]():
+        with pytest.raises(ConnectionResetError):
+            await catalog_import.import_books(session, _broken_stream())
+    assert invalidations == [True]
+
+
+@pytest.mark.asyncio
+async def test_import_applies_rows_repeating_an_id_last_one_wins(app, client: AsyncClient) -> None:
+    import json
+    import uuid
+
+    from sqlalchemy import select
+
+    from backend.models.author import Author
+    from backend.models.book import Book
+
+    headers = await admin_headers(client, "dupadmin")
+    book_id = str(uuid.uuid4())
+    row = {"id": book_id, "title": "First", "author": "Ann", "category": "Poetry", "language": "EN", "pdf_url": "https://x/a.pdf"}
+    body = b"".join(json.dumps(dict(row, **changes)).encode() + b"\n" for changes in ({}, {"title": "Second", "author": "Bo"}))
+    report = (await client.post("/books/import", content=body, headers=headers)).json()
+    assert report == {"imported": 2, "failed": 0, "errors": []}
+
+    async for session in app.dependency_overrides[get_session]():
+        book = await session.get(Book, uuid.UUID(book_id))
+        assert (book.title, book.author) == ("Second", "Bo")
+        counts = dict((await session.execute(select(Author.name, Author.book_count))).all())
+        assert counts.get("Bo") == 1 and not counts.get("Ann")
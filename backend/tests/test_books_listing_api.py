@@ -0,0 +1,284 @@
+"""API tests for book listing reads: pagination, filters, projections, ETags, caching, facets and batch lookup."""
+
+from __future__ import annotations
+
+import pytest
+from httpx import AsyncClient
+
+from backend.database import get_session
+from backend.models.book import Book
+from backend.tests.helpers import seed_books
+
+
+@pytest.mark.asyncio
+async def test_list_books_paginates_with_cursor(app, client: AsyncClient) -> None:
+    """Walking the cursor returns every book exactly once, newest first."""
+    await seed_books(app, 7)
+
+    seen: list[str] = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/books/", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page) <= 3
+        seen.extend(b["title"] for b in page)
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert pages == 3
+    assert seen == [f"Book {i:03d}" for i in reversed(range(7))]
+
+
+@pytest.mark.asyncio
+async def test_list_books_cursor_breaks_timestamp_ties_by_id(app, client: AsyncClient) -> None:
+    """Books sharing created_at are neither skipped nor repeated across pages."""
+    books = await seed_books(app, 5, same_timestamp=True)
+
+    first = await client.get("/books/", params={"limit": 2})
+    second = await client.get("/books/", params={"limit": 10, "cursor": first.headers["X-Next-Cursor"]})
+    ids = [b["id"] for b in first.json()] + [b["id"] for b in second.json()]
+
+    assert len(ids) == 5
+    assert set(ids) == {str(b.id) for b in books}
+    assert "X-Next-Cursor" not in second.headers
+
+
+@pytest.mark.asyncio
+async def test_list_books_rejects_invalid_cursor(client: AsyncClient) -> None:
+    response = await client.get("/books/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_books_sorts_by_title_across_pages(app, client: AsyncClient) -> None:
+    await seed_books(app, 5)
+
+    first = await client.get("/books/", params={"sort": "title", "limit": 3, "fields": "title"})
+    rest = await client.get(
+        "/books/",
+        params={"sort": "title", "limit": 3, "fields": "title", "cursor": first.headers["X-Next-Cursor"]},
+    )
+    assert [b["title"] for b in first.json() + rest.json()] == [f"Book {i:03d}" for i in range(5)]
+
+    oldest = await client.get("/books/", params={"sort": "created_at", "limit": 1})
+    assert oldest.json()[0]["title"] == "Book 000"
+
+    mismatched = await client.get("/books/", params={"sort": "author", "cursor": first.headers["X-Next-Cursor"]})
+    assert mismatched.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_books_multi_value_and_date_filters(app, client: AsyncClient) -> None:
+    await seed_books(app, 6, category="Fiction")
+    await seed_books(app, 2, category="History")
+    await seed_books(app, 1, category="Poetry")
+
+    both = await client.get("/books/", params=[("category", "Fiction"), ("category", "History")])
+    assert {b["category"] for b in both.json()} == {"Fiction", "History"}
+    assert len(both.json()) == 8
+
+    authors = await client.get("/books/", params=[("author", "author 0"), ("author", "AUTHOR 1"), ("category", "Fiction")])
+    assert {b["author"] for b in authors.json()} == {"Author 0", "Author 1"}
+    assert len(authors.json()) == 4
+
+    window = await client.get(
+        "/books/",
+        params={
+            "category": "Fiction",
+            "created_after": "2025-01-01T00:02:00+00:00",
+            "created_before": "2025-01-01T00:05:00+00:00",
+        },
+    )
+    assert [b["title"] for b in window.json()] == ["Book 004", "Book 003", "Book 002"]
+
+    facets = (await client.get("/books/facets", params=[("category", "History"), ("category", "Poetry")])).json()
+    assert facets["category"] == [{"value": "History", "count": 2}, {"value": "Poetry", "count": 1}]
+
+
+@pytest.mark.asyncio
+async def test_book_reads_skip_document_text(app, client: AsyncClient) -> None:
+    """has_document comes from an EXISTS subquery; document text is never selected."""
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    from backend.models.document import Document
+
+    books = await seed_books(app, 2)
+    async for session in app.dependency_overrides[get_session]():
+        session.add(Document(book_id=books[0].id, filename="a.pdf", content_text="x" * 10_000))
+        await session.commit()
+
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", _capture)
+    try:
+        listing = await client.get("/books/")
+        detail = await client.get(f"/books/{books[0].id}")
+    finally:
+        event.remove(Engine, "before_cursor_execute", _capture)
+
+    flags = {b["id"]: b["has_document"] for b in listing.json()}
+    assert flags == {str(books[0].id): True, str(books[1].id): False}
+    assert detail.json()["stream_endpoint"] == f"/books/{books[0].id}/stream"
+    assert statements
+    assert not any("content_text" in s for s in statements)
+    assert not any("JOIN categories" in s for s in statements)
+
+
+@pytest.mark.asyncio
+async def test_summary_view_returns_slim_payload(app, client: AsyncClient) -> None:
+    books = await seed_books(app, 3)
+
+    listing = await client.get("/books/", params={"view": "summary"})
+    assert listing.status_code == 200
+    for item in listing.json():
+        assert set(item) == {"id", "title", "author", "thumbnail_path", "language"}
+
+    detail = await client.get(f"/books/{books[0].id}", params={"fields": "title,stream_endpoint"})
+    assert detail.status_code == 200
+    assert detail.json() == {"title": "Book 000", "stream_endpoint": None}
+
+
+@pytest.mark.asyncio
+async def test_sparse_fields_paginate_and_validate(app, client: AsyncClient) -> None:
+    await seed_books(app, 3)
+
+    first = await client.get("/books/", params={"fields": "title", "limit": 2})
+    assert [b["title"] for b in first.json()] == ["Book 002", "Book 001"]
+    rest = await client.get(
+        "/books/", params={"fields": "title", "limit": 2, "cursor": first.headers["X-Next-Cursor"]}
+    )
+    assert rest.json() == [{"title": "Book 000"}]
+
+    bad = await client.get("/books/", params={"fields": "title,password"})
+    assert bad.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_catalog_etags_answer_304_until_catalog_changes(app, client: AsyncClient) -> None:
+    books = await seed_books(app, 2)
+
+    for url in ("/books/", f"/books/{books[0].id}", "/categories/"):
+        first = await client.get(url)
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+        assert etag.startswith('W/"')
+
+        cached = await client.get(url, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["ETag"] == etag
+
+    listing_etag = (await client.get("/books/")).headers["ETag"]
+    detail_etag = (await client.get(f"/books/{books[0].id}")).headers["ETag"]
+    categories_etag = (await client.get("/categories/")).headers["ETag"]
+
+    async for session in app.dependency_overrides[get_session]():
+        book = await session.get(Book, books[0].id)
+        book.title = "Renamed"
+        await session.commit()
+
+    assert (await client.get("/books/", headers={"If-None-Match": listing_etag})).status_code == 200
+    changed = await client.get(f"/books/{books[0].id}", headers={"If-None-Match": detail_etag})
+    assert changed.status_code == 200
+    assert changed.json()["title"] == "Renamed"
+    assert (await client.get("/categories/", headers={"If-None-Match": categories_etag})).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_catalog_cache_serves_repeat_reads_and_reports_stats(app, client: AsyncClient) -> None:
+    from backend.services import books as books_service
+
+    books = await seed_books(app, 2)
+    await client.post(
+        "/auth/create",
+        json={"username": "cacheadmin", "password": "CacheAdmin123", "full_name": "Cache Admin", "role": "admin"},
+    )
+    login = await client.post("/auth/login", json={"username": "cacheadmin", "password": "CacheAdmin123"})
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    before = (await client.get("/admin/stats/cache", headers=headers)).json()
+    first = await client.get("/books/")
+    second = await client.get("/books/")
+    after = (await client.get("/admin/stats/cache", headers=headers)).json()
+
+    assert first.json() == second.json()
+    assert after["misses"] == before["misses"] + 1
+    assert after["hits"] == before["hits"] + 1
+
+    from backend.schemas.book import BookUpdate
+
+    async for session in app.dependency_overrides[get_session]():
+        book = await books_service.get_book(session, books[0].id)
+        await books_service.update_book(session, book, BookUpdate(title="Fresh"))
+    assert len(books_service.catalog_cache) == 0
+    titles = [b["title"] for b in (await client.get("/books/")).json()]
+    assert "Fresh" in titles
+
+    forbidden = await client.get("/admin/stats/cache")
+    assert forbidden.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_facets_count_categories_languages_and_top_authors(app, client: AsyncClient) -> None:
+    await seed_books(app, 5, category="Fiction")
+    await seed_books(app, 1, category="History")
+
+    response = await client.get("/books/facets", params={"top_authors": 2})
+    assert response.status_code == 200
+    facets = response.json()
+    assert facets["category"] == [{"value": "Fiction", "count": 5}, {"value": "History", "count": 1}]
+    assert facets["language"] == [{"value": "FR", "count": 4}, {"value": "EN", "count": 2}]
+    assert facets["author"] == [{"value": "Author 0", "count": 3}, {"value": "Author 1", "count": 2}]
+
+    filtered = (await client.get("/books/facets", params={"language": "EN"})).json()
+    assert filtered["language"] == [{"value": "EN", "count": 2}]
+    assert sum(item["count"] for item in filtered["category"]) == 2
+
+    # Written without publishing an invalidation, as by a worker the bus missed
+    await seed_books(app, 1, category="History")
+    refreshed = (await client.get("/books/facets", params={"top_authors": 2})).json()
+    assert refreshed["category"] == [{"value": "Fiction", "count": 5}, {"value": "History", "count": 2}]
+
+
+def test_facets_statement_uses_grouping_sets_on_postgres() -> None:
+    from sqlalchemy.dialects import postgresql
+
+    from backend.services.books import BookFilters, facets_statement
+
+    filters = BookFilters.build(category="Fiction")
+    sql = str(facets_statement("postgresql", filters).compile(dialect=postgresql.dialect()))
+    assert "GROUPING SETS" in sql
+    assert "row_number()" in sql
+
+
+@pytest.mark.asyncio
+async def test_batch_lookup_keys_books_by_id_and_keeps_missing_as_null(app, client: AsyncClient) -> None:
+    import uuid
+
+    books = await seed_books(app, 3)
+    missing = str(uuid.uuid4())
+    ids = [str(books[2].id), missing, str(books[0].id)]
+
+    response = await client.post("/books/batch", json={"ids": ids})
+    assert response.status_code == 200
+    body = response.json()
+    assert list(body) == ids
+    assert body[missing] is None
+    assert body[str(books[2].id)]["title"] == "Book 002"
+
+    slim = await client.post("/books/batch", params={"view": "summary"}, json={"ids": ids[:1]})
+    assert set(slim.json()[ids[0]]) == {"id", "title", "author", "thumbnail_path", "language"}
+
+    too_many = await client.post("/books/batch", json={"ids": [str(uuid.uuid4()) for _ in range(501)]})
+    assert too_many.status_code == 400
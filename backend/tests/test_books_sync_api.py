@@ -0,0 +1,111 @@
+"""API tests for the catalog delta sync feed (GET /books/changes)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+from httpx import AsyncClient
+
+from backend.database import get_session
+from backend.models.book import Book
+from backend.tests.helpers import admin_headers, seed_books
+
+
+@pytest.mark.asyncio
+async def test_changes_feed_reports_updates_and_deletions_since_token(app, client: AsyncClient) -> None:
+    from backend.services import books as books_service
+
+    books = await seed_books(app, 3)
+
+    snapshot = await client.get("/books/changes", params={"limit": 2})
+    assert snapshot.status_code == 200
+    first = snapshot.json()
+    assert len(first["books"]) == 2 and first["has_more"] and first["deleted"] == []
+    rest = (await client.get("/books/changes", params={"since": first["sync_token"]})).json()
+    assert len(rest["books"]) == 1 and not rest["has_more"]
+    token = rest["sync_token"]
+
+    idle = (await client.get("/books/changes", params={"since": token})).json()
+    assert idle["books"] == [] and idle["deleted"] == [] and idle["sync_token"] == token
+
+    async for session in app.dependency_overrides[get_session]():
+        book = await session.get(Book, books[1].id)
+        book.title = "Edited"
+        await session.commit()
+        await books_service.delete_book(session, await session.get(Book, books[0].id))
+
+    delta = (await client.get("/books/changes", params={"since": token})).json()
+    assert [b["title"] for b in delta["books"]] == ["Edited"]
+    assert delta["deleted"] == [str(books[0].id)]
+
+    by_time = await client.get("/books/changes", params={"since": "2000-01-01T00:00:00+00:00"})
+    assert by_time.json()["deleted"] == [str(books[0].id)]
+    assert (await client.get("/books/changes", params={"since": "yesterday"})).status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_changes_feed_follows_commit_order_not_timestamps(app, client: AsyncClient) -> None:
+    from sqlalchemy import select
+
+    from backend.services.pagination import encode_cursor
+
+    books = await seed_books(app, 3)
+    token = (await client.get("/books/changes")).json()["sync_token"]
+
+    # A worker whose clock lags behind stamps an old updated_at: the write is still reported
+    async for session in app.dependency_overrides[get_session]():
+        book = await session.get(Book, books[2].id)
+        book.title = "Late clock"
+        book.updated_at = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        await session.commit()
+    delta = (await client.get("/books/changes", params={"since": token})).json()
+    assert [b["title"] for b in delta["books"]] == ["Late clock"]
+
+    # A bulk update numbers every book it writes with the same, later change number
+    headers = await admin_headers(client, "syncadmin")
+    bulk = await client.patch("/books/bulk", json={"category": ["Fiction"], "changes": {"tags": ["x"]}}, headers=headers)
+    assert bulk.json()["matched"] == 3
+    async for session in app.dependency_overrides[get_session]():
+        numbers = set((await session.execute(select(Book.change_seq))).scalars())
+    assert len(numbers) == 1
+    after_bulk = (await client.get("/books/changes", params={"since": delta["sync_token"]})).json()
+    assert len(after_bulk["books"]) == 3
+
+    # Tokens of any other shape are rejected
+    malformed = encode_cursor(["sync", "2000-01-01T00:00:00+00:00", str(books[0].id), 0])
+    assert (await client.get("/books/changes", params={"since": malformed})).status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_catalog_writes_take_the_change_number_before_other_rows(app, client: AsyncClient) -> None:
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    books = await seed_books(app, 4)
+    headers = await admin_headers(client, "lockadmin")
+    writes: list[str] = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().split(None, 1)[0].upper() in ("INSERT", "UPDATE", "DELETE"):
+            writes.append(statement)
+
+    requests = [
+        ("PUT", f"/books/{books[0].id}", {"json": {"category": "Poetry", "author": "Someone"}}),
+        ("PATCH", "/books/bulk", {"json": {"ids": [str(books[1].id)], "changes": {"category": "Essays"}}}),
+        ("POST", "/books/bulk-delete", {"json": {"ids": [str(books[2].id)]}}),
+        ("DELETE", f"/books/{books[3].id}", {}),
+        ("PUT", "/categories/Poetry", {"json": {"name": "Verse"}}),
+        ("POST", "/categories/merge", {"json": {"sources": ["Verse", "Essays"], "target": "Prose"}}),
+        ("POST", "/books/import", {"content": b'{"title": "T", "author": "A", "category": "New", "language": "EN", "pdf_url": "https://x/t.pdf"}\n'}),
+    ]
+    for method, url, kwargs in requests:
+        writes.clear()
+        event.listen(Engine, "before_cursor_execute", on_execute)
+        try:
+            response = await client.request(method, url, headers=headers, **kwargs)
+        finally:
+            event.remove(Engine, "before_cursor_execute", on_execute)
+        assert response.status_code < 300, (url, response.text)
+        # Counter rows (authors, categories, tags) are only locked after the change number
+        assert "catalog_changes" in writes[0], (method, url, writes[0])
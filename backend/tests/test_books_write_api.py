@@ -0,0 +1,97 @@
+"""API tests for set-based bulk writes and single-transaction book creation."""
+
+from __future__ import annotations
+
+import pytest
+from httpx import AsyncClient
+
+from backend.tests.helpers import admin_headers, seed_books
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_and_delete_apply_set_based_changes(app, client: AsyncClient) -> None:
+    books = await seed_books(app, 6)
+    headers = await admin_headers(client, "bulkadmin")
+
+    empty = await client.patch("/books/bulk", json={"changes": {"tags": ["x"]}}, headers=headers)
+    assert empty.status_code == 400
+
+    moved = await client.patch(
+        "/books/bulk",
+        json={"author": ["author 0"], "changes": {"category": "Archive", "tags": ["moved"]}},
+        headers=headers,
+    )
+    assert moved.json() == {"matched": 2}
+    archive = (await client.get("/books/", params={"category": "Archive"})).json()
+    assert {b["author"] for b in archive} == {"Author 0"}
+    assert all(b["tags"] == ["moved"] for b in archive)
+
+    by_id = await client.patch(
+        "/books/bulk", json={"ids": [str(books[1].id)], "changes": {"language": "EN"}}, headers=headers
+    )
+    assert by_id.json() == {"matched": 1}
+
+    deleted = await client.post("/books/bulk-delete", json={"category": ["Archive"]}, headers=headers)
+    assert deleted.json() == {"matched": 2}
+    remaining = (await client.get("/books/")).json()
+    assert len(remaining) == 4
+    changes = (await client.get("/books/changes", params={"since": "2000-01-01T00:00:00+00:00"})).json()
+    assert set(changes["deleted"]) == {str(books[0].id), str(books[3].id)}
+
+    assert (await client.post("/books/bulk-delete", json={"category": ["Fiction"]})).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_create_with_file_persists_in_one_transaction(
+    app, client: AsyncClient, monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    from backend.services import documents as documents_service
+
+    async def fake_upload(buffer, book_id, *, generate_thumbnail=True):
+        return None, None
+
+    monkeypatch.setenv("UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(documents_service, "upload_to_cloudinary", fake_upload)
+    monkeypatch.setattr(documents_service, "extract_pdf_pages", lambda path: ["Once upon a time", "The end"])
+    headers = await admin_headers(client, "fileadmin")
+
+    statements: list[str] = []
+    commits: list[object] = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.lstrip().split(None, 1)[0].upper())
+
+    def on_commit(conn):
+        commits.append(conn)
+
+    event.listen(Engine, "before_cursor_execute", on_execute)
+    event.listen(Engine, "commit", on_commit)
+    try:
+        response = await client.post(
+            "/books/create_with_file",
+            data={"title": "Tales", "author": "Teller", "category": "Folklore", "language": "EN"},
+            files={"file": ("tales.pdf", b"%PDF-1.4 tales", "application/pdf")},
+            headers=headers,
+        )
+    finally:
+        event.remove(Engine, "before_cursor_execute", on_execute)
+        event.remove(Engine, "commit", on_commit)
+
+    assert response.status_code == 201, response.text
+    assert response.json()["has_document"] is True
+    # One SELECT for the current user, then writes only: change number,
+    # category, book, document, its pages (one executemany) and author upserts
+    # plus the category usage bump. No refreshes.
+    assert statements[0] == "SELECT"
+    assert "SELECT" not in statements[1:]
+    assert statements.count("INSERT") == 6
+    assert len(statements) <= 9
+    assert len(commits) == 1
+
+    detail = await client.get(f"/books/{response.json()['id']}")
+    assert detail.status_code == 200
+    assert detail.json()["has_document"] is True
+    assert detail.json()["category"] == "Folklore"
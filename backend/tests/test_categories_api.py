@@ -0,0 +1,116 @@
+"""API tests for category usage counts, creation, rename and merge."""
+
+from __future__ import annotations
+
+import pytest
+from httpx import AsyncClient
+
+from backend.database import get_session
+from backend.tests.helpers import admin_headers, seed_books
+
+
+@pytest.mark.asyncio
+async def test_category_usage_counts_follow_book_writes(app, client: AsyncClient) -> None:
+    import json
+
+    from backend.services import categories as categories_service
+
+    headers = await admin_headers(client, "categoryadmin")
+    rows = [
+        {"title": f"T{i}", "author": "A", "category": cat, "language": "FR", "pdf_url": f"https://x/{i}"}
+        for i, cat in enumerate(["Poetry", "Poetry", "Drama"])
+    ]
+    await client.post("/books/import", content="\n".join(json.dumps(row) for row in rows), headers=headers)
+
+    def usage(listing):
+        return {c["name"]: c["usage_count"] for c in listing.json()}
+
+    assert usage(await client.get("/categories/")) == {"Poetry": 2, "Drama": 1}
+
+    await client.patch("/books/bulk", json={"category": ["Poetry"], "changes": {"category": "Drama"}}, headers=headers)
+    assert usage(await client.get("/categories/")) == {"Poetry": 0, "Drama": 3}
+
+    await client.post("/books/bulk-delete", json={"category": ["Drama"]}, headers=headers)
+    assert usage(await client.get("/categories/")) == {"Poetry": 0, "Drama": 0}
+
+    # Books written behind the services' back are picked up by the repair pass
+    await seed_books(app, 2, category="Poetry")
+    async for session in app.dependency_overrides[get_session]():
+        assert dict(await categories_service.list_categories(session, exact=True))["Poetry"] == 2
+        await categories_service.recount_category_usage(session)
+    assert usage(await client.get("/categories/"))["Poetry"] == 2
+
+
+@pytest.mark.asyncio
+async def test_create_category_upserts_batches_and_update_route_uses_it(app, client: AsyncClient) -> None:
+    from backend.services import categories as categories_service
+
+    books = await seed_books(app, 1)
+    async for session in app.dependency_overrides[get_session]():
+        assert await categories_service.create_category(session, ["Fiction", "Essays", "Essays", "Plays"]) == 2
+        assert await categories_service.create_category(session, "Plays") == 0
+
+    headers = await admin_headers(client, "putadmin")
+    response = await client.put(f"/books/{books[0].id}", json={"category": "Satire"}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["category"] == "Satire"
+    names = {c["name"] for c in (await client.get("/categories/")).json()}
+    assert {"Fiction", "Essays", "Plays", "Satire"} <= names
+
+
+@pytest.mark.asyncio
+async def test_category_rename_and_merge_repoint_books(app, client: AsyncClient) -> None:
+    from backend.services import categories as categories_service
+
+    await seed_books(app, 3, category="Fiction")
+    await seed_books(app, 2, category="Novels")
+    await seed_books(app, 1, category="Tales")
+    async for session in app.dependency_overrides[get_session]():
+        await categories_service.recount_category_usage(session)
+    headers = await admin_headers(client, "catadmin")
+
+    def usage(response):
+        return {c["name"]: c["usage_count"] for c in response.json()}
+
+    renamed = await client.put("/categories/Fiction", json={"name": "Stories"}, headers=headers)
+    assert renamed.status_code == 200
+    assert renamed.json() == {"name": "Stories", "books_updated": 3, "categories_removed": 1}
+    assert (await client.put("/categories/Stories", json={"name": "Novels"}, headers=headers)).status_code == 409
+    assert (await client.put("/categories/Missing", json={"name": "X"}, headers=headers)).status_code == 404
+    assert (await client.put("/categories/Stories", json={"name": "X"})).status_code == 403
+
+    counts = usage(await client.get("/categories/"))
+    assert "Fiction" not in counts and counts["Stories"] == 3
+    listed = (await client.get("/books/", params={"category": "Stories"})).json()
+    assert len(listed) == 3
+
+    merged = await client.post(
+        "/categories/merge",
+        json={"sources": ["Novels", "Tales", "Missing", "Stories"], "target": "Stories"},
+        headers=headers,
+    )
+    assert merged.status_code == 200
+    assert merged.json() == {"name": "Stories", "books_updated": 3, "categories_removed": 2}
+    counts = usage(await client.get("/categories/"))
+    assert counts == {"Stories": 6}
+    assert len((await client.get("/books/", params={"category": "Stories"})).json()) == 6
+
+    missing = await client.post("/categories/merge", json={"sources": ["Nope"], "target": "Stories"}, headers=headers)
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_category_rename_without_books_changes_listing_etag(app, client: AsyncClient) -> None:
+    headers = await admin_headers(client, "etagadmin")
+    assert (await client.post("/categories/", json={"name": "Empty"}, headers=headers)).status_code == 201
+    etag = (await client.get("/categories/")).headers["ETag"]
+    assert (await client.get("/categories/", headers={"If-None-Match": etag})).status_code == 304
+
+    assert (await client.put("/categories/Empty", json={"name": "Blank"}, headers=headers)).status_code == 200
+    listing = await client.get("/categories/", headers={"If-None-Match": etag})
+    assert listing.status_code == 200
+    assert [c["name"] for c in listing.json()] == ["Blank"]
+
+    # Renaming back restores the old name and count, but not the old fingerprint
+    assert (await client.put("/categories/Blank", json={"name": "Empty"}, headers=headers)).status_code == 200
+    assert (await client.get("/categories/", headers={"If-None-Match": etag})).status_code == 200
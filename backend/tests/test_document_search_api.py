@@ -0,0 +1,401 @@
+"""API tests for document full-text search, snippets, pagination and in-book search.
+
+Tests taking ``search_app``/``search_client`` run on every search backend
+(SQLite FTS5, and PostgreSQL when TEST_POSTGRES_URL is set) and only assert
+what the backends share. Engine-specific output (stemming, snippet windows,
+count estimates, generated SQL) is checked by the tests marked ``sqlite`` or
+``postgresql``; ``services.documents.SearchBackend`` lists the differences.
+"""
+
+from __future__ import annotations
+
+import pytest
+from httpx import AsyncClient
+
+from backend.database import get_session
+from backend.models.book import Language
+from backend.tests.helpers import admin_headers, seed_books
+
+# Far-apart matches: one FTS5 snippet() window, two ts_headline fragments
+_LOST_MANUAL = "Intro. " + "filler " * 30 + "the <Lost> Manual begins " + "filler " * 30 + "manual ends."
+_WHALE_PAGES = ["Preface", "", "The whale surfaces", "Chapter two", "Another whale sighting"]
+
+
+@pytest.fixture(
+    params=[
+        pytest.param("app", marks=pytest.mark.sqlite),
+        pytest.param("pg_app", marks=pytest.mark.postgresql),
+    ]
+)
+def search_app(request):
+    return request.getfixturevalue(request.param)
+
+
+@pytest.fixture()
+async def search_client(search_app):
+    from httpx import ASGITransport
+
+    transport = ASGITransport(app=search_app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as test_client:
+        yield test_client
+
+
+def test_extract_snippets_marks_and_escapes_matches() -> None:
+    from backend.services.documents import extract_snippets
+
+    snippets = extract_snippets(_LOST_MANUAL, "manual", fragments=3, window=20)
+    assert len(snippets) == 2
+    assert "&lt;Lost&gt; <mark>Manual</mark> begins" in snippets[0]
+    assert snippets[0].startswith("… ") and snippets[0].endswith(" …")
+    assert snippets[1].endswith("<mark>manual</mark> ends.")
+    assert extract_snippets(_LOST_MANUAL, "manual", fragments=1, window=20) == snippets[:1]
+    assert extract_snippets(_LOST_MANUAL, "absent") == []
+
+
+def test_search_backends_are_picked_by_dialect_and_fts5_queries_are_quoted() -> None:
+    from backend.services import documents as documents_service
+
+    assert isinstance(documents_service.get_search_backend("postgresql"), documents_service.PostgresSearchBackend)
+    assert isinstance(documents_service.get_search_backend("sqlite"), documents_service.Fts5SearchBackend)
+    assert type(documents_service.get_search_backend("mysql")) is documents_service.SearchBackend
+
+    assert documents_service.fts5_query("white whale") == '"white" AND "whale"'
+    assert documents_service.fts5_query('"white whale" or shark') == '"white whale" OR "shark"'
+    assert documents_service.fts5_query("whale -shark") == '("whale") NOT "shark"'
+    assert documents_service.fts5_query('a*b:c() "') == '"a b c"'
+    assert documents_service.fts5_query("- or") is None
+
+
+def test_search_statements_use_each_dialect_index() -> None:
+    from sqlalchemy.dialects import postgresql, sqlite
+
+    from backend.services import documents as documents_service
+
+    for name, dialect in (("postgresql", postgresql.dialect()), ("sqlite", sqlite.dialect())):
+        sql = str(documents_service.search_statement(name, "whale").compile(dialect=dialect))
+        assert "max(" in sql and "GROUP BY documents.book_id" in sql
+        assert sql.endswith("ORDER BY rank DESC, documents.book_id")
+
+    sql = str(documents_service.search_statement("postgresql", "lire des livres").compile(dialect=postgresql.dialect()))
+    assert "websearch_to_tsquery('french'" in sql and "websearch_to_tsquery('english'" in sql
+    assert "ts_rank_cd(documents.search_vector" in sql
+    assert "CAST(documents.search_config AS REGCONFIG)" in sql
+    assert "ILIKE" not in sql
+
+    sql = str(documents_service.search_statement("sqlite", "whale").compile(dialect=sqlite.dialect()))
+    assert "JOIN documents_fts ON documents_fts.rowid = documents.search_rowid" in sql and "LIKE" not in sql
+
+    matching = documents_service.search_statement("postgresql", "atlas")
+    sql = str(documents_service._Explain(matching).compile(dialect=postgresql.dialect()))
+    assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT documents.book_id")
+
+
+@pytest.mark.asyncio
+async def test_document_search_matches_case_insensitively_and_follows_book_language(
+    search_app, search_client: AsyncClient
+) -> None:
+    from sqlalchemy import select
+
+    from backend.models.document import Document
+    from backend.services.documents import search_books_by_query
+
+    books = await seed_books(search_app, 3)
+    async for session in search_app.dependency_overrides[get_session]():
+        session.add_all(
+            Document(book_id=book.id, filename=f"{i}.pdf", content_text=f"chapter {i} of the manual")
+            for i, book in enumerate(books)
+        )
+        await session.commit()
+        found = await search_books_by_query(session, "MANUAL")
+        assert {book.id for book in found} == {book.id for book in books}
+
+    headers = await admin_headers(search_client, "searchadmin")
+    french = books[0] if books[0].language == Language.FR else books[1]
+    response = await search_client.put(f"/books/{french.id}", json={"language": "EN"}, headers=headers)
+    assert response.status_code == 200
+    async for session in search_app.dependency_overrides[get_session]():
+        configs = dict((await session.execute(select(Document.book_id, Document.search_config))).all())
+        assert configs[french.id] == "english"
+        found = await search_books_by_query(session, "manual")
+        assert {book.id for book in found} == {book.id for book in books}
+
+
+async def _seed_lost_manual(app) -> list:
+    from backend.models.document import Document
+
+    books = await seed_books(app, 2)
+    async for session in app.dependency_overrides[get_session]():
+        session.add(Document(book_id=books[0].id, filename="a.pdf", content_text=_LOST_MANUAL))
+        session.add(Document(book_id=books[1].id, filename="b.pdf", content_text="nothing relevant"))
+        await session.commit()
+    return books
+
+
+@pytest.mark.asyncio
+async def test_document_search_returns_snippets_for_returned_books(search_app, search_client: AsyncClient) -> None:
+    books = await _seed_lost_manual(search_app)
+
+    response = await search_client.get("/documents/search", params={"query": "manual"})
+    assert response.status_code == 200
+    hits = response.json()
+    assert [hit["id"] for hit in hits] == [str(books[0].id)]
+    # Every backend marks matches and escapes the text; how many windows it cuts differs
+    assert 1 <= len(hits[0]["snippets"]) <= 3
+    assert "<mark>Manual</mark>" in hits[0]["snippets"][0]
+    assert all("<Lost>" not in snippet for snippet in hits[0]["snippets"])
+
+    summary = await search_client.get("/documents/search", params={"query": "manual", "view": "summary", "snippets": 1})
+    hit = summary.json()[0]
+    assert len(hit["snippets"]) == 1 and "description" not in hit
+
+    bare = await search_client.get("/documents/search", params={"query": "manual", "snippets": 0})
+    assert bare.json()[0]["snippets"] == []
+
+
+@pytest.mark.sqlite
+@pytest.mark.asyncio
+async def test_fts5_snippets_are_one_window_around_the_best_matches(app, client: AsyncClient) -> None:
+    await _seed_lost_manual(app)
+
+    hits = (await client.get("/documents/search", params={"query": "manual"})).json()
+    assert len(hits[0]["snippets"]) == 1
+    assert "&lt;Lost&gt; <mark>Manual</mark> begins" in hits[0]["snippets"][0]
+
+
+@pytest.mark.postgresql
+@pytest.mark.asyncio
+async def test_ts_headline_snippets_are_one_fragment_per_match_group(pg_app, pg_client: AsyncClient) -> None:
+    await _seed_lost_manual(pg_app)
+
+    hits = (await pg_client.get("/documents/search", params={"query": "manual"})).json()
+    assert len(hits[0]["snippets"]) == 2
+    assert "<mark>Manual</mark> begins" in hits[0]["snippets"][0]
+    # Fragments stop at the last word: the final full stop is not part of it
+    assert hits[0]["snippets"][1].endswith("<mark>manual</mark> ends")
+
+
+async def _seed_atlas(app) -> list:
+    from backend.models.document import Document
+
+    books = await seed_books(app, 5)
+    async for session in app.dependency_overrides[get_session]():
+        session.add_all(
+            Document(book_id=book.id, filename=f"{i}.pdf", content_text=f"atlas volume {i}")
+            for i, book in enumerate(books)
+        )
+        await session.commit()
+    return books
+
+
+@pytest.mark.asyncio
+async def test_document_search_paginates_with_total_count(search_app, search_client: AsyncClient) -> None:
+    from backend.services import documents as documents_service
+
+    books = await _seed_atlas(search_app)
+    async for session in search_app.dependency_overrides[get_session]():
+        assert await documents_service.count_search_hits(session, "atlas", exact_limit=10) == (5, True)
+        # Beyond the limit a backend may estimate, but never below what it counted
+        total, exact = await documents_service.count_search_hits(session, "atlas", exact_limit=2)
+        assert total == 5 if exact else total >= 3
+
+    first = await search_client.get("/documents/search", params={"query": "atlas", "limit": 2, "snippets": 0})
+    assert first.status_code == 200
+    assert first.headers["X-Total-Count"] == "5"
+    assert first.headers["X-Total-Count-Exact"] == "true"
+    seen = [hit["id"] for hit in first.json()]
+    cursor = first.headers["X-Next-Cursor"]
+    while cursor:
+        page = await search_client.get("/documents/search", params={"query": "atlas", "limit": 2, "cursor": cursor})
+        assert page.status_code == 200
+        assert "X-Total-Count" not in page.headers
+        seen += [hit["id"] for hit in page.json()]
+        cursor = page.headers.get("X-Next-Cursor")
+    # Equally relevant documents: ties are broken by book id
+    assert seen == sorted(str(book.id) for book in books)
+
+    bad = await search_client.get("/documents/search", params={"query": "atlas", "cursor": "garbage"})
+    assert bad.status_code == 400
+
+
+@pytest.mark.sqlite
+@pytest.mark.asyncio
+async def test_fts5_counts_exactly_beyond_the_limit(app) -> None:
+    from backend.services import documents as documents_service
+
+    await _seed_atlas(app)
+    async for session in app.dependency_overrides[get_session]():
+        assert await documents_service.count_search_hits(session, "atlas", exact_limit=2) == (5, True)
+
+
+@pytest.mark.postgresql
+@pytest.mark.asyncio
+async def test_postgres_estimates_counts_beyond_the_limit(pg_app) -> None:
+    from backend.services import documents as documents_service
+
+    await _seed_atlas(pg_app)
+    async for session in pg_app.dependency_overrides[get_session]():
+        total, exact = await documents_service.count_search_hits(session, "atlas", exact_limit=2)
+        assert not exact and total >= 3
+
+
+@pytest.mark.asyncio
+async def test_page_index_locates_hits_and_backs_in_book_search(search_app, search_client: AsyncClient) -> None:
+    from sqlalchemy import select
+
+    from backend.models.document_page import DocumentPage
+    from backend.services import documents as documents_service
+
+    books = await seed_books(search_app, 2)
+    async for session in search_app.dependency_overrides[get_session]():
+        await documents_service.create_document(
+            session,
+            book=books[0],
+            filename="whale.pdf",
+            content_text=documents_service.join_pages(_WHALE_PAGES),
+            pages=_WHALE_PAGES,
+        )
+        stored = (await session.execute(select(DocumentPage.page_number).order_by(DocumentPage.page_number))).scalars().all()
+        assert stored == [1, 3, 4, 5]
+
+    hits = (await search_client.get("/documents/search", params={"query": "whale"})).json()
+    assert [hit["id"] for hit in hits] == [str(books[0].id)]
+    assert hits[0]["pages"] == [3, 5]
+
+    response = await search_client.get(f"/books/{books[0].id}/search", params={"q": "WHALE"})
+    assert response.status_code == 200
+    pages = response.json()
+    assert [page["page_number"] for page in pages] == [3, 5]
+    assert all(len(page["snippets"]) == 1 and "<mark>whale</mark>" in page["snippets"][0] for page in pages)
+    limited = await search_client.get(f"/books/{books[0].id}/search", params={"q": "whale", "limit": 1, "snippets": 0})
+    assert limited.json() == [{"page_number": 3, "snippets": []}]
+    assert (await search_client.get(f"/books/{books[1].id}/search", params={"q": "whale"})).json() == []
+    missing = await search_client.get("/books/00000000-0000-0000-0000-000000000000/search", params={"q": "whale"})
+    assert missing.status_code == 404
+
+    headers = await admin_headers(search_client, "pageadmin")
+    assert (await search_client.delete(f"/books/{books[0].id}", headers=headers)).status_code == 204
+    async for session in search_app.dependency_overrides[get_session]():
+        assert (await session.execute(select(DocumentPage))).first() is None
+
+
+@pytest.mark.sqlite
+@pytest.mark.asyncio
+async def test_fts5_page_snippets_keep_the_whole_short_page(app, client: AsyncClient) -> None:
+    from backend.services import documents as documents_service
+
+    books = await seed_books(app, 1)
+    async for session in app.dependency_overrides[get_session]():
+        await documents_service.create_document(
+            session, book=books[0], filename="w.pdf", content_text="", pages=_WHALE_PAGES
+        )
+
+    response = await client.get(f"/books/{books[0].id}/search", params={"q": "whale"})
+    assert response.json() == [
+        {"page_number": 3, "snippets": ["The <mark>whale</mark> surfaces"]},
+        {"page_number": 5, "snippets": ["Another <mark>whale</mark> sighting"]},
+    ]
+
+
+@pytest.mark.postgresql
+@pytest.mark.asyncio
+async def test_ts_headline_page_snippets_skip_leading_stop_words(pg_app, pg_client: AsyncClient) -> None:
+    from backend.services import documents as documents_service
+
+    books = await seed_books(pg_app, 2)
+    pages = ["Preface", "The whale surfaces & dives", "", "Another whale sighting"]
+    async for session in pg_app.dependency_overrides[get_session]():
+        # An English book: the english configuration stems WHALES and drops "The"
+        await documents_service.create_document(session, book=books[1], filename="w.pdf", content_text="", pages=pages)
+
+    response = await pg_client.get(f"/books/{books[1].id}/search", params={"q": "WHALES"})
+    assert response.json() == [
+        {"page_number": 2, "snippets": ["<mark>whale</mark> surfaces &amp; dives"]},
+        {"page_number": 4, "snippets": ["Another <mark>whale</mark> sighting"]},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_backends_share_ranking_semantics(search_app, search_client: AsyncClient) -> None:
+    from backend.models.document import Document
+    from backend.services import documents as documents_service
+
+    books = sorted(await seed_books(search_app, 3), key=lambda book: book.id)
+    async for session in search_app.dependency_overrides[get_session]():
+        session.add_all(
+            [
+                Document(book_id=books[0].id, filename="a.pdf", content_text="a whale in a long tale about the sea"),
+                Document(book_id=books[1].id, filename="b.pdf", content_text="whale, whale and one more whale"),
+                Document(book_id=books[1].id, filename="c.pdf", content_text="nothing to see"),
+                Document(book_id=books[2].id, filename="d.pdf", content_text="a whale in a long tale about the sea"),
+            ]
+        )
+        await session.commit()
+        found = await documents_service.search_books_by_query(session, "Whale")
+        # More occurrences rank first; equal documents keep book id order
+        assert [book.id for book in found] == [books[1].id, books[0].id, books[2].id]
+        excluded = await documents_service.search_books_by_query(session, "whale -sea")
+        assert [book.id for book in excluded] == [books[1].id]
+        either = await documents_service.search_books_by_query(session, "shark or sea")
+        assert [book.id for book in either] == [books[0].id, books[2].id]
+        phrase = await documents_service.search_books_by_query(session, '"more whale"')
+        assert [book.id for book in phrase] == [books[1].id]
+        assert await documents_service.search_books_by_query(session, "whale:") != []
+
+    headers = await admin_headers(search_client, "rankadmin")
+    assert (await search_client.delete(f"/books/{books[1].id}", headers=headers)).status_code == 204
+    hits = (await search_client.get("/documents/search", params={"query": "whale", "snippets": 0})).json()
+    assert [hit["id"] for hit in hits] == [str(books[0].id), str(books[2].id)]
+
+
+@pytest.mark.sqlite
+@pytest.mark.asyncio
+async def test_fts5_stems_every_document_and_follows_deletes(app, client: AsyncClient) -> None:
+    from sqlalchemy import select
+
+    from backend.models.document import Document
+    from backend.services import documents as documents_service
+
+    books = await seed_books(app, 2)
+    async for session in app.dependency_overrides[get_session]():
+        # Porter stemming applies whatever the book language (books[0] is French)
+        session.add(Document(book_id=books[0].id, filename="a.pdf", content_text="whales everywhere"))
+        session.add(Document(book_id=books[1].id, filename="b.pdf", content_text="one whale"))
+        await session.commit()
+        found = await documents_service.search_books_by_query(session, "whale")
+        assert {book.id for book in found} == {books[0].id, books[1].id}
+
+    headers = await admin_headers(client, "ftsadmin")
+    assert (await client.delete(f"/books/{books[0].id}", headers=headers)).status_code == 204
+    async for session in app.dependency_overrides[get_session]():
+        fts = documents_service.Fts5SearchBackend.documents_fts
+        indexed = set((await session.execute(select(fts.c.rowid))).scalars())
+        assert indexed == set((await session.execute(select(Document.search_rowid))).scalars())
+        assert len(indexed) == 1
+
+
+@pytest.mark.postgresql
+@pytest.mark.asyncio
+async def test_postgres_search_stems_by_book_language(pg_app, pg_client: AsyncClient) -> None:
+    from backend.services import documents as documents_service
+
+    books = await seed_books(pg_app, 4)
+    texts = [
+        "Les livres lus par les lecteurs du soir",
+        "The whales were swimming. Whales everywhere, whales again.",
+        "Rien à voir ici",
+        "A single whale appeared near the harbour, far from the others.",
+    ]
+    async for session in pg_app.dependency_overrides[get_session]():
+        for i, book in enumerate(books):
+            await documents_service.create_document(session, book=book, filename=f"{i}.pdf", content_text=texts[i])
+
+        # English stemming matches "whales" in the English books only
+        found = await documents_service.search_books_by_query(session, "whale")
+        assert [book.id for book in found] == [books[1].id, books[3].id]
+        # French stemming only applies to the French book's document
+        found = await documents_service.search_books_by_query(session, "livre")
+        assert [book.id for book in found] == [books[0].id]
+        assert await documents_service.search_books_by_query(session, "") == []
+
+    hits = (await pg_client.get("/documents/search", params={"query": "whale", "snippets": 2})).json()
+    assert "<mark>whales</mark>" in hits[0]["snippets"][0]
@@ -17,7 +17,7 @@ async def test_admin_uploads_pdf_and_content_indexed(client: AsyncClient, monkey
     monkeypatch.setenv("UPLOAD_DIR", str(tmp_path / "uploads"))
 
     extracted_text = "Ancient library scrolls"
-    monkeypatch.setattr(documents_service, "extract_pdf_text", lambda path: extracted_text)
+    monkeypatch.setattr(documents_service, "extract_pdf_pages", lambda path: [extracted_text])
 
     admin_payload = {
         "username": "doc_admin",
@@ -83,7 +83,7 @@ async def test_admin_uploads_pdf_and_content_indexed(client: AsyncClient, monkey
 @pytest.mark.asyncio
 async def test_non_admin_cannot_upload_pdf(client: AsyncClient, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     monkeypatch.setenv("UPLOAD_DIR", str(tmp_path / "uploads"))
-    monkeypatch.setattr(documents_service, "extract_pdf_text", lambda path: "Should not matter")
+    monkeypatch.setattr(documents_service, "extract_pdf_pages", lambda path: ["Should not matter"])
 
     admin_payload = {
         "username": "uploader_admin",
@@ -0,0 +1,51 @@
+"""API tests for the home page shelves snapshot."""
+
+from __future__ import annotations
+
+import pytest
+from httpx import AsyncClient
+
+from backend.database import get_session
+from backend.models.book import Book
+from backend.tests.helpers import admin_headers, seed_books
+
+
+@pytest.mark.asyncio
+async def test_home_snapshot_serves_all_shelves_until_catalog_changes(app, client: AsyncClient) -> None:
+    from sqlalchemy import select
+
+    from backend.models.comment import Comment
+    from backend.models.user import User
+
+    books = await seed_books(app, 4, category="Fiction")
+    await seed_books(app, 1, category="History")
+    await admin_headers(client, "homeadmin")
+    async for session in app.dependency_overrides[get_session]():
+        user_id = (await session.execute(select(User.id))).scalars().first()
+        session.add_all([Comment(book_id=books[2].id, user_id=user_id, content="!") for _ in range(2)])
+        session.add(Comment(book_id=books[0].id, user_id=user_id, content="!"))
+        await session.commit()
+
+    response = await client.get("/home")
+    assert response.status_code == 200
+    home = response.json()
+    assert len(home["recent"]) == 5
+    assert set(home["recent"][0]) == {"id", "title", "author", "thumbnail_path", "language", "category"}
+    assert [(s["category"], s["book_count"], len(s["books"])) for s in home["categories"]] == [
+        ("Fiction", 4, 4),
+        ("History", 1, 1),
+    ]
+    assert home["categories"][0]["books"][0]["title"] == "Book 003"
+    assert [b["id"] for b in home["popular"]] == [str(books[2].id), str(books[0].id)]
+    assert home["stats"] == {"books": 5, "categories": 2, "authors": 0}
+
+    etag = response.headers["ETag"]
+    assert (await client.get("/home", headers={"If-None-Match": etag})).status_code == 304
+
+    from backend.services import books as books_service
+
+    async for session in app.dependency_overrides[get_session]():
+        await books_service.delete_book(session, await session.get(Book, books[3].id))
+    refreshed = await client.get("/home", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.json()["stats"]["books"] == 4
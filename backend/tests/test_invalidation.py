@@ -0,0 +1,49 @@
+"""Unit tests for the cache invalidation bus."""
+
+from __future__ import annotations
+
+import pytest
+
+from backend.services import invalidation
+
+
+@pytest.fixture
+def recorded(monkeypatch):
+    """Isolate handler registrations and record dispatched topics."""
+    monkeypatch.setattr(invalidation, "_handlers", invalidation.defaultdict(list))
+    calls: list[str] = []
+    invalidation.subscribe("catalog", lambda: calls.append("catalog"))
+    invalidation.subscribe("categories", lambda: calls.append("categories"))
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_local_bus_dispatches_only_the_published_topic(recorded) -> None:
+    bus = invalidation.LocalInvalidationBus()
+    await bus.publish("catalog")
+    assert recorded == ["catalog"]
+
+
+def test_postgres_bus_ignores_its_own_notifications(recorded) -> None:
+    bus = invalidation.PostgresInvalidationBus(engine=None)  # type: ignore[arg-type]
+
+    bus._on_notify(None, 1, invalidation.CHANNEL, f"catalog:{bus._origin}")
+    assert recorded == []
+
+    bus._on_notify(None, 1, invalidation.CHANNEL, "categories:other-worker")
+    assert recorded == ["categories"]
+
+
+@pytest.mark.asyncio
+async def test_start_uses_local_bus_for_sqlite(recorded) -> None:
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        await invalidation.start(engine)
+        assert type(invalidation.get_bus()) is invalidation.LocalInvalidationBus
+        await invalidation.publish("catalog")
+        assert recorded == ["catalog"]
+    finally:
+        await invalidation.stop()
+        await engine.dispose()
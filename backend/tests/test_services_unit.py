@@ -14,6 +14,7 @@ from backend.models.base import Base
 from backend.models.user import User, UserRole
 from backend.models.book import Book
 from backend.services import auth, user_service, books, documents
+from backend.services.cache import TTLCache
 
 
 @pytest.fixture
@@ -361,3 +362,29 @@ class TestDocumentsService:
             test_db_session, "nonexistent_term"
         )
         assert result == []
+
+
+class TestTTLCache:
+    """Tests for the in-process TTL + LRU cache."""
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "b" is now least recently used
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_entries_expire_after_ttl(self):
+        now = [100.0]
+        cache = TTLCache(maxsize=10, ttl=5, clock=lambda: now[0])
+        cache.set("key", "value")
+        now[0] += 4
+        assert cache.get("key") == "value"
+        now[0] += 2
+        assert cache.get("key") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert len(cache) == 0
@@ -0,0 +1,63 @@
+"""API tests for the book tag index and tag cloud."""
+
+from __future__ import annotations
+
+import pytest
+from httpx import AsyncClient
+
+from backend.database import get_session
+from backend.tests.helpers import admin_headers
+
+
+@pytest.mark.asyncio
+async def test_tag_index_backs_tag_filter_and_tag_cloud(app, client: AsyncClient) -> None:
+    import json
+
+    from sqlalchemy import func, select
+
+    from backend.models.book_tag import BookTag
+    from backend.models.tag import Tag
+
+    headers = await admin_headers(client, "tagadmin")
+    rows = [
+        {"title": "A", "author": "X", "category": "Fiction", "language": "EN", "pdf_url": "https://x/a", "tags": ["sf", "classic"]},
+        {"title": "B", "author": "X", "category": "Fiction", "language": "EN", "pdf_url": "https://x/b", "tags": ["sf"]},
+        {"title": "C", "author": "X", "category": "Fiction", "language": "EN", "pdf_url": "https://x/c", "tags": ["poetry"]},
+    ]
+    body = "\n".join(json.dumps(row) for row in rows)
+    assert (await client.post("/books/import", content=body, headers=headers)).json()["imported"] == 3
+
+    tagged = (await client.get("/books/", params=[("tag", "sf"), ("sort", "title")])).json()
+    assert [b["title"] for b in tagged] == ["A", "B"]
+    assert tagged[0]["tags"] == ["sf", "classic"]
+
+    cloud = (await client.get("/tags/")).json()
+    assert cloud[0] == {"name": "sf", "usage_count": 2}
+    assert {t["name"] for t in cloud} == {"sf", "classic", "poetry"}
+    assert (await client.get("/tags/", params={"prefix": "po"})).json() == [{"name": "poetry", "usage_count": 1}]
+
+    retagged = await client.patch("/books/bulk", json={"tag": ["sf"], "changes": {"tags": ["space"]}}, headers=headers)
+    assert retagged.json() == {"matched": 2}
+    cloud = {t["name"]: t["usage_count"] for t in (await client.get("/tags/")).json()}
+    assert cloud == {"space": 2, "poetry": 1}
+
+    assert (await client.post("/books/bulk-delete", json={"tag": ["space"]}, headers=headers)).json() == {"matched": 2}
+    assert (await client.get("/tags/")).json() == [{"name": "poetry", "usage_count": 1}]
+
+    # Single-book writes keep the precomputed counts in step with book_tags
+    (poetry,) = (await client.get("/books/", params={"tag": "poetry"})).json()
+    assert (await client.put(f"/books/{poetry['id']}", json={"tags": ["poetry", "verse"]}, headers=headers)).status_code == 200
+    assert {t["name"]: t["usage_count"] for t in (await client.get("/tags/")).json()} == {"poetry": 1, "verse": 1}
+    async for session in app.dependency_overrides[get_session]():
+        stored = dict((await session.execute(select(Tag.name, Tag.usage_count))).all())
+        counted = dict((await session.execute(select(BookTag.tag, func.count()).group_by(BookTag.tag))).all())
+        assert stored == counted
+    assert (await client.delete(f"/books/{poetry['id']}", headers=headers)).status_code == 204
+    assert (await client.get("/tags/")).json() == []
+
+    # Tags longer than book_tags.tag are rejected by validation, not by the database
+    long_tag = ["t" * 129]
+    oversized = await client.patch("/books/bulk", json={"tag": ["verse"], "changes": {"tags": long_tag}}, headers=headers)
+    assert oversized.status_code == 422
+    report = (await client.post("/books/import", content=json.dumps({**rows[0], "tags": long_tag}), headers=headers)).json()
+    assert report["imported"] == 0 and report["errors"][0]["error"].startswith("tags.0:")
@@ -23,6 +23,11 @@ function buildHeaders(options?: RequestInit): HeadersInit {
 }
 
 export async function apiFetch<T = unknown>(endpoint: string, options: RequestInit = {}): Promise<T> {
+  return (await apiFetchWithHeaders<T>(endpoint, options)).data;
+}
+
+// Same as apiFetch, also returning the response headers (pagination cursors, ETags)
+export async function apiFetchWithHeaders<T = unknown>(endpoint: string, options: RequestInit = {}): Promise<{ data: T; headers: Headers }> {
   const res = await fetch(`${API_URL}${endpoint}`, {
     ...options,
     headers: buildHeaders(options),
@@ -34,11 +39,11 @@ export async function apiFetch<T = unknown>(endpoint: string, options: RequestIn
     throw new Error(`API error: ${res.status} - ${errorText}`);
   }
   // Try to parse JSON; return void for 204
-  if (res.status === 204) return undefined as unknown as T;
+  if (res.status === 204) return { data: undefined as unknown as T, headers: res.headers };
   const contentType = res.headers.get('content-type') || '';
-  if (contentType.includes('application/json')) return (await res.json()) as T;
+  if (contentType.includes('application/json')) return { data: (await res.json()) as T, headers: res.headers };
   // Fallback to text when not JSON
-  return (await res.text()) as unknown as T;
+  return { data: (await res.text()) as unknown as T, headers: res.headers };
 }
 
 // File uploads with optional progress using XHR (fetch lacks upload progress)
@@ -1,4 +1,4 @@
-import { apiFetch, apiUpload } from '@/lib/api';
+import { apiFetch, apiFetchWithHeaders, apiUpload } from '@/lib/api';
 
 export type Language = 'FR' | 'EN';
 
@@ -35,13 +35,25 @@ export interface DocumentStreamTokenResponse {
   ttl_seconds: number;
 }
 
+// Largest page served by GET /books/ (BOOKS_MAX_PAGE_SIZE on the server)
+const BOOKS_PAGE_LIMIT = 200;
+
+// Returns every matching book: the listing is paginated, so follow X-Next-Cursor until the last page
 export const getBooks = async (params?: { category?: string; author?: string; language?: Language }) => {
   const qs = new URLSearchParams();
   if (params?.category) qs.set('category', params.category);
   if (params?.author) qs.set('author', params.author);
   if (params?.language) qs.set('language', params.language);
-  const query = qs.toString();
-  return await apiFetch<BookRead[]>(`/books/${query ? `?${query}` : ''}`);
+  qs.set('limit', String(BOOKS_PAGE_LIMIT));
+  const books: BookRead[] = [];
+  let cursor: string | null = null;
+  do {
+    if (cursor) qs.set('cursor', cursor);
+    const { data, headers } = await apiFetchWithHeaders<BookRead[]>(`/books/?${qs.toString()}`);
+    books.push(...data);
+    cursor = headers.get('X-Next-Cursor');
+  } while (cursor);
+  return books;
 };
 
 export const getBook = async (id: string) => {